@@ -0,0 +1,152 @@
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+
+# Priority classes, most urgent first
+INTERACTIVE = 0  # Describe, Logs, Exec and other clicks on the GUI thread
+VISIBLE = 1      # refreshing what a tab is showing
+BACKGROUND = 2   # informers and other prefetching
+PRIORITY_NAMES = {INTERACTIVE: "interactive", VISIBLE: "visible", BACKGROUND: "background"}
+
+# Per-cluster request budget: sustained requests per second and how many
+# may go out back to back after a quiet period
+DEFAULT_QPS = 20
+DEFAULT_BURST = 40
+# How often a queued request looks at its cancellation check
+CANCEL_POLL_SECONDS = 0.1
+
+
+class RequestCancelled(Exception):
+    pass
+
+
+class RequestBudget:
+    """Token bucket for one cluster that hands out tokens by priority.
+
+    Queued requests are served strictly by (priority, arrival), so an
+    interactive call waits at most for the next token rather than behind
+    every queued namespace LIST. A queued request whose check raises leaves
+    the queue without spending a token.
+    """
+
+    def __init__(self, qps=DEFAULT_QPS, burst=DEFAULT_BURST):
+        self.qps = qps
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.waiters = []
+        self.sequence = itertools.count()
+        self.condition = threading.Condition()
+        self.granted = dict.fromkeys(PRIORITY_NAMES, 0)
+        self.wait_seconds = dict.fromkeys(PRIORITY_NAMES, 0.0)
+        self.cancelled = 0
+
+    def refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.qps)
+        self.updated = now
+
+    def acquire(self, priority, check=None):
+        start = time.monotonic()
+        with self.condition:
+            entry = (priority, next(self.sequence))
+            heapq.heappush(self.waiters, entry)
+            try:
+                while True:
+                    self.refill(time.monotonic())
+                    if self.waiters[0] == entry and self.tokens >= 1:
+                        heapq.heappop(self.waiters)
+                        self.tokens -= 1
+                        self.granted[priority] += 1
+                        self.wait_seconds[priority] += time.monotonic() - start
+                        return
+                    if check:
+                        try:
+                            check()
+                        except Exception:
+                            self.cancelled += 1
+                            raise
+                    timeout = CANCEL_POLL_SECONDS
+                    if self.waiters[0] == entry:
+                        timeout = min(timeout, (1 - self.tokens) / self.qps)
+                    self.condition.wait(max(timeout, 0.001))
+            finally:
+                if entry in self.waiters:
+                    self.waiters.remove(entry)
+                    heapq.heapify(self.waiters)
+                # Let the next in line re-check whether it is at the head now
+                self.condition.notify_all()
+
+    def stats(self):
+        with self.condition:
+            self.refill(time.monotonic())
+            return {
+                'tokens': self.tokens,
+                'queued': len(self.waiters),
+                'granted': {PRIORITY_NAMES[p]: count for p, count in self.granted.items()},
+                'wait_seconds': {PRIORITY_NAMES[p]: seconds for p, seconds in self.wait_seconds.items()},
+                'cancelled': self.cancelled,
+            }
+
+
+_budgets = {}
+_budgets_lock = threading.Lock()
+_scope = threading.local()
+
+
+def budget_for(context):
+    with _budgets_lock:
+        budget = _budgets.get(context)
+        if budget is None:
+            budget = _budgets[context] = RequestBudget()
+        return budget
+
+
+@contextmanager
+def request_scope(priority, check=None):
+    """Run API calls made by this thread at `priority`.
+
+    `check` is called while a request is queued and may raise to abandon it,
+    e.g. FetchContext.check once the user has moved on. Thread pools don't
+    inherit the scope, so enter it inside the pooled function.
+    """
+    previous = getattr(_scope, 'value', None)
+    _scope.value = (priority, check)
+    try:
+        yield
+    finally:
+        _scope.value = previous
+
+
+def current_scope():
+    value = getattr(_scope, 'value', None)
+    on_gui_thread = threading.current_thread() is threading.main_thread()
+    if value is not None:
+        # The GUI thread never waits behind background work, whatever its scope
+        if on_gui_thread and value[0] > VISIBLE:
+            return VISIBLE, value[1]
+        return value
+    # Unscoped calls from the GUI thread are user actions
+    if on_gui_thread:
+        return INTERACTIVE, None
+    return VISIBLE, None
+
+
+def install(api_client, context):
+    """Make every request sent through `api_client` wait for `context`'s budget."""
+    budget = budget_for(context)
+    request = api_client.rest_client.request
+
+    def scheduled_request(method, url, *args, **kwargs):
+        priority, check = current_scope()
+        budget.acquire(priority, check)
+        return request(method, url, *args, **kwargs)
+
+    api_client.rest_client.request = scheduled_request
+
+
+def stats():
+    with _budgets_lock:
+        budgets = dict(_budgets)
+    return {context: budget.stats() for context, budget in budgets.items()}
@@ -0,0 +1,324 @@
+import json
+import math
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque, namedtuple
+from contextlib import contextmanager
+from urllib.parse import parse_qs, urlsplit
+
+from kubernetes.client.rest import ApiException
+
+from api_scheduler import PRIORITY_NAMES, current_scope
+
+# Set KUBENEXUS_API_TRACING=0 to leave the clients unwrapped
+TRACING_ENV = "KUBENEXUS_API_TRACING"
+ENABLED = os.environ.get(TRACING_ENV, "1") != "0"
+# Calls kept in memory; older ones are dropped first
+DEFAULT_CAPACITY = 10000
+PERCENTILES = (50, 90, 99)
+
+Call = namedtuple("Call", ["started", "service", "target", "method", "endpoint", "status", "latency_ms", "bytes",
+                           "tab", "action", "priority", "error", "detail"])
+
+# The tab a call is charged to when nothing set an origin, by the top-level
+# module of the first frame on the stack that belongs to one
+TAB_MODULES = {
+    "view_tab": "Resources",
+    "helper_view_tab": "Resources",
+    "resource_updaters": "Resources",
+    "multi_cluster": "Resources",
+    "pod_metrics_worker": "Resources",
+    "node_metrics_tab": "Nodes",
+    "pod_metrics_tab": "Pods",
+    "custom_resources_tab": "CRs",
+    "helper_custom_resources_tab": "CRs",
+    "network_graph_tab": "Network",
+    "helper_network_graph_tab": "Network",
+    "github_insights_tab": "Github",
+    "helper_github_insights_tab": "Github",
+    "jira_insights_tab": "JIRA",
+    "helper_jira_insights_tab": "JIRA",
+    "jenkins_tab": "Jenkins",
+    "system_tab": "System",
+    "helper_system_tab": "System",
+    "kubernetes_gui": "Main window",
+    "informer_cache": "Informers",
+    "watch_manager": "Informers",
+    "prometheus_discovery": "Prometheus discovery",
+}
+UNKNOWN_TAB = "Other"
+
+PROMETHEUS_PATHS = ("/api/v1/query", "/api/v1/series", "/api/v1/label", "/api/v1/metadata", "/-/")
+
+# How many leading segments of a Kubernetes path name the API: /api/v1, /apis/group/version
+_API_PREFIX_LENGTH = {"api": 2, "apis": 3}
+_ID = re.compile(r'^(?:\d+|(?=[a-f]*\d)[0-9a-f]{7,40}|[A-Z][A-Z0-9_]+-\d+)$')
+# Path segments whose next segment(s) name an object rather than an endpoint
+_NAMED_AFTER = {"repos": 2, "users": 1, "orgs": 1, "branches": 1, "trees": 1, "compare": 1,
+                "job": 1, "project": 1}
+
+
+def kubernetes_endpoint(path, query_params=None):
+    """The request path with namespace and object names replaced by placeholders."""
+    segments = path.strip("/").split("/")
+    prefix_length = _API_PREFIX_LENGTH.get(segments[0])
+    if prefix_length and len(segments) > prefix_length:
+        rest = segments[prefix_length:]
+        resource = 0
+        if rest[0] == "namespaces" and len(rest) > 2:
+            rest[1] = "{namespace}"
+            resource = 2
+        if len(rest) > resource + 1:
+            rest[resource + 1] = "{name}"
+        path = "/" + "/".join(segments[:prefix_length] + rest)
+    for name, value in query_params or ():
+        if name in ("watch", "follow") and str(value).lower() in ("true", "1"):
+            return f"{path}?{name}"
+    return path
+
+
+def http_endpoint(path):
+    """The path of a GitHub, JIRA, Jenkins or Prometheus call with ids replaced by {id}."""
+    segments = path.split("/")
+    endpoint = []
+    named = 0
+    for segment in segments:
+        if named:
+            endpoint.append("{name}")
+            named -= 1
+        elif segment == "contents" and endpoint:
+            endpoint.append("contents/{path}")
+            break
+        elif _ID.match(segment) and endpoint[-1:] != ["api"]:
+            endpoint.append("{id}")
+        else:
+            endpoint.append(segment)
+            named = _NAMED_AFTER.get(segment, 0)
+    return "/".join(endpoint)
+
+
+def percentile(ordered, p):
+    # Nearest rank, so the value is always one that was measured
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+class ApiTracer:
+    """Ring buffer of the last `capacity` API calls with per-endpoint summaries."""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.calls_buffer = deque(maxlen=capacity)
+        self.recorded = 0
+        self.lock = threading.Lock()
+
+    @property
+    def capacity(self):
+        return self.calls_buffer.maxlen
+
+    @property
+    def dropped(self):
+        return self.recorded - len(self.calls_buffer)
+
+    def record(self, call):
+        with self.lock:
+            self.calls_buffer.append(call)
+            self.recorded += 1
+
+    def calls(self, since=None):
+        with self.lock:
+            calls = list(self.calls_buffer)
+        return calls if since is None else [call for call in calls if call.started >= since]
+
+    def clear(self):
+        with self.lock:
+            self.calls_buffer.clear()
+            self.recorded = 0
+
+    def summary(self, group_by=("tab", "action", "service", "target", "method", "endpoint"), calls=None):
+        """Count, errors, latency percentiles and bytes per distinct `group_by`, busiest first."""
+        groups = {}
+        for call in self.calls() if calls is None else calls:
+            groups.setdefault(tuple(getattr(call, field) for field in group_by), []).append(call)
+        rows = []
+        for key, group in groups.items():
+            latencies = sorted(call.latency_ms for call in group)
+            row = dict(zip(group_by, key))
+            row.update({
+                'calls': len(group),
+                'errors': sum(1 for call in group if call.error or (call.status or 0) >= 400),
+                **{f'p{p}_ms': percentile(latencies, p) for p in PERCENTILES},
+                'max_ms': latencies[-1],
+                'total_ms': sum(latencies),
+                'bytes': sum(call.bytes or 0 for call in group),
+            })
+            rows.append(row)
+        rows.sort(key=lambda row: row['total_ms'], reverse=True)
+        return rows
+
+    def export(self, path, extra=None):
+        calls = self.calls()
+        with self.lock:
+            recorded = self.recorded
+        document = {
+            'exported_at': time.time(),
+            'capacity': self.capacity,
+            'recorded': recorded,
+            'dropped': recorded - len(calls),
+            'summary': self.summary(calls=calls),
+            'calls': [call._asdict() for call in calls],
+        }
+        if extra:
+            document.update(extra)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(document, f, indent=1, default=str)
+        os.replace(tmp_path, path)
+        return len(calls)
+
+
+tracer = ApiTracer()
+_origin = threading.local()
+
+
+@contextmanager
+def origin(tab, action=None):
+    """Charge API calls made by this thread to `tab` and `action`.
+
+    Without one, calls are charged to the tab whose module is on the stack,
+    which is lost when the work hops to a thread pool; capture
+    current_origin() before submitting and enter it in the pooled function.
+    """
+    previous = getattr(_origin, 'value', None)
+    _origin.value = (tab, action)
+    try:
+        yield
+    finally:
+        _origin.value = previous
+
+
+def current_origin():
+    value = getattr(_origin, 'value', None)
+    if value is not None:
+        return value
+    return infer_origin(sys._getframe(1))
+
+
+def infer_origin(frame):
+    # The tab of the innermost tab frame, and as the action the outermost
+    # named function of that tab, e.g. the worker's run or the clicked slot
+    tab = action = None
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '').split('.')[0]
+        frame_tab = TAB_MODULES.get(module)
+        if frame_tab and tab in (None, frame_tab):
+            tab = frame_tab
+            name = getattr(frame.f_code, 'co_qualname', frame.f_code.co_name)
+            if '<' not in name:
+                action = name
+        elif tab is not None and frame_tab:
+            break
+        frame = frame.f_back
+    return tab or UNKNOWN_TAB, action
+
+
+def install(api_client, context):
+    """Record every request sent through `api_client`, charged to the calling tab."""
+    if not ENABLED:
+        return
+    request = api_client.rest_client.request
+
+    def traced_request(method, url, query_params=None, headers=None, body=None, post_params=None,
+                       _preload_content=True, _request_timeout=None):
+        tab, action = current_origin()
+        priority = PRIORITY_NAMES.get(current_scope()[0])
+        started = time.time()
+        start = time.perf_counter()
+        status = size = error = None
+        try:
+            response = request(method, url, query_params, headers, body, post_params,
+                               _preload_content, _request_timeout)
+            status = response.status
+            if _preload_content:
+                size = len(response.data)
+            else:
+                length = response.headers.get('Content-Length')
+                size = int(length) if length else None
+            return response
+        except ApiException as e:
+            status, error = e.status, e.reason
+            size = len(e.body) if e.body else None
+            raise
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            tracer.record(Call(started, "kubernetes", context, method,
+                               kubernetes_endpoint(urlsplit(url).path, query_params), status,
+                               (time.perf_counter() - start) * 1000, size, tab, action, priority, error, None))
+
+    api_client.rest_client.request = traced_request
+
+
+_requests_installed = False
+_requests_lock = threading.Lock()
+
+
+def install_requests():
+    """Record every call made with `requests`: Prometheus and the GitHub, JIRA and Jenkins tabs.
+
+    Patches Session.send, which the module-level helpers, the query
+    executor's session and PrometheusConnect all go through.
+    """
+    global _requests_installed
+    import requests
+
+    with _requests_lock:
+        if _requests_installed or not ENABLED:
+            return
+        _requests_installed = True
+    send = requests.Session.send
+
+    def traced_send(session, request, **kwargs):
+        tab, action = current_origin()
+        parts = urlsplit(request.url)
+        prometheus = parts.path.startswith(PROMETHEUS_PATHS)
+        started = time.time()
+        start = time.perf_counter()
+        status = size = error = None
+        try:
+            response = send(session, request, **kwargs)
+            status = response.status_code
+            if kwargs.get('stream'):
+                length = response.headers.get('Content-Length')
+                size = int(length) if length else None
+            else:
+                size = len(response.content)
+            return response
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            detail = query_detail(parts.query, request.body) if prometheus else None
+            tracer.record(Call(started, "prometheus" if prometheus else "http", parts.netloc, request.method,
+                               http_endpoint(parts.path), status, (time.perf_counter() - start) * 1000, size,
+                               tab, action, None, error, detail))
+
+    requests.Session.send = traced_send
+
+
+def query_detail(query_string, body):
+    params = parse_qs(query_string)
+    if 'query' not in params and body:
+        params = parse_qs(body.decode() if isinstance(body, bytes) else str(body))
+    values = params.get('query') or params.get('match[]')
+    return values[0] if values else None
+
+
+def summary(group_by=("tab", "action", "service", "target", "method", "endpoint")):
+    return tracer.summary(group_by)
+
+
+def export_json(path, extra=None):
+    return tracer.export(path, extra)
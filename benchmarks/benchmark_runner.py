@@ -0,0 +1,482 @@
+"""End-to-end benchmarks for the Resources, Nodes, Pods, Network and CR hot paths.
+
+Every scale gets its own fake API server (fake_apiserver.py) holding that
+many pods and as many custom resources. Each case then runs in a fresh
+subprocess under QT_QPA_PLATFORM=offscreen, so the peak RSS it reports
+belongs to that case alone. The case drives the same worker and GUI slot
+the tab does and reports, as the median over --repeat runs:
+
+    latency_ms        from starting the worker to the last row or graph
+                      being handed to the GUI thread
+    gui_blocked_ms    total time the GUI event loop could not run, measured
+                      as lateness of a 5ms heartbeat timer
+    gui_max_stall_ms  the longest of those stalls
+    peak_rss_mb       high-water mark of the case process
+    api_requests      requests the fake API server received per run,
+                      including the case's one-off setup
+
+The metrics cases query a fake Prometheus (fake_prometheus.py) serving
+series for the same cluster, or the one at --prometheus-url. Graph cases
+need pyvis installed.
+
+Usage:
+    python benchmarks/benchmark_runner.py --output results.json
+    python benchmarks/benchmark_runner.py --scales 1000 --cases resources: crs:
+    python benchmarks/benchmark_runner.py --output new.json --compare results.json
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARKS_DIR))
+sys.path.insert(0, BENCHMARKS_DIR)
+
+RESULTS_VERSION = 1
+DEFAULT_SCALES = [1000, 10000, 50000]
+DEFAULT_REPEAT = 3
+CASE_TIMEOUT_SECONDS = 600
+PROBE_INTERVAL_MS = 5
+# Same names and order as the Resources tab's kind selector
+RESOURCE_TYPES = ["Pods", "Deployments", "StatefulSets", "Jobs", "CronJobs", "PVC", "PV", "Secrets", "ConfigMaps",
+                  "Services", "Nodes"]
+GRAPH_TYPES = ["Namespace Overview", "Network Policies", "Node-to-Pod Mapping", "Cluster Level Network Graph",
+               "PVC and StorageClass", "RBAC Visualization"]
+CASES = ([f"resources:{kind}" for kind in RESOURCE_TYPES]
+         + ["metrics:NodeTableWorker", "metrics:NodeDetailsFetcher", "metrics:PodMetricsWorker",
+            "metrics:ClusterMetricsWorker"]
+         + [f"graph:{graph_type}" for graph_type in GRAPH_TYPES]
+         + ["crs:table"])
+
+
+def cluster_shape(scale):
+    """Nodes and namespaces for a cluster with `scale` pods.
+
+    Always more namespaces than resource_updaters.ALL_NAMESPACES_THRESHOLD,
+    so "all namespaces selected" goes through one cluster-wide LIST.
+    """
+    return {"nodes": max(10, scale // 50), "namespaces": max(20, scale // 250), "pods": scale, "widgets": scale}
+
+
+def peak_rss_mb():
+    # ru_maxrss on Linux carries over the parent's high-water mark through
+    # fork and exec, which is the whole cluster here; VmHWM starts afresh
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+# --- Case process -----------------------------------------------------------
+
+class CaseEnvironment:
+    """What the cases share: the app, the fake cluster's clients and namespaces."""
+
+    def __init__(self, prometheus_url):
+        from types import SimpleNamespace
+        from PyQt5.QtWidgets import QApplication
+        from client_registry import registry
+        from multi_cluster import ClusterClients
+
+        self.app = QApplication.instance() or QApplication([])
+        registry.use("fake")
+        # The Resources tab stand-in; Services rows ask it for forwarding state
+        self.clients = ClusterClients("fake")
+        self.clients.get_port_forwarding_status = lambda namespace, name: "Not forwarded"
+        self.namespaces = sorted(ns.metadata.name for ns in self.clients.v1.list_namespace().items)
+        self.node = self.clients.v1.list_node(limit=1).items[0].metadata.name
+        # The executor only reads the PrometheusConnect's url, headers and TLS settings
+        self.prom = SimpleNamespace(url=prometheus_url)
+        self.probe = GuiThreadProbe()
+
+
+class GuiThreadProbe:
+    """Heartbeat timer on the GUI thread; any lateness is time the event loop was blocked."""
+
+    def __init__(self, interval_ms=PROBE_INTERVAL_MS):
+        from PyQt5.QtCore import Qt, QTimer
+
+        self.interval = interval_ms / 1000
+        self.timer = QTimer()
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.beat)
+
+    def start(self):
+        self.blocked = 0
+        self.max_stall = 0
+        self.last = time.perf_counter()
+        self.timer.start()
+
+    def beat(self):
+        now = time.perf_counter()
+        late = now - self.last - self.interval
+        if late > 0:
+            self.blocked += late
+            self.max_stall = max(self.max_stall, late)
+        self.last = now
+
+    def stop(self):
+        self.beat()
+        self.timer.stop()
+
+
+class CaseRun:
+    """One timed run: start() kicks off the work and a GUI-thread slot calls done()."""
+
+    def __init__(self, env):
+        from PyQt5.QtCore import QEventLoop
+
+        self.env = env
+        self.loop = QEventLoop()
+        self.ended = None
+        self.objects = 0
+        self.error = None
+
+    def done(self, objects=0, error=None):
+        if self.ended is None:
+            self.ended = time.perf_counter()
+            self.objects = objects
+            self.error = error
+            self.loop.quit()
+
+    def finished_without_result(self):
+        self.done(error="worker finished without emitting a result")
+
+    def measure(self, start, timeout=CASE_TIMEOUT_SECONDS):
+        from PyQt5.QtCore import QTimer
+
+        probe = self.env.probe
+        deadline = QTimer()
+        deadline.setSingleShot(True)
+        deadline.timeout.connect(lambda: self.done(error=f"timed out after {timeout}s"))
+        deadline.start(timeout * 1000)
+        probe.start()
+        started = time.perf_counter()
+        start()
+        self.loop.exec_()
+        probe.stop()
+        deadline.stop()
+        if self.error:
+            raise RuntimeError(self.error)
+        return {
+            "latency_ms": (self.ended - started) * 1000,
+            "gui_blocked_ms": probe.blocked * 1000,
+            "gui_max_stall_ms": probe.max_stall * 1000,
+            "objects": self.objects,
+        }
+
+
+def run_resources(env, resource_type):
+    # ResourceFetchWorker into a ResourceTableModel on a visible view, wired
+    # the way ViewTab.update_resources wires it
+    from PyQt5.QtWidgets import QTableView
+    from helper_view_tab.resource_fetch_worker import ResourceFetchWorker
+    from helper_view_tab.resource_table_model import ResourceTableModel
+    from resource_updaters import FetchContext
+
+    run = CaseRun(env)
+    model = ResourceTableModel()
+    view = QTableView()
+    view.setModel(model)
+    view.resize(1200, 800)
+    view.show()
+
+    def on_page(generation, kind, headers, rows, loaded):
+        model.set_headers(headers)
+        model.merge_rows(rows)
+
+    def on_fetched(generation, kind, headers, rows):
+        model.set_headers(headers)
+        model.update_rows(rows)
+        run.done(len(rows))
+
+    worker = ResourceFetchWorker(env.clients, 1, resource_type, env.namespaces, FetchContext())
+    worker.page_fetched.connect(on_page)
+    worker.fetched.connect(on_fetched)
+    worker.failed.connect(lambda generation, message: run.done(error=message))
+    worker.finished.connect(run.finished_without_result)
+    try:
+        return run.measure(worker.start)
+    finally:
+        worker.wait()
+        view.close()
+
+
+def run_metrics(env, worker_name):
+    from PyQt5.QtCore import QTimer
+    # Each run should reach Prometheus rather than the previous run's cache
+    from prometheus_executor import get_executor
+    get_executor().cache.clear()
+
+    run = CaseRun(env)
+    if worker_name == "NodeTableWorker":
+        from node_metrics_tab import NodeTableWorker
+        worker = NodeTableWorker(env.clients.v1, env.prom)
+        worker.update_signal.connect(lambda rows: run.done(len(rows)))
+    elif worker_name == "NodeDetailsFetcher":
+        from node_metrics_tab import NodeDetailsFetcher
+        worker = NodeDetailsFetcher(env.prom, env.node)
+        worker.finished.connect(lambda result: run.done(len(result["pods"])))
+    elif worker_name == "ClusterMetricsWorker":
+        from kubernetes_gui import ClusterMetricsWorker
+        worker = ClusterMetricsWorker(env.prom)
+        worker.fetched.connect(lambda results: run.done(
+            sum(not isinstance(result, Exception) for result in results.values()),
+            next((str(result) for result in results.values() if isinstance(result, Exception)), None)))
+    else:
+        from pod_metrics_tab import PodMetricsWorker
+        worker = PodMetricsWorker(env.prom)
+        worker.update_signal.connect(lambda rows: run.done(len(rows)))
+    # NodeDetailsFetcher shadows QThread.finished with its result signal, so
+    # notice a worker that died without a result by polling instead
+    def check_finished():
+        if worker.isFinished():
+            poll.stop()
+            QTimer.singleShot(0, run.finished_without_result)
+
+    poll = QTimer()
+    poll.timeout.connect(check_finished)
+    poll.start(10)
+    try:
+        return run.measure(worker.start)
+    finally:
+        poll.stop()
+        worker.wait()
+
+
+def run_graph(env, graph_type):
+    from helper_network_graph_tab.load_graph_thread import LoadGraphThread
+
+    run = CaseRun(env)
+    # The graph's web view is not part of this; the slot only receives the network
+    worker = LoadGraphThread(env.namespaces[0], graph_type)
+    worker.graph_loaded.connect(lambda network, k8s_objects: run.done(len(network.nodes)))
+    worker.error_occurred.connect(lambda message: run.done(error=message))
+    worker.finished.connect(run.finished_without_result)
+    try:
+        return run.measure(worker.start)
+    finally:
+        worker.wait()
+
+
+def run_custom_resources(env):
+    # CustomResourcesTab.load_resource_details for the synthetic Widget CRD,
+    # until update_table has filled its last chunk and re-enabled sorting
+    from PyQt5.QtCore import QTimer
+    from kubernetes import client
+    from client_registry import api as registry_api
+    from custom_resources_tab import CustomResourcesTab
+
+    crd = registry_api(client.ApiextensionsV1Api).read_custom_resource_definition("widgets.example.com")
+    tab = CustomResourcesTab()
+    tab.resize(1200, 800)
+    tab.show()
+    run = CaseRun(env)
+    expected = []
+
+    def check_filled():
+        table = tab.table
+        if expected and table.isSortingEnabled() and table.item(expected[0] - 1, 0) is not None:
+            run.done(expected[0])
+
+    poll = QTimer()
+    poll.timeout.connect(check_filled)
+    tab.table_update_signal.connect(lambda items: expected.append(len(items)))
+
+    def start():
+        tab.load_resource_details(crd)
+        poll.start(1)
+
+    try:
+        return run.measure(start)
+    finally:
+        poll.stop()
+        tab.close()
+
+
+def run_case(case, env):
+    group, _, name = case.partition(":")
+    if group == "resources":
+        return run_resources(env, name)
+    if group == "metrics":
+        return run_metrics(env, name)
+    if group == "graph":
+        return run_graph(env, name)
+    if group == "crs":
+        return run_custom_resources(env)
+    raise ValueError(f"unknown case {case}")
+
+
+def case_main(args):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    result = {}
+    try:
+        env = CaseEnvironment(args.prometheus_url)
+        result["baseline_rss_mb"] = peak_rss_mb()
+        runs = [run_case(args.run_case, env) for _ in range(args.repeat)]
+        for metric in ("latency_ms", "gui_blocked_ms", "gui_max_stall_ms"):
+            result[metric] = statistics.median(run[metric] for run in runs)
+        result["latency_samples_ms"] = [run["latency_ms"] for run in runs]
+        result["objects"] = runs[-1]["objects"]
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        traceback.print_exc()
+    result["peak_rss_mb"] = peak_rss_mb()
+    with open(args.result_file, "w") as f:
+        json.dump(result, f)
+    # Skip interpreter teardown: a timed-out worker may still be running
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(0)
+
+
+# --- Runner -----------------------------------------------------------------
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], cwd=BENCHMARKS_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def spawn_case(case, scale, server, prometheus, kubeconfig, args):
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+        result_file = f.name
+    command = [sys.executable, os.path.abspath(__file__), "--run-case", case, "--repeat", str(args.repeat),
+               "--result-file", result_file, "--prometheus-url", args.prometheus_url or prometheus.url]
+    env = dict(os.environ, KUBECONFIG=kubeconfig, QT_QPA_PLATFORM="offscreen")
+    requests_before = server.requests
+    queries_before = prometheus.queries if prometheus else 0
+    try:
+        process = subprocess.run(command, env=env, capture_output=not args.verbose, text=True,
+                                 timeout=CASE_TIMEOUT_SECONDS * (args.repeat + 1))
+        with open(result_file) as f:
+            result = json.load(f)
+    except (subprocess.TimeoutExpired, OSError, ValueError) as e:
+        result = {"error": f"case process failed: {e}"}
+        process = None
+    finally:
+        os.unlink(result_file)
+    if process is not None and process.returncode and "error" not in result:
+        result["error"] = f"case process exited with {process.returncode}"
+    if "error" in result and process is not None and process.stderr:
+        result["stderr_tail"] = process.stderr.strip().splitlines()[-5:]
+    result["api_requests"] = (server.requests - requests_before) / args.repeat
+    if prometheus:
+        result["prometheus_queries"] = (prometheus.queries - queries_before) / args.repeat
+    return dict({"case": case, "scale": scale}, **result)
+
+
+def run_scale(scale, cases, args):
+    import fake_apiserver
+    import fake_prometheus
+
+    shape = cluster_shape(scale)
+    print(f"Generating {shape['pods']} pods on {shape['nodes']} nodes in {shape['namespaces']} namespaces...")
+    server = fake_apiserver.start_server(latency_ms=args.latency_ms, **shape)
+    # Series for exactly the cluster the API server holds, so names join up
+    prometheus = None if args.prometheus_url else fake_prometheus.start_server(
+        latency_ms=args.prometheus_latency_ms, objects=server.store.objects)
+    results = []
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            kubeconfig = os.path.join(directory, "kubeconfig")
+            server.write_kubeconfig(kubeconfig)
+            for case in cases:
+                result = spawn_case(case, scale, server, prometheus, kubeconfig, args)
+                print(format_result(result))
+                results.append(result)
+    finally:
+        for stand_in in filter(None, (server, prometheus)):
+            stand_in.shutdown()
+            stand_in.server_close()
+    return results
+
+
+def format_result(result):
+    label = f"{result['case']:38} {result['scale']:>6}"
+    if "error" in result:
+        return f"{label}  error: {result['error']}"
+    return (f"{label}  {result['latency_ms']:9.1f} ms  gui blocked {result['gui_blocked_ms']:8.1f} ms "
+            f"(max {result['gui_max_stall_ms']:7.1f})  rss {result['peak_rss_mb']:7.1f} MiB  "
+            f"{result['api_requests']:6.0f} req  {result['objects']:6} objs")
+
+
+def compare(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = {(result["case"], result["scale"]): result for result in json.load(f)["results"]}
+    print(f"\nCompared with {baseline_path} (new / old):")
+    for result in results:
+        old = baseline.get((result["case"], result["scale"]))
+        if not old or "latency_ms" not in old or "latency_ms" not in result:
+            continue
+        ratios = "  ".join(
+            f"{metric} {result[metric] / old[metric]:5.2f}x" if old[metric] else f"{metric}    n/a"
+            for metric in ("latency_ms", "gui_blocked_ms", "peak_rss_mb"))
+        print(f"{result['case']:38} {result['scale']:>6}  {ratios}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES, help="pods (and CRs) per run")
+    parser.add_argument("--cases", nargs="+", help="only cases starting with these, e.g. resources: graph:")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--latency-ms", type=float, default=0, help="delay the fake API server adds per request")
+    parser.add_argument("--prometheus-latency-ms", type=float, default=0, help="delay the fake Prometheus adds per query")
+    parser.add_argument("--prometheus-url", help="a real Prometheus for the metrics cases instead of the stand-in")
+    parser.add_argument("--output", help="write results as JSON here")
+    parser.add_argument("--compare", help="results JSON from an earlier run to compare against")
+    parser.add_argument("--verbose", action="store_true", help="show the case processes' output")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        return case_main(args)
+    if args.list:
+        print("\n".join(CASES))
+        return
+
+    cases = [case for case in CASES if not args.cases or any(case.startswith(prefix) for prefix in args.cases)]
+    started_at = time.time()
+    results = []
+    for scale in args.scales:
+        results.extend(run_scale(scale, cases, args))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "version": RESULTS_VERSION,
+                "revision": git_revision(),
+                "started_at": started_at,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "repeat": args.repeat,
+                "latency_ms": args.latency_ms,
+                "prometheus_latency_ms": args.prometheus_latency_ms,
+                "results": results,
+            }, f, indent=2)
+        print(f"Wrote {len(results)} results to {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+"""Local stand-in for kube-apiserver serving a synthetic cluster.
+
+Implements what the app uses: paginated LIST (including the metadata-only
+and Table forms), WATCH with bookmarks and optional churn, GET and pod logs
+(plain and followed), for every kind in synthetic_cluster.KINDS. Responses
+are gzipped when the client asks, and every request can be delayed.
+
+Usage:
+    python benchmarks/fake_apiserver.py --pods 10000 --latency-ms 20 --kubeconfig /tmp/fake-kubeconfig
+    KUBECONFIG=/tmp/fake-kubeconfig python main.py
+
+With --prometheus-port, fake_prometheus.py serves series for the same
+cluster; point KUBENEXUS_PROMETHEUS_URL at it.
+"""
+import argparse
+import copy
+import gzip
+import json
+import os
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fake_prometheus
+from synthetic_cluster import KINDS, generate_cluster
+
+CONTEXT_NAME = "fake"
+# The real server's default is 60s; short enough to see bookmarks quickly
+BOOKMARK_INTERVAL_SECONDS = 10
+GZIP_LEVEL = 1
+GZIP_MIN_BYTES = 128 * 1024
+
+
+def status(code, reason, message):
+    return {"kind": "Status", "apiVersion": "v1", "metadata": {}, "status": "Failure",
+            "message": message, "reason": reason, "code": code}
+
+
+class ClusterStore:
+    """Objects by (prefix, plural), with a global resourceVersion counter."""
+
+    def __init__(self, objects):
+        self.objects = objects
+        self.lock = threading.Lock()
+        self.resource_version = max(
+            (int(obj["metadata"]["resourceVersion"]) for items in objects.values() for obj in items
+             if "resourceVersion" in obj["metadata"]),
+            default=1)
+        self.by_name = {
+            (key, obj["metadata"].get("namespace"), obj["metadata"]["name"]): obj
+            for key, items in objects.items() for obj in items
+        }
+
+    def list(self, key, namespace=None):
+        items = self.objects.get(key, [])
+        if namespace is None:
+            return items
+        return [obj for obj in items if obj["metadata"].get("namespace") == namespace]
+
+    def get(self, key, namespace, name):
+        return self.by_name.get((key, namespace, name))
+
+    def touch(self, key):
+        """Bump a random object's resourceVersion, as a controller update would."""
+        with self.lock:
+            items = self.objects.get(key)
+            if not items:
+                return None
+            self.resource_version += 1
+            obj = random.choice(items)
+            obj["metadata"]["resourceVersion"] = str(self.resource_version)
+            return copy.deepcopy(obj)
+
+
+class FakeApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, store, port=0, latency_ms=0, churn_per_second=0):
+        super().__init__(("127.0.0.1", port), ApiHandler)
+        self.store = store
+        self.latency_ms = latency_ms
+        self.churn_per_second = churn_per_second
+        self.requests = 0
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}"
+
+    def write_kubeconfig(self, path):
+        with open(path, "w") as f:
+            json.dump({
+                "apiVersion": "v1", "kind": "Config", "current-context": CONTEXT_NAME,
+                "clusters": [{"name": CONTEXT_NAME, "cluster": {"server": self.url}}],
+                "users": [{"name": CONTEXT_NAME, "user": {"token": "fake"}}],
+                "contexts": [{"name": CONTEXT_NAME, "context": {"cluster": CONTEXT_NAME, "user": CONTEXT_NAME}}],
+            }, f)
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requests += 1
+        if self.server.latency_ms:
+            time.sleep(self.server.latency_ms / 1000)
+        url = urlsplit(self.path)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split("/") if part]
+        try:
+            self.route(parts, query)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def do_POST(self):
+        self.send_json(status(405, "MethodNotAllowed", "the fake API server is read-only"), 405)
+
+    do_PUT = do_PATCH = do_DELETE = do_POST
+
+    def route(self, parts, query):
+        if parts[:1] == ["api"] and len(parts) >= 2:
+            prefix, rest = "/".join(parts[:2]), parts[2:]
+        elif parts[:1] == ["apis"] and len(parts) >= 3:
+            prefix, rest = "/".join(parts[:3]), parts[3:]
+        else:
+            return self.send_json(status(404, "NotFound", f"no route for /{'/'.join(parts)}"), 404)
+
+        namespace = None
+        if len(rest) >= 3 and rest[0] == "namespaces":
+            namespace, rest = rest[1], rest[2:]
+        if len(rest) == 3 and rest[0] == "pods" and rest[2] == "log":
+            return self.pod_log(namespace, rest[1], query)
+        key = (prefix, rest[0]) if rest else None
+        if key not in KINDS:
+            return self.send_json(status(404, "NotFound", f"the server could not find the requested resource"), 404)
+        if len(rest) == 1:
+            if query.get("watch") in ("true", "True", "1"):
+                return self.watch(key, namespace, query)
+            return self.list(key, namespace, query)
+        if len(rest) == 2:
+            obj = self.server.store.get(key, namespace, rest[1])
+            if obj is None:
+                return self.send_json(status(404, "NotFound", f'{rest[0]} "{rest[1]}" not found'), 404)
+            return self.send_json(obj)
+        return self.send_json(status(404, "NotFound", "unsupported subresource"), 404)
+
+    def list(self, key, namespace, query):
+        items = self.server.store.list(key, namespace)
+        start = int(query.get("continue") or 0)
+        limit = int(query.get("limit") or 0) or len(items)
+        page = items[start:start + limit]
+        metadata = {"resourceVersion": str(self.server.store.resource_version)}
+        if start + limit < len(items):
+            metadata["continue"] = str(start + limit)
+            metadata["remainingItemCount"] = len(items) - start - limit
+
+        accept = self.headers.get("Accept", "")
+        if "as=PartialObjectMetadataList" in accept:
+            body = {"kind": "PartialObjectMetadataList", "apiVersion": "meta.k8s.io/v1", "metadata": metadata,
+                    "items": [{"kind": "PartialObjectMetadata", "apiVersion": "meta.k8s.io/v1",
+                               "metadata": obj["metadata"]} for obj in page]}
+        elif "as=Table" in accept:
+            body = {"kind": "Table", "apiVersion": "meta.k8s.io/v1", "metadata": metadata,
+                    "columnDefinitions": [{"name": "Name", "type": "string"}, {"name": "Type", "type": "string"}],
+                    "rows": [{"cells": [obj["metadata"]["name"], obj.get("type", "")],
+                              "object": {"kind": "PartialObjectMetadata", "apiVersion": "meta.k8s.io/v1",
+                                         "metadata": obj["metadata"]}} for obj in page]}
+        else:
+            body = {"kind": f"{KINDS[key]}List", "apiVersion": key[0].split("/", 1)[1], "metadata": metadata,
+                    "items": page}
+        self.send_json(body)
+
+    def watch(self, key, namespace, query):
+        timeout = float(query.get("timeoutSeconds") or 300)
+        deadline = time.monotonic() + timeout
+        next_bookmark = time.monotonic() + BOOKMARK_INTERVAL_SECONDS
+        churn = self.server.churn_per_second
+        self.start_stream("application/json")
+        while time.monotonic() < deadline:
+            time.sleep(1 / churn if churn else min(1, deadline - time.monotonic()))
+            if churn:
+                obj = self.server.store.touch(key)
+                if obj and (namespace is None or obj["metadata"].get("namespace") == namespace):
+                    self.write_chunk(json.dumps({"type": "MODIFIED", "object": obj}) + "\n")
+            if query.get("allowWatchBookmarks") in ("true", "True") and time.monotonic() >= next_bookmark:
+                next_bookmark = time.monotonic() + BOOKMARK_INTERVAL_SECONDS
+                self.write_chunk(json.dumps({"type": "BOOKMARK", "object": {
+                    "kind": KINDS[key], "apiVersion": key[0].split("/", 1)[1],
+                    "metadata": {"resourceVersion": str(self.server.store.resource_version)}}}) + "\n")
+        self.end_stream()
+
+    def pod_log(self, namespace, name, query):
+        if self.server.store.get(("api/v1", "pods"), namespace, name) is None:
+            return self.send_json(status(404, "NotFound", f'pods "{name}" not found'), 404)
+
+        def line(i):
+            stamp = f"{datetime.now(timezone.utc).isoformat()} " if query.get("timestamps") in ("true", "True") else ""
+            return f"{stamp}{name} handled request {i} in {random.randint(1, 250)}ms\n"
+
+        if query.get("follow") not in ("true", "True"):
+            lines = int(query.get("tailLines") or 200)
+            return self.send_body("".join(line(i) for i in range(lines)).encode(), "text/plain")
+        self.start_stream("text/plain")
+        for i in range(int(query.get("timeoutSeconds") or 3600)):
+            self.write_chunk(line(i))
+            time.sleep(1)
+        self.end_stream()
+
+    def send_json(self, body, code=200):
+        self.send_body(json.dumps(body).encode(), "application/json", code)
+
+    def send_body(self, data, content_type, code=200):
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        if len(data) >= GZIP_MIN_BYTES and "gzip" in self.headers.get("Accept-Encoding", ""):
+            data = gzip.compress(data, GZIP_LEVEL)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def start_stream(self, content_type):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def write_chunk(self, text):
+        data = text.encode()
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def end_stream(self):
+        self.wfile.write(b"0\r\n\r\n")
+
+
+def start_server(nodes=200, namespaces=40, pods=10000, payload_bytes=0, latency_ms=0, churn_per_second=0,
+                 port=0, seed=0, widgets=None):
+    """Generate a cluster and serve it on a background thread; returns the server."""
+    store = ClusterStore(generate_cluster(nodes, namespaces, pods, payload_bytes, seed, widgets))
+    server = FakeApiServer(store, port, latency_ms, churn_per_second)
+    threading.Thread(target=server.serve_forever, name="fake-apiserver", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=200)
+    parser.add_argument("--namespaces", type=int, default=40)
+    parser.add_argument("--pods", type=int, default=10000)
+    parser.add_argument("--payload-bytes", type=int, default=0, help="padding annotation added to every object")
+    parser.add_argument("--latency-ms", type=float, default=0, help="delay before every response")
+    parser.add_argument("--churn", type=float, default=0, help="MODIFIED events per second on each watch")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--widgets", type=int, help="custom resources to create (default: one per namespace)")
+    parser.add_argument("--prometheus-port", type=int, help="also serve Prometheus series for this cluster here")
+    parser.add_argument("--kubeconfig", help="write a kubeconfig with a '%s' context pointing here" % CONTEXT_NAME)
+    args = parser.parse_args()
+
+    server = start_server(args.nodes, args.namespaces, args.pods, args.payload_bytes, args.latency_ms, args.churn,
+                          args.port, args.seed, args.widgets)
+    if args.kubeconfig:
+        server.write_kubeconfig(args.kubeconfig)
+        print(f"Wrote kubeconfig to {args.kubeconfig}")
+    print(f"Serving {args.pods} pods on {args.nodes} nodes in {args.namespaces} namespaces at {server.url}")
+    if args.prometheus_port:
+        prometheus = fake_prometheus.start_server(latency_ms=args.latency_ms, port=args.prometheus_port,
+                                                  objects=server.store.objects)
+        print(f"Serving Prometheus at {prometheus.url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
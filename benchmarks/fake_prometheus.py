@@ -0,0 +1,476 @@
+"""Local stand-in for Prometheus serving synthetic node and pod series.
+
+Answers /api/v1/query and /api/v1/query_range (GET or form POST) for the
+series in synthetic_metrics.py, plus /-/healthy and the metric name list.
+Queries are evaluated by a small PromQL subset that covers what the tabs
+send: selectors with =, !=, =~ and !~ matchers, rate/irate/increase over a
+range, sum/avg/min/max/count with `by`, and + - * / between scalars and
+one-to-one matched vectors. Anything else is answered with bad_data, as
+Prometheus answers a query it cannot parse.
+
+Usage:
+    python benchmarks/fake_prometheus.py --pods 10000 --latency-ms 50
+    KUBENEXUS_PROMETHEUS_URL=http://127.0.0.1:9090 python main.py
+
+Give it the same --nodes/--namespaces/--pods/--seed as fake_apiserver.py
+(or use that script's --prometheus-port) so the names line up.
+"""
+import argparse
+import gzip
+import json
+import math
+import os
+import re
+import sys
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_cluster import generate_cluster
+from synthetic_metrics import SeriesStore
+
+# Prometheus refuses range queries with more points per series than this
+MAX_POINTS = 11000
+GZIP_LEVEL = 1
+GZIP_MIN_BYTES = 1024
+DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800, "y": 31536000}
+AGGREGATIONS = {"sum", "avg", "min", "max", "count"}
+RANGE_FUNCTIONS = {"rate", "irate", "increase"}
+
+TOKEN = re.compile(r"""\s*(?:
+    (?P<number>\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)(?P<unit>ms|[smhdwy](?![a-zA-Z0-9_:]))? |
+    (?P<name>[a-zA-Z_:][a-zA-Z0-9_:]*) |
+    (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*') |
+    (?P<op>=~|!~|!=|[-+*/(){}\[\],=])
+)""", re.VERBOSE)
+
+
+class QueryError(Exception):
+    pass
+
+
+def tokenize(query):
+    tokens = []
+    position = 0
+    query = query.rstrip()
+    while position < len(query):
+        match = TOKEN.match(query, position)
+        if not match or match.end() == position:
+            raise QueryError(f"unexpected character at position {position}: {query[position:position + 10]!r}")
+        position = match.end()
+        if match.group("number"):
+            tokens.append(("duration", float(match.group("number")) * DURATION_UNITS[match.group("unit")])
+                          if match.group("unit") else ("number", float(match.group("number"))))
+        elif match.group("name"):
+            tokens.append(("name", match.group("name")))
+        elif match.group("string"):
+            tokens.append(("string", re.sub(r"\\(.)", r"\1", match.group("string")[1:-1])))
+        else:
+            tokens.append(("op", match.group("op")))
+    tokens.append(("end", None))
+    return tokens
+
+
+class Parser:
+    """Recursive descent over the PromQL subset; builds tuples evaluated by Evaluator."""
+
+    def __init__(self, query):
+        self.tokens = tokenize(query)
+        self.position = 0
+
+    def peek(self):
+        return self.tokens[self.position]
+
+    def take(self, kind=None, value=None):
+        token = self.tokens[self.position]
+        if (kind and token[0] != kind) or (value is not None and token[1] != value):
+            raise QueryError(f"expected {value or kind}, got {token[1] or token[0]!r}")
+        self.position += 1
+        return token[1]
+
+    def accept(self, value):
+        if self.peek() == ("op", value):
+            self.position += 1
+            return True
+        return False
+
+    def parse(self):
+        expr = self.additive()
+        self.take("end")
+        return expr
+
+    def additive(self):
+        expr = self.multiplicative()
+        while self.peek() in (("op", "+"), ("op", "-")):
+            expr = ("binary", self.take("op"), expr, self.multiplicative())
+        return expr
+
+    def multiplicative(self):
+        expr = self.unary()
+        while self.peek() in (("op", "*"), ("op", "/")):
+            expr = ("binary", self.take("op"), expr, self.unary())
+        return expr
+
+    def unary(self):
+        if self.accept("-"):
+            return ("binary", "*", ("number", -1.0), self.unary())
+        return self.primary()
+
+    def primary(self):
+        kind, value = self.peek()
+        if kind == "number":
+            self.position += 1
+            return ("number", value)
+        if self.accept("("):
+            expr = self.additive()
+            self.take("op", ")")
+            return expr
+        if kind == "name" and value in AGGREGATIONS:
+            return self.aggregation()
+        if kind == "name" and value in RANGE_FUNCTIONS and self.tokens[self.position + 1] == ("op", "("):
+            self.position += 1
+            self.take("op", "(")
+            selector = self.selector()
+            self.take("op", ")")
+            if selector[3] is None:
+                raise QueryError(f"{value}() expects a range vector")
+            return ("function", value, selector)
+        if kind == "name" and self.tokens[self.position + 1] == ("op", "("):
+            raise QueryError(f"unsupported function {value}")
+        if kind == "name" or (kind, value) == ("op", "{"):
+            selector = self.selector()
+            if selector[3] is not None:
+                raise QueryError("range vectors are only supported inside rate(), irate() and increase()")
+            return selector
+        raise QueryError(f"unexpected {value or kind!r}")
+
+    def aggregation(self):
+        op = self.take("name")
+        by = self.grouping()
+        self.take("op", "(")
+        arg = self.additive()
+        self.take("op", ")")
+        if by is None:
+            by = self.grouping()
+        return ("aggregate", op, by, arg)
+
+    def grouping(self):
+        if self.peek() == ("name", "without"):
+            raise QueryError("without() is not supported")
+        if self.peek() != ("name", "by"):
+            return None
+        self.position += 1
+        self.take("op", "(")
+        labels = []
+        while not self.accept(")"):
+            labels.append(self.take("name"))
+            self.accept(",")
+        return labels
+
+    def selector(self):
+        name = self.take("name") if self.peek()[0] == "name" else None
+        matchers = []
+        if self.accept("{"):
+            while not self.accept("}"):
+                label = self.take("name")
+                op = self.take("op")
+                if op not in ("=", "!=", "=~", "!~"):
+                    raise QueryError(f"unexpected matcher operator {op}")
+                value = self.take("string")
+                if label == "__name__" and op == "=":
+                    name = value
+                else:
+                    if op in ("=~", "!~"):
+                        try:
+                            value = re.compile(f"^(?:{value})$")
+                        except re.error as e:
+                            raise QueryError(f"invalid regular expression {value!r}: {e}")
+                    matchers.append((label, op, value))
+                self.accept(",")
+        if name is None:
+            raise QueryError("selectors need a metric name")
+        window = None
+        if self.accept("["):
+            window = self.take("duration")
+            self.take("op", "]")
+        return ("selector", name, matchers, window)
+
+
+def matches(labels, matchers):
+    for label, op, value in matchers:
+        actual = labels.get(label, "")
+        if op == "=" and actual != value or op == "!=" and actual == value:
+            return False
+        if op == "=~" and not value.match(actual) or op == "!~" and value.match(actual):
+            return False
+    return True
+
+
+def without_name(labels):
+    return {name: value for name, value in labels.items() if name != "__name__"}
+
+
+def arithmetic(op, left, right):
+    if op == "+":
+        return left + right
+    if op == "-":
+        return left - right
+    if op == "*":
+        return left * right
+    if right == 0:
+        return math.nan if left == 0 or math.isnan(left) else math.copysign(math.inf, left)
+    return left / right
+
+
+class Evaluator:
+    """Evaluates a parsed query at one instant: a float for scalars, [(labels, value)] for vectors."""
+
+    def __init__(self, store):
+        self.store = store
+
+    def evaluate(self, node, t):
+        kind = node[0]
+        if kind == "number":
+            return node[1]
+        if kind == "selector":
+            _, name, matchers, _ = node
+            return [(dict(series.labels, __name__=name), series.value(t))
+                    for series in self.store.family(name) if matches(series.labels, matchers)]
+        if kind == "function":
+            _, function, (_, name, matchers, window) = node
+            result = []
+            for series in self.store.family(name):
+                if matches(series.labels, matchers):
+                    increase = series.value(t) - series.value(t - window)
+                    result.append((dict(series.labels), increase if function == "increase" else increase / window))
+            return result
+        if kind == "aggregate":
+            return self.aggregate(node[1], node[2], self.evaluate(node[3], t))
+        if kind == "binary":
+            return self.binary(node[1], self.evaluate(node[2], t), self.evaluate(node[3], t))
+        raise QueryError(f"cannot evaluate {kind}")
+
+    def aggregate(self, op, by, vector):
+        if not isinstance(vector, list):
+            raise QueryError(f"{op}() expects an instant vector")
+        groups = {}
+        for labels, value in vector:
+            key = tuple(labels.get(label, "") for label in by or ())
+            groups.setdefault(key, []).append(value)
+        result = []
+        for key, values in groups.items():
+            labels = {label: value for label, value in zip(by or (), key) if value}
+            if op == "sum":
+                result.append((labels, sum(values)))
+            elif op == "avg":
+                result.append((labels, sum(values) / len(values)))
+            elif op == "count":
+                result.append((labels, float(len(values))))
+            else:
+                result.append((labels, min(values) if op == "min" else max(values)))
+        return result
+
+    def binary(self, op, left, right):
+        left_vector, right_vector = isinstance(left, list), isinstance(right, list)
+        if not left_vector and not right_vector:
+            return arithmetic(op, left, right)
+        if not right_vector:
+            return [(without_name(labels), arithmetic(op, value, right)) for labels, value in left]
+        if not left_vector:
+            return [(without_name(labels), arithmetic(op, left, value)) for labels, value in right]
+        # One-to-one matching on all labels but the metric name
+        index = {frozenset(without_name(labels).items()): value for labels, value in right}
+        result = []
+        for labels, value in left:
+            labels = without_name(labels)
+            other = index.get(frozenset(labels.items()))
+            if other is not None:
+                result.append((labels, arithmetic(op, value, other)))
+        return result
+
+
+def format_value(value):
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def parse_time(value, default=None):
+    if value is None or value == "":
+        if default is None:
+            raise QueryError("missing time parameter")
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            raise QueryError(f"cannot parse {value!r} to a valid timestamp")
+
+
+def parse_step(value):
+    if not value:
+        raise QueryError("missing step parameter")
+    try:
+        return float(value)
+    except ValueError:
+        tokens = tokenize(value)
+        if len(tokens) != 2 or tokens[0][0] != "duration":
+            raise QueryError(f"cannot parse {value!r} to a valid duration")
+        return tokens[0][1]
+
+
+def instant_query(store, query, t):
+    result = Evaluator(store).evaluate(Parser(query).parse(), t)
+    if not isinstance(result, list):
+        return {"resultType": "scalar", "result": [t, format_value(result)]}
+    return {"resultType": "vector",
+            "result": [{"metric": labels, "value": [t, format_value(value)]} for labels, value in result]}
+
+
+def range_query(store, query, start, end, step):
+    if step <= 0:
+        raise QueryError("zero or negative query resolution step widths are not accepted")
+    if end < start:
+        raise QueryError("end timestamp must not be before start time")
+    if (end - start) / step > MAX_POINTS:
+        raise QueryError(f"exceeded maximum resolution of 11,000 points per timeseries. "
+                         f"Try decreasing the query resolution (?step=XX)")
+    expr = Parser(query).parse()
+    evaluator = Evaluator(store)
+    series = {}
+    t = start
+    while t <= end:
+        result = evaluator.evaluate(expr, t)
+        if not isinstance(result, list):
+            result = [({}, result)]
+        for labels, value in result:
+            key = frozenset(labels.items())
+            entry = series.get(key)
+            if entry is None:
+                entry = series[key] = {"metric": labels, "values": []}
+            entry["values"].append([t, format_value(value)])
+        t += step
+    return {"resultType": "matrix", "result": list(series.values())}
+
+
+class FakePrometheus(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, store, port=0, latency_ms=0):
+        super().__init__(("127.0.0.1", port), PrometheusHandler)
+        self.store = store
+        self.latency_ms = latency_ms
+        self.requests = 0
+        self.queries = 0
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+class PrometheusHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        self.handle_request(url.path, parse_qs(url.query))
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        url = urlsplit(self.path)
+        params = parse_qs(url.query)
+        for name, values in parse_qs(self.rfile.read(length).decode()).items():
+            params.setdefault(name, []).extend(values)
+        self.handle_request(url.path, params)
+
+    def handle_request(self, path, params):
+        self.server.requests += 1
+        if self.server.latency_ms:
+            time.sleep(self.server.latency_ms / 1000)
+        params = {name: values[-1] for name, values in params.items()}
+        try:
+            if path in ("/-/healthy", "/-/ready"):
+                self.send_body(b"Prometheus Server is Healthy.\n", "text/plain")
+            elif path == "/api/v1/query":
+                self.server.queries += 1
+                self.send_data(instant_query(self.server.store, params.get("query", ""),
+                                             parse_time(params.get("time"), time.time())))
+            elif path == "/api/v1/query_range":
+                self.server.queries += 1
+                self.send_data(range_query(self.server.store, params.get("query", ""), parse_time(params.get("start")),
+                                           parse_time(params.get("end")), parse_step(params.get("step"))))
+            elif path == "/api/v1/label/__name__/values":
+                self.send_data(self.server.store.names())
+            elif path == "/api/v1/status/buildinfo":
+                self.send_data({"version": "2.53.0-fake", "goVersion": "none"})
+            else:
+                self.send_json({"status": "error", "errorType": "not_found", "error": f"no route for {path}"}, 404)
+        except QueryError as e:
+            self.send_json({"status": "error", "errorType": "bad_data", "error": str(e)}, 400)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def send_data(self, data):
+        self.send_json({"status": "success", "data": data})
+
+    def send_json(self, body, code=200):
+        self.send_body(json.dumps(body).encode(), "application/json", code)
+
+    def send_body(self, data, content_type, code=200):
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        if len(data) >= GZIP_MIN_BYTES and "gzip" in self.headers.get("Accept-Encoding", ""):
+            data = gzip.compress(data, GZIP_LEVEL)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def start_server(nodes=200, namespaces=40, pods=10000, latency_ms=0, port=0, seed=0, objects=None):
+    """Serve series for a synthetic cluster on a background thread; returns the server.
+
+    Pass the fake API server's `store.objects` as `objects` to describe
+    exactly the cluster it serves instead of generating one.
+    """
+    if objects is None:
+        objects = generate_cluster(nodes, namespaces, pods, seed=seed)
+    server = FakePrometheus(SeriesStore(objects, seed), port, latency_ms)
+    threading.Thread(target=server.serve_forever, name="fake-prometheus", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=200)
+    parser.add_argument("--namespaces", type=int, default=40)
+    parser.add_argument("--pods", type=int, default=10000)
+    parser.add_argument("--latency-ms", type=float, default=0, help="delay before every response")
+    parser.add_argument("--port", type=int, default=9090)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = start_server(args.nodes, args.namespaces, args.pods, args.latency_ms, args.port, args.seed)
+    print(f"Serving series for {args.pods} pods on {args.nodes} nodes at {server.url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
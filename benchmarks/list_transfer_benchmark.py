@@ -0,0 +1,116 @@
+"""Measure bytes on the wire and fetch+decode time for a cluster-wide pod LIST.
+
+Serves the fixture from a local HTTP server that honours Accept-Encoding the
+way the API server does, then fetches it through a kubernetes ApiClient with
+and without gzip negotiation, decoding into models and into RawObjects.
+
+Usage:
+    python benchmarks/list_transfer_benchmark.py [--pods 10000] [--repeat 3]
+    python benchmarks/list_transfer_benchmark.py --fixture pods.json
+
+A recorded fixture can be taken from a real cluster with
+`kubectl get --raw /api/v1/pods > pods.json`.
+"""
+import argparse
+import gzip
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kubernetes import client
+from raw_api import accept_gzip, call_raw
+from pod_decode_benchmark import make_pod_list
+
+# The API server compresses at gzip level 1
+GZIP_LEVEL = 1
+
+
+class FixtureServer(ThreadingHTTPServer):
+    def __init__(self, body):
+        super().__init__(('127.0.0.1', 0), FixtureHandler)
+        self.body = body
+        self.gzipped = gzip.compress(body, GZIP_LEVEL)
+        self.bytes_sent = 0
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = self.server.body
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = self.server.gzipped
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.bytes_sent += len(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def core_api(server, compressed):
+    configuration = client.Configuration()
+    configuration.host = f"http://127.0.0.1:{server.server_port}"
+    api_client = client.ApiClient(configuration)
+    if compressed:
+        accept_gzip(api_client)
+    return client.CoreV1Api(api_client)
+
+
+def fetch_models(v1):
+    return len(v1.list_pod_for_all_namespaces().items)
+
+
+def fetch_raw(v1):
+    return len(call_raw(v1.list_pod_for_all_namespaces).items)
+
+
+def measure(server, compressed, fetch, repeat):
+    v1 = core_api(server, compressed)
+    timings = []
+    for _ in range(repeat):
+        server.bytes_sent = 0
+        start = time.perf_counter()
+        count = fetch(v1)
+        timings.append(time.perf_counter() - start)
+    return min(timings), server.bytes_sent, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pods", type=int, default=10000)
+    parser.add_argument("--fixture", help="recorded PodList JSON to serve instead of synthetic pods")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.fixture:
+        with open(args.fixture, 'rb') as f:
+            body = f.read()
+    else:
+        body = make_pod_list(args.pods).encode()
+
+    server = FixtureServer(body)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        print(f"Fixture: {len(body) / 1024 / 1024:.1f} MiB of JSON, "
+              f"{len(server.gzipped) / 1024 / 1024:.1f} MiB gzipped")
+        baseline = None
+        for compressed in (False, True):
+            for label, fetch in (("models", fetch_models), ("raw", fetch_raw)):
+                seconds, sent, count = measure(server, compressed, fetch, args.repeat)
+                baseline = baseline or seconds
+                encoding = "gzip" if compressed else "identity"
+                print(f"{encoding:8} {label:6} {count:6} pods  {sent / 1024 / 1024:6.1f} MiB sent  "
+                      f"{seconds * 1000:8.1f} ms  {baseline / seconds:5.1f}x")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
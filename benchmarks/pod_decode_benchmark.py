@@ -0,0 +1,117 @@
+"""Compare model deserialization against the raw JSON path for the Pods table.
+
+Usage:
+    python benchmarks/pod_decode_benchmark.py [--pods 10000] [--repeat 3]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kubernetes import client
+from raw_api import RawObject
+from resource_updaters import pod_row
+
+
+def make_pod(i, now):
+    created = (now - timedelta(minutes=i % 5000)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    namespace = f"namespace-{i % 40}"
+    name = f"app-{i // 3}-{i:05d}"
+    return {
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "uid": f"00000000-0000-0000-0000-{i:012d}",
+            "resourceVersion": str(100000 + i),
+            "creationTimestamp": created,
+            "labels": {"app": f"app-{i // 3}", "tier": "backend"},
+            "ownerReferences": [{
+                "apiVersion": "apps/v1", "kind": "ReplicaSet", "name": f"app-{i // 3}-5d8f7",
+                "uid": f"11111111-0000-0000-0000-{i:012d}", "controller": True,
+            }],
+        },
+        "spec": {
+            "nodeName": f"node-{i % 200}",
+            "containers": [{
+                "name": "app",
+                "image": "registry.example.com/app:1.2.3",
+                "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+                "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}},
+                "env": [{"name": f"VAR_{j}", "value": str(j)} for j in range(5)],
+            }],
+        },
+        "status": {
+            "phase": "Running",
+            "podIP": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}",
+            "startTime": created,
+            "conditions": [
+                {"type": "Ready", "status": "True", "lastTransitionTime": created},
+                {"type": "PodScheduled", "status": "True", "lastTransitionTime": created},
+            ],
+            "containerStatuses": [{
+                "name": "app", "ready": i % 17 != 0, "restartCount": i % 4,
+                "image": "registry.example.com/app:1.2.3", "imageID": "sha256:abc",
+                "state": {"running": {"startedAt": created}},
+            }],
+        },
+    }
+
+
+def make_pod_list(count):
+    now = datetime.now(timezone.utc)
+    return json.dumps({
+        "kind": "PodList",
+        "apiVersion": "v1",
+        "metadata": {"resourceVersion": "200000"},
+        "items": [make_pod(i, now) for i in range(count)],
+    })
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+
+def decode_models(body):
+    pod_list = client.ApiClient().deserialize(FakeResponse(body), 'V1PodList')
+    return [pod_row(pod) for pod in pod_list.items]
+
+
+def decode_raw(body):
+    pod_list = json.loads(body, object_hook=RawObject)
+    return [pod_row(pod) for pod in pod_list.items]
+
+
+def best_of(func, body, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = func(body)
+        timings.append(time.perf_counter() - start)
+    return min(timings), rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pods", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    body = make_pod_list(args.pods)
+    print(f"Fixture: {args.pods} pods, {len(body) / 1024 / 1024:.1f} MiB of JSON")
+
+    model_time, model_rows = best_of(decode_models, body, args.repeat)
+    raw_time, raw_rows = best_of(decode_raw, body, args.repeat)
+    assert model_rows == raw_rows, "raw and model paths produced different rows"
+
+    print(f"Model deserialization + rows: {model_time * 1000:8.1f} ms")
+    print(f"Raw JSON + rows:              {raw_time * 1000:8.1f} ms")
+    print(f"Speedup:                      {model_time / raw_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+"""Generate a synthetic cluster for the fake API server and the benchmarks.
+
+Objects are plain JSON dicts shaped like the API server's, complete enough
+to deserialize into the kubernetes client's models: N nodes, M namespaces
+and P pods owned by ReplicaSets (behind Deployments) and StatefulSets, with
+the Services, Jobs, storage, RBAC, events, metrics and custom resources the
+tabs list.
+
+Usage:
+    python benchmarks/synthetic_cluster.py --nodes 200 --namespaces 40 --pods 10000 > cluster.json
+"""
+import argparse
+import json
+import os
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from pod_decode_benchmark import make_pod
+
+# (API path prefix, plural) -> kind. Listing a kind answers "<Kind>List".
+KINDS = {
+    ("api/v1", "pods"): "Pod",
+    ("api/v1", "nodes"): "Node",
+    ("api/v1", "namespaces"): "Namespace",
+    ("api/v1", "services"): "Service",
+    ("api/v1", "secrets"): "Secret",
+    ("api/v1", "configmaps"): "ConfigMap",
+    ("api/v1", "persistentvolumeclaims"): "PersistentVolumeClaim",
+    ("api/v1", "persistentvolumes"): "PersistentVolume",
+    ("api/v1", "serviceaccounts"): "ServiceAccount",
+    ("api/v1", "events"): "Event",
+    ("apis/apps/v1", "deployments"): "Deployment",
+    ("apis/apps/v1", "replicasets"): "ReplicaSet",
+    ("apis/apps/v1", "statefulsets"): "StatefulSet",
+    ("apis/batch/v1", "jobs"): "Job",
+    ("apis/batch/v1", "cronjobs"): "CronJob",
+    ("apis/networking.k8s.io/v1", "ingresses"): "Ingress",
+    ("apis/networking.k8s.io/v1", "networkpolicies"): "NetworkPolicy",
+    ("apis/storage.k8s.io/v1", "storageclasses"): "StorageClass",
+    ("apis/rbac.authorization.k8s.io/v1", "roles"): "Role",
+    ("apis/rbac.authorization.k8s.io/v1", "rolebindings"): "RoleBinding",
+    ("apis/rbac.authorization.k8s.io/v1", "clusterroles"): "ClusterRole",
+    ("apis/rbac.authorization.k8s.io/v1", "clusterrolebindings"): "ClusterRoleBinding",
+    ("apis/apiextensions.k8s.io/v1", "customresourcedefinitions"): "CustomResourceDefinition",
+    ("apis/metrics.k8s.io/v1beta1", "nodes"): "NodeMetrics",
+    ("apis/metrics.k8s.io/v1beta1", "pods"): "PodMetrics",
+    ("apis/example.com/v1", "widgets"): "Widget",
+}
+
+TEAMS = ["payments", "search", "checkout", "identity", "analytics", "platform"]
+PODS_PER_WORKLOAD = 3
+# One workload in this many is a StatefulSet with a PVC per replica
+STATEFULSET_EVERY = 10
+# One pod in this many has requests but no limits
+LIMITLESS_POD_EVERY = 5
+
+
+def timestamp(moment):
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class ClusterGenerator:
+    def __init__(self, nodes, namespaces, pods, payload_bytes=0, seed=0, widgets=None):
+        self.node_count = nodes
+        self.namespace_count = namespaces
+        self.pod_count = pods
+        # One custom resource per namespace unless asked for more
+        self.widget_count = namespaces if widgets is None else widgets
+        self.payload_bytes = payload_bytes
+        self.random = random.Random(seed)
+        self.now = datetime.now(timezone.utc)
+        self.uids = 0
+        self.objects = {key: [] for key in KINDS}
+
+    def add(self, prefix, plural, obj):
+        kind = KINDS[(prefix, plural)]
+        obj["apiVersion"] = prefix.split("/", 1)[1] if prefix.startswith("apis/") else "v1"
+        obj["kind"] = kind
+        self.objects[(prefix, plural)].append(obj)
+        return obj
+
+    def meta(self, name, namespace=None, labels=None, owner=None, age_minutes=None):
+        self.uids += 1
+        created = self.now - timedelta(minutes=age_minutes if age_minutes is not None else self.random.randint(5, 90000))
+        metadata = {
+            "name": name,
+            "uid": f"00000000-0000-0000-0001-{self.uids:012d}",
+            "resourceVersion": str(1000 + self.uids),
+            "creationTimestamp": timestamp(created),
+            "labels": labels or {},
+        }
+        if namespace:
+            metadata["namespace"] = namespace
+        if owner:
+            metadata["ownerReferences"] = [{
+                "apiVersion": owner["apiVersion"], "kind": owner["kind"], "name": owner["metadata"]["name"],
+                "uid": owner["metadata"]["uid"], "controller": True, "blockOwnerDeletion": True,
+            }]
+        if self.payload_bytes:
+            metadata["annotations"] = {"kubenexus.dev/padding": "x" * self.payload_bytes}
+        return metadata
+
+    def pod_template(self, labels):
+        return {
+            "metadata": {"labels": labels},
+            "spec": {"containers": [{"name": "app", "image": "registry.example.com/app:1.2.3"}]},
+        }
+
+    def generate(self):
+        self.storage()
+        self.nodes()
+        namespaces = [f"{self.random.choice(TEAMS)}-{i:03d}" for i in range(self.namespace_count)]
+        for namespace in namespaces:
+            self.namespace(namespace)
+        self.workloads(namespaces)
+        self.rbac(namespaces)
+        self.custom_resources(namespaces)
+        return self.objects
+
+    def storage(self):
+        self.add("apis/storage.k8s.io/v1", "storageclasses", {
+            "metadata": self.meta("standard", labels={}),
+            "provisioner": "kubernetes.io/no-provisioner",
+            "reclaimPolicy": "Delete",
+        })
+
+    def nodes(self):
+        for i in range(self.node_count):
+            name = f"node-{i:04d}"
+            labels = {
+                "kubernetes.io/hostname": name,
+                "kubernetes.io/os": "linux",
+                "topology.kubernetes.io/zone": f"zone-{i % 3}",
+            }
+            if i < 3:
+                labels["node-role.kubernetes.io/control-plane"] = ""
+            ready = "False" if i % 97 == 13 else "True"
+            node = self.add("api/v1", "nodes", {
+                "metadata": self.meta(name, labels=labels),
+                "spec": {"podCIDR": f"10.{i // 256}.{i % 256}.0/24"},
+                "status": {
+                    "capacity": {"cpu": "16", "memory": "64Gi", "pods": "110"},
+                    "allocatable": {"cpu": "15500m", "memory": "62Gi", "pods": "110"},
+                    "addresses": [{"type": "InternalIP", "address": f"192.168.{i // 256}.{i % 256}"}],
+                    "conditions": [
+                        {"type": "MemoryPressure", "status": "False"},
+                        {"type": "DiskPressure", "status": "False"},
+                        {"type": "Ready", "status": ready},
+                    ],
+                },
+            })
+            self.add("apis/metrics.k8s.io/v1beta1", "nodes", {
+                "metadata": {"name": name, "creationTimestamp": node["metadata"]["creationTimestamp"]},
+                "timestamp": timestamp(self.now), "window": "30s",
+                "usage": {"cpu": f"{self.random.randint(200, 15000)}m", "memory": f"{self.random.randint(2, 60)}Gi"},
+            })
+
+    def namespace(self, namespace):
+        self.add("api/v1", "namespaces", {
+            "metadata": self.meta(namespace, labels={"kubernetes.io/metadata.name": namespace}),
+            "status": {"phase": "Active"},
+        })
+        self.add("api/v1", "serviceaccounts", {"metadata": self.meta("default", namespace)})
+        self.add("api/v1", "configmaps", {
+            "metadata": self.meta("kube-root-ca.crt", namespace),
+            "data": {"ca.crt": "-----BEGIN CERTIFICATE-----"},
+        })
+        self.add("apis/networking.k8s.io/v1", "networkpolicies", {
+            "metadata": self.meta("default-deny", namespace),
+            "spec": {"podSelector": {}, "policyTypes": ["Ingress"]},
+        })
+
+    def workloads(self, namespaces):
+        workload_count = max(1, -(-self.pod_count // PODS_PER_WORKLOAD))
+        pod_index = 0
+        for w in range(workload_count):
+            namespace = namespaces[w % len(namespaces)]
+            app = f"app-{w:05d}"
+            replicas = min(PODS_PER_WORKLOAD, self.pod_count - pod_index)
+            if replicas <= 0:
+                break
+            labels = {"app": app, "app.kubernetes.io/part-of": namespace.split("-")[0], "tier": "backend"}
+            if w % STATEFULSET_EVERY == STATEFULSET_EVERY - 1:
+                owner = self.add("apis/apps/v1", "statefulsets", {
+                    "metadata": self.meta(app, namespace, labels),
+                    "spec": {"replicas": replicas, "serviceName": app, "selector": {"matchLabels": {"app": app}},
+                             "template": self.pod_template(labels)},
+                    "status": {"replicas": replicas, "readyReplicas": replicas},
+                })
+                names = [f"{app}-{r}" for r in range(replicas)]
+                for name in names:
+                    self.volume(namespace, f"data-{name}")
+            else:
+                deployment = self.add("apis/apps/v1", "deployments", {
+                    "metadata": self.meta(app, namespace, labels),
+                    "spec": {"replicas": replicas, "selector": {"matchLabels": {"app": app}},
+                             "template": self.pod_template(labels)},
+                    "status": {"replicas": replicas, "availableReplicas": replicas, "readyReplicas": replicas},
+                })
+                template_hash = f"{self.random.getrandbits(32):08x}"[:9]
+                owner = self.add("apis/apps/v1", "replicasets", {
+                    "metadata": self.meta(f"{app}-{template_hash}", namespace,
+                                          dict(labels, **{"pod-template-hash": template_hash}), deployment),
+                    "spec": {"replicas": replicas, "selector": {"matchLabels": {"app": app}},
+                             "template": self.pod_template(labels)},
+                    "status": {"replicas": replicas},
+                })
+                names = [f"{owner['metadata']['name']}-{self.random.getrandbits(24):06x}" for _ in range(replicas)]
+                labels = dict(labels, **{"pod-template-hash": template_hash})
+            for name in names:
+                self.pod(pod_index, name, namespace, labels, owner)
+                pod_index += 1
+            self.service(namespace, app, w)
+            if w % 25 == 0:
+                self.batch(namespace, app)
+
+    def pod(self, index, name, namespace, labels, owner):
+        pod = make_pod(index, self.now)
+        metadata = self.meta(name, namespace, dict(labels), owner, age_minutes=index % 5000)
+        pod["metadata"] = metadata
+        pod["spec"]["nodeName"] = f"node-{index % self.node_count:04d}" if self.node_count else None
+        pod["spec"]["serviceAccountName"] = "default"
+        if index % LIMITLESS_POD_EVERY:
+            pod["spec"]["containers"][0]["resources"]["limits"] = {"cpu": "1", "memory": "1Gi"}
+        status = pod["status"]["containerStatuses"][0]
+        if index % 53 == 7:
+            pod["status"]["phase"] = "Pending"
+            status["ready"] = False
+            status["state"] = {"waiting": {"reason": "CrashLoopBackOff", "message": "back-off restarting"}}
+        self.add("api/v1", "pods", pod)
+        self.add("apis/metrics.k8s.io/v1beta1", "pods", {
+            "metadata": {"name": name, "namespace": namespace, "creationTimestamp": metadata["creationTimestamp"]},
+            "timestamp": timestamp(self.now), "window": "30s",
+            "containers": [{"name": "app", "usage": {"cpu": f"{self.random.randint(1, 900)}m",
+                                                      "memory": f"{self.random.randint(32, 2048)}Mi"}}],
+        })
+        if status["restartCount"]:
+            self.add("api/v1", "events", {
+                "metadata": self.meta(f"{name}.{index:x}", namespace, age_minutes=index % 60),
+                "involvedObject": {"kind": "Pod", "name": name, "namespace": namespace,
+                                   "uid": metadata["uid"], "apiVersion": "v1"},
+                "reason": "BackOff", "message": "Back-off restarting failed container", "type": "Warning",
+                "count": status["restartCount"],
+                "lastTimestamp": timestamp(self.now - timedelta(minutes=index % 60)),
+                "source": {"component": "kubelet"},
+            })
+
+    def service(self, namespace, app, index):
+        self.add("api/v1", "services", {
+            "metadata": self.meta(app, namespace, {"app": app}),
+            "spec": {"selector": {"app": app}, "clusterIP": f"10.96.{index // 256 % 256}.{index % 256}",
+                     "type": "ClusterIP", "ports": [{"name": "http", "port": 80, "targetPort": 8080, "protocol": "TCP"}]},
+            "status": {"loadBalancer": {}},
+        })
+        self.add("api/v1", "secrets", {
+            "metadata": self.meta(f"{app}-credentials", namespace, {"app": app}),
+            "type": "Opaque", "data": {"password": "c2VjcmV0"},
+        })
+        if index % 10 == 0:
+            self.add("apis/networking.k8s.io/v1", "ingresses", {
+                "metadata": self.meta(app, namespace, {"app": app}),
+                "spec": {"rules": [{"host": f"{app}.example.com", "http": {"paths": [{
+                    "path": "/", "pathType": "Prefix",
+                    "backend": {"service": {"name": app, "port": {"number": 80}}},
+                }]}}]},
+            })
+
+    def batch(self, namespace, app):
+        labels = {"app": f"{app}-report"}
+        cronjob = self.add("apis/batch/v1", "cronjobs", {
+            "metadata": self.meta(f"{app}-report", namespace, labels),
+            "spec": {"schedule": "*/30 * * * *", "suspend": False, "jobTemplate": {"spec": {
+                "template": dict(self.pod_template(labels), spec={"restartPolicy": "Never", "containers": [
+                    {"name": "report", "image": "registry.example.com/report:1.0"}]}),
+            }}},
+            "status": {"lastScheduleTime": timestamp(self.now - timedelta(minutes=12))},
+        })
+        started = self.now - timedelta(minutes=12)
+        self.add("apis/batch/v1", "jobs", {
+            "metadata": self.meta(f"{app}-report-{self.random.randint(10000000, 99999999)}", namespace, labels, cronjob),
+            "spec": {"completions": 1, "template": dict(self.pod_template(labels), spec={
+                "restartPolicy": "Never", "containers": [{"name": "report", "image": "registry.example.com/report:1.0"}]})},
+            "status": {"succeeded": 1, "startTime": timestamp(started),
+                       "completionTime": timestamp(started + timedelta(seconds=self.random.randint(5, 300)))},
+        })
+
+    def volume(self, namespace, claim):
+        volume_name = f"pvc-{self.uids + 1:08d}"
+        self.add("api/v1", "persistentvolumeclaims", {
+            "metadata": self.meta(claim, namespace),
+            "spec": {"accessModes": ["ReadWriteOnce"], "storageClassName": "standard", "volumeName": volume_name,
+                     "resources": {"requests": {"storage": "10Gi"}}},
+            "status": {"phase": "Bound", "capacity": {"storage": "10Gi"}},
+        })
+        self.add("api/v1", "persistentvolumes", {
+            "metadata": self.meta(volume_name),
+            "spec": {"capacity": {"storage": "10Gi"}, "accessModes": ["ReadWriteOnce"], "storageClassName": "standard",
+                     "claimRef": {"kind": "PersistentVolumeClaim", "namespace": namespace, "name": claim},
+                     "hostPath": {"path": f"/data/{volume_name}"}},
+            "status": {"phase": "Bound"},
+        })
+
+    def rbac(self, namespaces):
+        rbac = "apis/rbac.authorization.k8s.io/v1"
+        view = self.add(rbac, "clusterroles", {
+            "metadata": self.meta("view"),
+            "rules": [{"apiGroups": [""], "resources": ["pods", "services"], "verbs": ["get", "list", "watch"]}],
+        })
+        self.add(rbac, "clusterrolebindings", {
+            "metadata": self.meta("view-all"),
+            "roleRef": {"apiGroup": "rbac.authorization.k8s.io", "kind": "ClusterRole", "name": view["metadata"]["name"]},
+            "subjects": [{"kind": "Group", "name": "system:authenticated", "apiGroup": "rbac.authorization.k8s.io"}],
+        })
+        for namespace in namespaces:
+            self.add(rbac, "roles", {
+                "metadata": self.meta("deployer", namespace),
+                "rules": [{"apiGroups": ["apps"], "resources": ["deployments"], "verbs": ["get", "list", "update"]}],
+            })
+            self.add(rbac, "rolebindings", {
+                "metadata": self.meta("deployer", namespace),
+                "roleRef": {"apiGroup": "rbac.authorization.k8s.io", "kind": "Role", "name": "deployer"},
+                "subjects": [{"kind": "ServiceAccount", "name": "default", "namespace": namespace}],
+            })
+
+    def custom_resources(self, namespaces):
+        self.add("apis/apiextensions.k8s.io/v1", "customresourcedefinitions", {
+            "metadata": self.meta("widgets.example.com"),
+            "spec": {
+                "group": "example.com", "scope": "Namespaced",
+                "names": {"kind": "Widget", "listKind": "WidgetList", "plural": "widgets", "singular": "widget"},
+                "versions": [{"name": "v1", "served": True, "storage": True,
+                              "schema": {"openAPIV3Schema": {"type": "object", "x-kubernetes-preserve-unknown-fields": True}}}],
+            },
+        })
+        for i in range(self.widget_count):
+            self.add("apis/example.com/v1", "widgets", {
+                "metadata": self.meta(f"widget-{i:05d}", namespaces[i % len(namespaces)]),
+                "spec": {"size": self.random.choice(["small", "medium", "large"])},
+            })
+
+
+def generate_cluster(nodes=200, namespaces=40, pods=10000, payload_bytes=0, seed=0, widgets=None):
+    """Return {(prefix, plural): [objects]} for a cluster of the given size."""
+    return ClusterGenerator(nodes, namespaces, pods, payload_bytes, seed, widgets).generate()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=200)
+    parser.add_argument("--namespaces", type=int, default=40)
+    parser.add_argument("--pods", type=int, default=10000)
+    parser.add_argument("--payload-bytes", type=int, default=0, help="padding annotation added to every object")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--widgets", type=int, help="custom resources to create (default: one per namespace)")
+    args = parser.parse_args()
+
+    cluster = generate_cluster(args.nodes, args.namespaces, args.pods, args.payload_bytes, args.seed, args.widgets)
+    json.dump({f"{prefix}/{plural}": objects for (prefix, plural), objects in cluster.items()}, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""Synthetic Prometheus series for a cluster from synthetic_cluster.py.
+
+Produces the node-exporter, cAdvisor and kube-state-metrics families the
+Nodes, Pods and cluster metrics bar queries read, labelled with the same
+node, namespace and pod names the fake API server serves, so the tabs can
+join the two. Usage values start from the cluster's metrics.k8s.io objects
+and drift slowly over time; counters grow at that rate, so rate() over any
+window gives a plausible answer.
+
+Families are built the first time they are asked for, since the pod-level
+ones run to hundreds of thousands of series at 50k pods.
+"""
+import math
+import random
+import threading
+
+NODE_EXPORTER_PORT = 9100
+CPU_MODES = {"idle": None, "user": 0.7, "system": 0.25, "iowait": 0.05}
+# Usage wanders by this fraction over DRIFT_PERIOD_SECONDS
+DRIFT = 0.2
+DRIFT_PERIOD_SECONDS = 1800
+QUANTITY_SUFFIXES = {"m": 1e-3, "Ki": 2 ** 10, "Mi": 2 ** 20, "Gi": 2 ** 30, "Ti": 2 ** 40,
+                     "k": 1e3, "M": 1e6, "G": 1e9}
+
+
+def parse_quantity(quantity):
+    for suffix in sorted(QUANTITY_SUFFIXES, key=len, reverse=True):
+        if quantity.endswith(suffix):
+            return float(quantity[:-len(suffix)]) * QUANTITY_SUFFIXES[suffix]
+    return float(quantity)
+
+
+class Series:
+    """One labelled series; a gauge around `base`, or a counter growing at about `base` per second."""
+    __slots__ = ("labels", "base", "drift", "phase", "counter")
+
+    def __init__(self, labels, base, drift=0.0, phase=0.0, counter=False):
+        self.labels = labels
+        self.base = base
+        self.drift = drift
+        self.phase = phase
+        self.counter = counter
+
+    def value(self, t):
+        angle = 2 * math.pi * t / DRIFT_PERIOD_SECONDS + self.phase
+        if self.counter:
+            # The integral of base * (1 + drift * cos(angle))
+            return self.base * (t + self.drift * DRIFT_PERIOD_SECONDS / (2 * math.pi) * math.sin(angle))
+        return self.base * (1 + self.drift * math.sin(angle))
+
+
+class SeriesStore:
+    """Series by metric name, generated on first use."""
+
+    def __init__(self, objects, seed=0):
+        self.generator = MetricsGenerator(objects, seed)
+        self.families = {}
+        self.lock = threading.Lock()
+
+    def names(self):
+        return sorted(FAMILIES)
+
+    def family(self, name):
+        with self.lock:
+            series = self.families.get(name)
+            if series is None:
+                build = FAMILIES.get(name)
+                series = self.families[name] = build(self.generator) if build else []
+            return series
+
+    def series_count(self):
+        with self.lock:
+            return sum(len(series) for series in self.families.values())
+
+
+class MetricsGenerator:
+    def __init__(self, objects, seed=0):
+        self.seed = seed
+        self.nodes = objects[("api/v1", "nodes")]
+        self.pods = objects[("api/v1", "pods")]
+        self.namespaces = objects[("api/v1", "namespaces")]
+        self.node_usage = {obj["metadata"]["name"]: obj["usage"]
+                           for obj in objects[("apis/metrics.k8s.io/v1beta1", "nodes")]}
+        self.pod_usage = {(obj["metadata"]["namespace"], obj["metadata"]["name"]): obj["containers"]
+                          for obj in objects[("apis/metrics.k8s.io/v1beta1", "pods")]}
+
+    def random(self, name):
+        # Each family gets its own stream so building them in any order gives the same values
+        return random.Random(f"{self.seed}:{name}")
+
+    def node_instance(self, node):
+        ip = next(address["address"] for address in node["status"]["addresses"] if address["type"] == "InternalIP")
+        return f"{ip}:{NODE_EXPORTER_PORT}"
+
+    def containers(self):
+        """(labels, container spec, usage) for every container of every scheduled pod."""
+        for pod in self.pods:
+            metadata = pod["metadata"]
+            node = pod["spec"].get("nodeName")
+            if not node:
+                continue
+            usage = {c["name"]: c["usage"] for c in self.pod_usage.get((metadata["namespace"], metadata["name"]), [])}
+            for container in pod["spec"]["containers"]:
+                labels = {"namespace": metadata["namespace"], "pod": metadata["name"], "container": container["name"],
+                          "node": node, "instance": node}
+                yield labels, container, usage.get(container["name"], {})
+
+    # --- node-exporter and cAdvisor machine metrics ---
+
+    def node_cpu_seconds_total(self):
+        rng = self.random("node_cpu")
+        series = []
+        for node in self.nodes:
+            name = node["metadata"]["name"]
+            cpus = int(parse_quantity(node["status"]["capacity"]["cpu"]))
+            busy = min(parse_quantity(self.node_usage[name]["cpu"]) / cpus, 0.95)
+            instance = self.node_instance(node)
+            for cpu in range(cpus):
+                for mode, share in CPU_MODES.items():
+                    rate = 1 - busy if share is None else busy * share
+                    series.append(Series({"instance": instance, "job": "node-exporter", "cpu": str(cpu), "mode": mode},
+                                         rate, DRIFT / 2, rng.uniform(0, 2 * math.pi), counter=True))
+        return series
+
+    def node_memory_MemTotal_bytes(self):
+        return [Series({"instance": self.node_instance(node), "job": "node-exporter"},
+                       parse_quantity(node["status"]["capacity"]["memory"]))
+                for node in self.nodes]
+
+    def node_memory_MemAvailable_bytes(self):
+        rng = self.random("node_memory")
+        series = []
+        for node in self.nodes:
+            total = parse_quantity(node["status"]["capacity"]["memory"])
+            used = min(parse_quantity(self.node_usage[node["metadata"]["name"]]["memory"]), total * 0.95)
+            series.append(Series({"instance": self.node_instance(node), "job": "node-exporter"},
+                                 total - used, DRIFT / 4, rng.uniform(0, 2 * math.pi)))
+        return series
+
+    def machine_cpu_cores(self):
+        return [Series({"node": node["metadata"]["name"], "instance": node["metadata"]["name"]},
+                       parse_quantity(node["status"]["capacity"]["cpu"]))
+                for node in self.nodes]
+
+    def machine_memory_bytes(self):
+        return [Series({"node": node["metadata"]["name"], "instance": node["metadata"]["name"]},
+                       parse_quantity(node["status"]["capacity"]["memory"]))
+                for node in self.nodes]
+
+    # --- cAdvisor container metrics ---
+
+    def container_cpu_usage_seconds_total(self):
+        rng = self.random("container_cpu")
+        return [Series(labels, parse_quantity(usage.get("cpu", "10m")), DRIFT, rng.uniform(0, 2 * math.pi),
+                       counter=True)
+                for labels, _, usage in self.containers()]
+
+    def container_memory_working_set_bytes(self):
+        rng = self.random("container_memory")
+        return [Series(labels, parse_quantity(usage.get("memory", "64Mi")), DRIFT / 2, rng.uniform(0, 2 * math.pi))
+                for labels, _, usage in self.containers()]
+
+    def container_memory_usage_bytes(self):
+        # Working set plus page cache
+        return [Series(series.labels, series.base * 1.1, series.drift, series.phase)
+                for series in self.container_memory_working_set_bytes()]
+
+    def container_fs_usage_bytes(self):
+        rng = self.random("container_fs")
+        return [Series(labels, rng.uniform(10, 500) * 2 ** 20) for labels, _, _ in self.containers()]
+
+    def container_fs_limit_bytes(self):
+        return [Series(labels, 20 * 2 ** 30) for labels, _, _ in self.containers()]
+
+    # --- kube-state-metrics ---
+
+    def container_resources(self, field):
+        series = []
+        for labels, container, _ in self.containers():
+            values = container.get("resources", {}).get(field, {})
+            for resource, unit in (("cpu", "core"), ("memory", "byte")):
+                if resource in values:
+                    series.append(Series(dict(labels, resource=resource, unit=unit), parse_quantity(values[resource])))
+        return series
+
+    def kube_pod_container_resource_requests(self):
+        return self.container_resources("requests")
+
+    def kube_pod_container_resource_limits(self):
+        return self.container_resources("limits")
+
+    def kube_pod_container_status_ready(self):
+        series = []
+        for pod in self.pods:
+            metadata = pod["metadata"]
+            for status in pod["status"].get("containerStatuses", []):
+                series.append(Series({"namespace": metadata["namespace"], "pod": metadata["name"],
+                                      "container": status["name"]}, 1.0 if status["ready"] else 0.0))
+        return series
+
+    def kube_pod_owner(self):
+        series = []
+        for pod in self.pods:
+            metadata = pod["metadata"]
+            for owner in metadata.get("ownerReferences") or [{"kind": "<none>", "name": "<none>"}]:
+                series.append(Series({"namespace": metadata["namespace"], "pod": metadata["name"],
+                                      "owner_kind": owner["kind"], "owner_name": owner["name"],
+                                      "owner_is_controller": "true" if owner.get("controller") else "false"}, 1.0))
+        return series
+
+    def kube_pod_status_phase(self):
+        # Only the current phase; kube-state-metrics also exports the others as 0
+        return [Series({"namespace": pod["metadata"]["namespace"], "pod": pod["metadata"]["name"],
+                        "phase": pod["status"]["phase"]}, 1.0)
+                for pod in self.pods]
+
+    def kube_pod_info(self):
+        return [Series({"namespace": pod["metadata"]["namespace"], "pod": pod["metadata"]["name"],
+                        "node": pod["spec"].get("nodeName") or "", "pod_ip": pod["status"].get("podIP", "")}, 1.0)
+                for pod in self.pods]
+
+    def kube_node_info(self):
+        return [Series({"node": node["metadata"]["name"], "internal_ip": self.node_instance(node).split(":")[0]}, 1.0)
+                for node in self.nodes]
+
+    def kube_node_status_condition(self):
+        # Only the condition's current status, as with the pod phase
+        return [Series({"node": node["metadata"]["name"], "condition": condition["type"],
+                        "status": condition["status"].lower()}, 1.0)
+                for node in self.nodes for condition in node["status"]["conditions"]]
+
+    def kube_node_status_allocatable(self):
+        series = []
+        for node in self.nodes:
+            for resource, unit in (("cpu", "core"), ("memory", "byte"), ("pods", "integer")):
+                series.append(Series({"node": node["metadata"]["name"], "resource": resource, "unit": unit},
+                                     parse_quantity(node["status"]["allocatable"][resource])))
+        return series
+
+    def kube_namespace_created(self):
+        return [Series({"namespace": namespace["metadata"]["name"]}, 1.7e9) for namespace in self.namespaces]
+
+
+FAMILIES = {name: getattr(MetricsGenerator, name) for name in (
+    "node_cpu_seconds_total", "node_memory_MemTotal_bytes", "node_memory_MemAvailable_bytes",
+    "machine_cpu_cores", "machine_memory_bytes",
+    "container_cpu_usage_seconds_total", "container_memory_working_set_bytes", "container_memory_usage_bytes",
+    "container_fs_usage_bytes", "container_fs_limit_bytes",
+    "kube_pod_container_resource_requests", "kube_pod_container_resource_limits",
+    "kube_pod_container_status_ready", "kube_pod_owner", "kube_pod_status_phase", "kube_pod_info",
+    "kube_node_info", "kube_node_status_condition", "kube_node_status_allocatable", "kube_namespace_created",
+)}
@@ -0,0 +1,120 @@
+import threading
+from collections import OrderedDict
+
+from kubernetes import client, config
+from exec_credentials import install as install_exec_credential_cache
+from api_scheduler import install as install_request_budget
+from raw_api import accept_gzip
+import api_tracing
+import cluster_recording
+
+# Room for the parallel per-namespace LISTs, the informer watches and the
+# other tabs' calls without urllib3 discarding connections
+CONNECTION_POOL_MAXSIZE = 16
+# Contexts kept warm; the least recently used one beyond this is closed,
+# unless it is current or pinned by keep_warm()
+MAX_WARM_CONTEXTS = 8
+
+
+class ClientRegistry:
+    """One configured ApiClient per kubeconfig context, shared by every tab.
+
+    Each ApiClient keeps its urllib3 pool (and so its TLS sessions) and the
+    credentials the kubeconfig loader resolved, including exec-plugin tokens,
+    for as long as the context stays warm. `api(client.CoreV1Api)` returns a
+    typed API object for the current context; the objects are cached too
+    since they are thin wrappers around the ApiClient. Every request sent
+    through a context's client waits for that context's api_scheduler budget.
+    """
+
+    def __init__(self, max_contexts=MAX_WARM_CONTEXTS):
+        self.max_contexts = max_contexts
+        self.clients = OrderedDict()
+        self.apis = {}
+        self.current_context = None
+        self.pinned = set()
+        self.lock = threading.RLock()
+
+    def api_client(self, context=None):
+        context = context or self.current_context
+        with self.lock:
+            api_client = self.clients.get(context)
+            if api_client is not None:
+                self.clients.move_to_end(context)
+                return api_client
+
+        # Loading a context may run an auth plugin, so don't hold up other
+        # contexts meanwhile; if two threads race, the first one in wins
+        configuration = client.Configuration()
+        if cluster_recording.is_replaying():
+            configuration.host = cluster_recording.REPLAY_HOST
+        else:
+            config.load_kube_config(context=context, client_configuration=configuration, persist_config=False)
+        configuration.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
+        api_client = client.ApiClient(configuration)
+        # Recording sits closest to the wire so it sees exactly what the
+        # server sent; the budget and gzip wrap it like a live client.
+        # Tracing goes inside the budget so its latencies leave out queueing
+        cluster_recording.install(api_client, context)
+        api_tracing.install(api_client, context)
+        install_request_budget(api_client, context)
+        accept_gzip(api_client)
+
+        with self.lock:
+            existing = self.clients.get(context)
+            if existing is not None:
+                api_client.close()
+                return existing
+            self.clients[context] = api_client
+
+            while len(self.clients) > self.max_contexts:
+                evicted = next((name for name in self.clients
+                                if name != self.current_context and name not in self.pinned), None)
+                if evicted is None:
+                    break
+                evicted_client = self.clients.pop(evicted)
+                self.apis = {key: api for key, api in self.apis.items() if key[0] != evicted}
+                evicted_client.close()
+            return api_client
+
+    def api(self, api_class, context=None):
+        context = context or self.current_context
+        with self.lock:
+            api = self.apis.get((context, api_class))
+            if api is None:
+                api = api_class(self.api_client(context))
+                self.apis[(context, api_class)] = api
+            return api
+
+    def keep_warm(self, contexts):
+        """Never evict `contexts`, e.g. the clusters a table aggregates, however many there are."""
+        with self.lock:
+            self.pinned = set(contexts)
+
+    def use(self, context):
+        """Make `context` current, building its client only if it isn't warm."""
+        with self.lock:
+            api_client = self.api_client(context)
+            self.current_context = context
+        # Code that still builds client.*Api() without an ApiClient picks up
+        # the default configuration, so keep that pointed at the same context
+        client.Configuration.set_default(api_client.configuration)
+        return api_client
+
+    def close(self):
+        with self.lock:
+            for api_client in self.clients.values():
+                api_client.close()
+            self.clients.clear()
+            self.apis.clear()
+
+
+# Every context's loader shares exec-plugin tokens instead of re-running
+# e.g. `aws eks get-token` per ApiClient
+install_exec_credential_cache()
+
+registry = ClientRegistry()
+
+
+def api(api_class, context=None):
+    return registry.api(api_class, context)
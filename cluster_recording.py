@@ -0,0 +1,215 @@
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+import zipfile
+from urllib.parse import urlsplit
+
+import urllib3
+from kubernetes.client.rest import ApiException, RESTResponse
+
+# KUBENEXUS_RECORD=dump.zip records every API and Prometheus response the
+# tabs receive and writes the archive on exit; KUBENEXUS_REPLAY=dump.zip
+# serves the whole UI from such an archive without a cluster.
+RECORD_ENV = "KUBENEXUS_RECORD"
+REPLAY_ENV = "KUBENEXUS_REPLAY"
+ARCHIVE_VERSION = 1
+# Replayed clients and Prometheus never connect anywhere; these only keep the
+# code that formats URLs happy
+REPLAY_HOST = "http://replay.invalid"
+REPLAY_PROMETHEUS_URL = "http://prometheus.replay.invalid"
+# Streams have no fixed response to record; in replay a watch stays open
+# and empty for its timeout, like one on a quiet cluster
+STREAMING_PARAMS = {'watch', 'follow'}
+
+
+def request_key(context, method, url, query_params):
+    query = sorted((str(name), str(value)) for name, value in query_params or ())
+    return json.dumps([context, method, urlsplit(url).path, query])
+
+
+def prometheus_key(context, query):
+    return json.dumps([context, query])
+
+
+def entry_name(kind, key):
+    return f"{kind}/{hashlib.sha1(key.encode()).hexdigest()}"
+
+
+def is_streaming(query_params):
+    return any(name in STREAMING_PARAMS for name, _ in query_params or ())
+
+
+def build_response(status, reason, headers, body, preload_content):
+    """Turn a recorded response back into what RESTClientObject.request returns."""
+    response = urllib3.HTTPResponse(body=io.BytesIO(body), headers=headers, status=status, reason=reason,
+                                    preload_content=preload_content)
+    if preload_content:
+        response = RESTResponse(response)
+        response.data = response.data.decode('utf8')
+    if not 200 <= response.status <= 299:
+        raise ApiException(http_resp=response)
+    return response
+
+
+class Recorder:
+    def __init__(self, path):
+        self.path = path
+        self.contexts = []
+        self.responses = {}
+        self.prometheus = {}
+        self.lock = threading.Lock()
+
+    def install(self, api_client, context):
+        with self.lock:
+            if context not in self.contexts:
+                self.contexts.append(context)
+        request = api_client.rest_client.request
+
+        def recording_request(method, url, query_params=None, headers=None, body=None, post_params=None,
+                              _preload_content=True, _request_timeout=None):
+            if method != 'GET' or is_streaming(query_params):
+                return request(method, url, query_params, headers, body, post_params,
+                               _preload_content, _request_timeout)
+            # Always preload so the body can be kept, then hand the caller the
+            # same kind of response replay would
+            try:
+                response = request(method, url, query_params, headers, body, post_params, True, _request_timeout)
+                status, reason, data = response.status, response.reason, response.data
+                content_type = response.getheader('Content-Type', 'application/json')
+            except ApiException as e:
+                if not e.status:
+                    raise
+                status, reason, data = e.status, e.reason, e.body or ''
+                content_type = (e.headers or {}).get('Content-Type', 'application/json')
+            data = data.encode('utf8') if isinstance(data, str) else data
+            entry = {'status': status, 'reason': reason, 'headers': {'Content-Type': content_type}, 'body': data}
+            with self.lock:
+                self.responses[request_key(context, method, url, query_params)] = entry
+            return build_response(status, reason, entry['headers'], data, _preload_content)
+
+        api_client.rest_client.request = recording_request
+
+    def install_prometheus(self, executor, context_func):
+        request = executor.request
+
+        def recording_request(prom, query, evaluation_time=None):
+            result, size = request(prom, query, evaluation_time)
+            with self.lock:
+                self.prometheus[prometheus_key(context_func(), query)] = result
+            return result, size
+
+        executor.request = recording_request
+
+    def save(self):
+        with self.lock:
+            responses = dict(self.responses)
+            prometheus = dict(self.prometheus)
+            contexts = list(self.contexts)
+        tmp_path = f"{self.path}.tmp"
+        with zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr('manifest.json', json.dumps({
+                'version': ARCHIVE_VERSION,
+                'recorded_at': time.time(),
+                'contexts': contexts,
+                'active_context': contexts[0] if contexts else None,
+            }))
+            for key, entry in responses.items():
+                name = entry_name('api', key)
+                archive.writestr(f"{name}.json", json.dumps({
+                    'key': key, 'status': entry['status'], 'reason': entry['reason'], 'headers': entry['headers'],
+                }))
+                archive.writestr(f"{name}.body", entry['body'])
+            for key, result in prometheus.items():
+                archive.writestr(f"{entry_name('prometheus', key)}.json", json.dumps({'key': key, 'result': result}))
+        os.replace(tmp_path, self.path)
+        print(f"Recorded {len(responses)} API and {len(prometheus)} Prometheus responses to {self.path}")
+
+
+class Replayer:
+    """Serves API and Prometheus responses from an archive written by Recorder.
+
+    Requests that were never recorded get a 404, writes a 405, so the tabs
+    show their usual errors. Bodies are read from the archive on demand.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.archive = zipfile.ZipFile(path)
+        self.lock = threading.Lock()
+        manifest = json.loads(self.archive.read('manifest.json'))
+        if manifest.get('version') != ARCHIVE_VERSION:
+            raise ValueError(f"{path} is not a version {ARCHIVE_VERSION} recording")
+        self.contexts = manifest['contexts']
+        self.active_context = manifest['active_context']
+        self.names = set(self.archive.namelist())
+
+    def read(self, name):
+        with self.lock:
+            return self.archive.read(name)
+
+    def response(self, key, preload_content):
+        name = entry_name('api', key)
+        if f"{name}.json" not in self.names:
+            body = json.dumps({'kind': 'Status', 'apiVersion': 'v1', 'status': 'Failure',
+                               'message': 'not in recording', 'reason': 'NotFound', 'code': 404})
+            return build_response(404, 'Not Found', {'Content-Type': 'application/json'}, body.encode(),
+                                  preload_content)
+        entry = json.loads(self.read(f"{name}.json"))
+        return build_response(entry['status'], entry['reason'], entry['headers'], self.read(f"{name}.body"),
+                              preload_content)
+
+    def install(self, api_client, context):
+        def replay_request(method, url, query_params=None, headers=None, body=None, post_params=None,
+                           _preload_content=True, _request_timeout=None):
+            if method != 'GET':
+                raise ApiException(status=405, reason="Read-only replay")
+            if is_streaming(query_params):
+                # An empty stream right away; the watch's own backoff paces
+                # the retries and, unlike a sleep here, stops when told to
+                return build_response(200, 'OK', {'Content-Type': 'application/json'}, b'', _preload_content)
+            return self.response(request_key(context, method, url, query_params), _preload_content)
+
+        api_client.rest_client.request = replay_request
+
+    def install_prometheus(self, executor, context_func):
+        def replay_request(prom, query, evaluation_time=None):
+            name = f"{entry_name('prometheus', prometheus_key(context_func(), query))}.json"
+            if name not in self.names:
+                raise RuntimeError(f"Prometheus query not in recording: {query}")
+            data = self.read(name)
+            return json.loads(data)['result'], len(data)
+
+        executor.request = replay_request
+
+
+def _session():
+    if os.environ.get(REPLAY_ENV):
+        return Replayer(os.environ[REPLAY_ENV])
+    if os.environ.get(RECORD_ENV):
+        return Recorder(os.environ[RECORD_ENV])
+    return None
+
+
+session = _session()
+
+
+def is_replaying():
+    return isinstance(session, Replayer)
+
+
+def install(api_client, context):
+    if session:
+        session.install(api_client, context)
+
+
+def install_prometheus(executor, context_func):
+    if session:
+        session.install_prometheus(executor, context_func)
+
+
+def save():
+    if isinstance(session, Recorder):
+        session.save()
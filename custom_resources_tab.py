@@ -7,13 +7,15 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QTa
 from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QMetaObject, Q_ARG
 from PyQt5.QtGui import QColor
 from kubernetes import client
+from client_registry import api as registry_api
 import yaml
 from datetime import datetime, timezone
 import dateutil.parser
 from helper_custom_resources_tab.resources_info_dialog import ResourceInfoDialog
+from utils import iter_list_pages, list_all_pages
 
 class CustomResourcesTab(QWidget):
-    resource_loaded_signal = pyqtSignal(object)
+    resources_loaded_signal = pyqtSignal(list)
     table_update_signal = pyqtSignal(list)
     info_loaded_signal = pyqtSignal(str)
     show_loading_signal = pyqtSignal()
@@ -147,7 +149,7 @@ class CustomResourcesTab(QWidget):
         main_layout.addWidget(main_splitter)
 
         # Connect signals
-        self.resource_loaded_signal.connect(self.add_resource_to_list)
+        self.resources_loaded_signal.connect(self.add_resources_to_list)
         self.table_update_signal.connect(self.update_table)
         self.info_loaded_signal.connect(self.update_info)
         self.show_loading_signal.connect(self.loading_bar_right.show)
@@ -174,7 +176,7 @@ class CustomResourcesTab(QWidget):
         try:
             self.loading_bar_right.show()
             crd = self.resources[self.resource_list.currentItem().text()]
-            custom_api = client.CustomObjectsApi()
+            custom_api = registry_api(client.CustomObjectsApi)
 
             if namespace != 'Cluster-scoped':
                 custom_api.delete_namespaced_custom_object(
@@ -257,29 +259,26 @@ class CustomResourcesTab(QWidget):
             try:
                 QMetaObject.invokeMethod(self.loading_bar, "show", Qt.QueuedConnection)
                 if resource_type == "Custom Resources":
-                    api = client.ApiextensionsV1Api()
-                    items = api.list_custom_resource_definition().items
+                    list_func = registry_api(client.ApiextensionsV1Api).list_custom_resource_definition
                 elif resource_type == "Cluster Roles":
-                    api = client.RbacAuthorizationV1Api()
-                    items = api.list_cluster_role().items
+                    list_func = registry_api(client.RbacAuthorizationV1Api).list_cluster_role
                 elif resource_type == "Service Accounts":
-                    api = client.CoreV1Api()
-                    items = api.list_service_account_for_all_namespaces().items
+                    list_func = registry_api(client.CoreV1Api).list_service_account_for_all_namespaces
                 elif resource_type == "Roles":
-                    api = client.RbacAuthorizationV1Api()
-                    items = api.list_role_for_all_namespaces().items
+                    list_func = registry_api(client.RbacAuthorizationV1Api).list_role_for_all_namespaces
                 elif resource_type == "Cluster Role Bindings":
-                    api = client.RbacAuthorizationV1Api()
-                    items = api.list_cluster_role_binding().items
+                    list_func = registry_api(client.RbacAuthorizationV1Api).list_cluster_role_binding
                 elif resource_type == "Role Bindings":
-                    api = client.RbacAuthorizationV1Api()
-                    items = api.list_role_binding_for_all_namespaces().items
+                    list_func = registry_api(client.RbacAuthorizationV1Api).list_role_binding_for_all_namespaces
                 else:
-                    items = []
+                    list_func = None
 
-                for item in items:
-                    self.resources[item.metadata.name] = item
-                    self.resource_loaded_signal.emit(item)
+                # Stream the list in pages so large clusters start filling in right away
+                if list_func:
+                    for page in iter_list_pages(list_func):
+                        for item in page.items:
+                            self.resources[item.metadata.name] = item
+                        self.resources_loaded_signal.emit(page.items)
 
             except Exception as e:
                 print(f"Error loading resources: {e}")
@@ -288,8 +287,8 @@ class CustomResourcesTab(QWidget):
 
         threading.Thread(target=background_load, daemon=True).start()
 
-    def add_resource_to_list(self, resource):
-        self.resource_list.addItem(resource.metadata.name)
+    def add_resources_to_list(self, resources):
+        self.resource_list.addItems([resource.metadata.name for resource in resources])
 
     def filter_resources(self, text):
         for i in range(self.resource_list.count()):
@@ -309,14 +308,18 @@ class CustomResourcesTab(QWidget):
                 self.show_loading_signal.emit()
                 resource_type = self.resource_type_combo.currentText()
                 if resource_type == "Custom Resources":
-                    custom_api = client.CustomObjectsApi()
-                    items = custom_api.list_cluster_custom_object(
+                    custom_api = registry_api(client.CustomObjectsApi)
+                    # Paged like the other LISTs; raw pages answer the same
+                    # item.get('metadata', {}) lookups as the plain dicts did
+                    items = list_all_pages(
+                        custom_api.list_cluster_custom_object,
                         group=resource.spec.group,
                         version=resource.spec.versions[0].name,
-                        plural=resource.spec.names.plural
-                    )['items']
+                        plural=resource.spec.names.plural,
+                        raw=True
+                    )
                 elif resource_type == "Service Accounts":
-                    api = client.CoreV1Api()
+                    api = registry_api(client.CoreV1Api)
                     items = api.list_namespaced_service_account(resource.metadata.namespace).items
                 else:
                     items = [resource]  # For other types, just use the resource itself
@@ -391,7 +394,7 @@ class CustomResourcesTab(QWidget):
         def background_load():
             try:
                 if resource_type == 'Secret':
-                    api = client.CoreV1Api()
+                    api = registry_api(client.CoreV1Api)
                     resource = api.read_namespaced_secret(name, namespace)
                 else:
                     return
@@ -410,7 +413,7 @@ class CustomResourcesTab(QWidget):
                 resource_type = self.resource_type_combo.currentText()
                 if resource_type == "Custom Resources":
                     crd = self.resources[self.resource_list.currentItem().text()]
-                    custom_api = client.CustomObjectsApi()
+                    custom_api = registry_api(client.CustomObjectsApi)
                     if namespace != 'Cluster-scoped':
                         resource = custom_api.get_namespaced_custom_object(
                             group=crd.spec.group,
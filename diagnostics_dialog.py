@@ -0,0 +1,180 @@
+import json
+import time
+
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton, QTableWidget,
+                             QTableWidgetItem, QTextEdit, QSplitter, QFileDialog, QMessageBox, QHeaderView)
+
+import api_scheduler
+import api_tracing
+from prometheus_executor import cache_stats_text
+from refresh_scheduler import get_scheduler
+
+REFRESH_INTERVAL_MS = 2000
+ALL_TABS = "All tabs"
+GROUPINGS = {
+    "Tab and action": ("tab", "action", "service", "target", "method", "endpoint"),
+    "Endpoint": ("service", "target", "method", "endpoint"),
+    "Tab": ("tab", "service"),
+}
+FIELD_TITLES = {"tab": "Tab", "action": "Action", "service": "Service", "target": "Target", "method": "Method",
+                "endpoint": "Endpoint"}
+STAT_COLUMNS = [("calls", "Calls"), ("errors", "Errors"), ("p50_ms", "p50 ms"), ("p90_ms", "p90 ms"),
+                ("p99_ms", "p99 ms"), ("max_ms", "Max ms"), ("bytes", "KiB")]
+
+
+class NumericItem(QTableWidgetItem):
+    def __init__(self, value, text):
+        super().__init__(text)
+        self.value = value
+        self.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+
+    def __lt__(self, other):
+        return self.value < getattr(other, 'value', 0)
+
+
+class DiagnosticsDialog(QDialog):
+    """Traced API and Prometheus calls per tab and action, plus the schedulers' counters."""
+
+    def __init__(self, gui, parent=None):
+        super().__init__(parent)
+        self.gui = gui
+        self.setWindowTitle("Diagnostics")
+        self.resize(1200, 700)
+
+        layout = QVBoxLayout(self)
+
+        controls = QHBoxLayout()
+        self.totals_label = QLabel()
+        controls.addWidget(self.totals_label)
+        controls.addStretch()
+        controls.addWidget(QLabel("Group by:"))
+        self.grouping_combo = QComboBox()
+        self.grouping_combo.addItems(list(GROUPINGS))
+        self.grouping_combo.currentTextChanged.connect(self.refresh)
+        controls.addWidget(self.grouping_combo)
+        controls.addWidget(QLabel("Tab:"))
+        self.tab_combo = QComboBox()
+        self.tab_combo.addItem(ALL_TABS)
+        self.tab_combo.currentTextChanged.connect(self.refresh)
+        controls.addWidget(self.tab_combo)
+        layout.addLayout(controls)
+
+        splitter = QSplitter(Qt.Vertical)
+        self.table = QTableWidget()
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setSortingEnabled(True)
+        splitter.addWidget(self.table)
+        self.stats_text = QTextEdit()
+        self.stats_text.setReadOnly(True)
+        self.stats_text.setLineWrapMode(QTextEdit.NoWrap)
+        splitter.addWidget(self.stats_text)
+        splitter.setSizes([500, 200])
+        layout.addWidget(splitter)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        for text, slot in (("Refresh", self.refresh), ("Clear", self.clear), ("Export JSON...", self.export_json),
+                           ("Close", self.close)):
+            button = QPushButton(text)
+            button.clicked.connect(slot)
+            buttons.addWidget(button)
+        layout.addLayout(buttons)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.refresh_timer.start(REFRESH_INTERVAL_MS)
+
+    def hideEvent(self, event):
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        calls = api_tracing.tracer.calls()
+        self.update_tab_filter(calls)
+        tab = self.tab_combo.currentText()
+        if tab != ALL_TABS:
+            calls = [call for call in calls if call.tab == tab]
+        group_by = GROUPINGS[self.grouping_combo.currentText()]
+        self.show_summary(group_by, api_tracing.tracer.summary(group_by, calls))
+
+        tracer = api_tracing.tracer
+        oldest = f", oldest {time.time() - calls[0].started:.0f}s ago" if calls else ""
+        self.totals_label.setText(f"{len(calls)} calls shown, {tracer.dropped} dropped from a buffer of "
+                                  f"{tracer.capacity}{oldest}")
+        self.stats_text.setPlainText(self.stats_report())
+
+    def update_tab_filter(self, calls):
+        known = [self.tab_combo.itemText(i) for i in range(1, self.tab_combo.count())]
+        tabs = sorted(set(known) | {call.tab for call in calls})
+        if tabs == known:
+            return
+        current = self.tab_combo.currentText()
+        self.tab_combo.blockSignals(True)
+        self.tab_combo.clear()
+        self.tab_combo.addItems([ALL_TABS] + tabs)
+        self.tab_combo.setCurrentText(current)
+        self.tab_combo.blockSignals(False)
+
+    def show_summary(self, group_by, rows):
+        self.table.setSortingEnabled(False)
+        self.table.clear()
+        self.table.setColumnCount(len(group_by) + len(STAT_COLUMNS))
+        self.table.setHorizontalHeaderLabels([FIELD_TITLES[field] for field in group_by] +
+                                             [title for _, title in STAT_COLUMNS])
+        self.table.setRowCount(len(rows))
+        for row_index, row in enumerate(rows):
+            for column, field in enumerate(group_by):
+                self.table.setItem(row_index, column, QTableWidgetItem(row[field] or ""))
+            for column, (field, _) in enumerate(STAT_COLUMNS, len(group_by)):
+                value = row[field]
+                if field == "bytes":
+                    text = f"{value / 1024:.1f}"
+                elif field.endswith("_ms"):
+                    text = f"{value:.1f}"
+                else:
+                    text = str(value)
+                self.table.setItem(row_index, column, NumericItem(value, text))
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(group_by.index("endpoint") if "endpoint" in group_by else 0,
+                                    QHeaderView.Stretch)
+        self.table.setSortingEnabled(True)
+
+    def scheduler_stats(self):
+        return {
+            'api_budget': api_scheduler.stats(),
+            'watches': self.gui.informer_cache.watch_stats(),
+            'refresh_jobs': get_scheduler().stats(),
+        }
+
+    def stats_report(self):
+        stats = self.scheduler_stats()
+        return "\n\n".join([
+            f"API budget per cluster:\n{json.dumps(stats['api_budget'], indent=2, default=str)}",
+            f"Informer watches:\n{json.dumps(stats['watches'], indent=2, default=str)}",
+            f"Refresh jobs:\n{json.dumps(stats['refresh_jobs'], indent=2, default=str)}",
+            f"Prometheus {cache_stats_text()}",
+        ])
+
+    def clear(self):
+        api_tracing.tracer.clear()
+        self.refresh()
+
+    def export_json(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export API trace", "kubenexus-api-trace.json",
+                                              "JSON files (*.json)")
+        if not path:
+            return
+        try:
+            count = api_tracing.export_json(path, self.scheduler_stats())
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to export the API trace: {str(e)}")
+            return
+        self.gui.statusBar().showMessage(f"Exported {count} API calls to {path}", 5000)
@@ -0,0 +1,135 @@
+import json
+import threading
+from datetime import datetime, timezone
+
+from kubernetes.config import kube_config
+from kubernetes.config.dateutil import parse_rfc3339
+from kubernetes.config.exec_provider import ExecProvider
+
+# Start fetching a new token this long before the current one expires. The
+# kubeconfig loader treats tokens as expired five minutes early, so refreshing
+# before that keeps its refresh hook from ever waiting on the plugin.
+REFRESH_AHEAD_SECONDS = 360
+
+
+class CachedCredential:
+    def __init__(self, status):
+        self.status = status
+        expiration = status.get('expirationTimestamp')
+        self.expiry = parse_rfc3339(expiration) if expiration else None
+
+    def seconds_left(self):
+        if self.expiry is None:
+            return float('inf')
+        return (self.expiry - datetime.now(timezone.utc)).total_seconds()
+
+
+class ExecCredentialCache:
+    """Process-wide cache of kubeconfig exec-plugin results.
+
+    Keyed by the plugin invocation (command, args, env, apiVersion) and, for
+    plugins given the cluster's details (provideClusterInfo), that cluster,
+    so every ApiClient and thread using the same user on the same cluster
+    shares one token. A token is
+    reused until REFRESH_AHEAD_SECONDS before its expirationTimestamp, at
+    which point a background timer re-runs the plugin; callers only block on
+    the plugin when there is no usable token at all. Results without an
+    expirationTimestamp are kept for the life of the process.
+    """
+
+    def __init__(self, refresh_ahead=REFRESH_AHEAD_SECONDS):
+        self.refresh_ahead = refresh_ahead
+        self.credentials = {}
+        self.key_locks = {}
+        self.timers = {}
+        self.lock = threading.Lock()
+        self.runs = 0
+        self.hits = 0
+
+    def key_lock(self, key):
+        with self.lock:
+            return self.key_locks.setdefault(key, threading.Lock())
+
+    def get(self, key, run_plugin):
+        with self.lock:
+            credential = self.credentials.get(key)
+            if credential is not None and credential.seconds_left() > 0:
+                self.hits += 1
+                return credential.status
+        # One plugin run per key at a time; whoever waited reuses its result
+        with self.key_lock(key):
+            with self.lock:
+                credential = self.credentials.get(key)
+                if credential is not None and credential.seconds_left() > 0:
+                    self.hits += 1
+                    return credential.status
+            return self.refresh(key, run_plugin).status
+
+    def refresh(self, key, run_plugin):
+        credential = CachedCredential(run_plugin())
+        with self.lock:
+            self.runs += 1
+            self.credentials[key] = credential
+            self.schedule_refresh(key, credential, run_plugin)
+        return credential
+
+    def schedule_refresh(self, key, credential, run_plugin):
+        timer = self.timers.pop(key, None)
+        if timer:
+            timer.cancel()
+        if credential.expiry is None:
+            return
+        # Short-lived tokens are refreshed halfway through their lifetime
+        seconds_left = credential.seconds_left()
+        delay = max(seconds_left - min(self.refresh_ahead, seconds_left / 2), 1)
+        timer = threading.Timer(delay, self.background_refresh, args=(key, run_plugin))
+        timer.daemon = True
+        self.timers[key] = timer
+        timer.start()
+
+    def background_refresh(self, key, run_plugin):
+        try:
+            with self.key_lock(key):
+                self.refresh(key, run_plugin)
+        except Exception as e:
+            # The current token stays in use; the next caller after it
+            # expires runs the plugin in the foreground and sees the error
+            print(f"Background refresh of exec credential failed: {e}")
+
+    def invalidate(self):
+        with self.lock:
+            for timer in self.timers.values():
+                timer.cancel()
+            self.timers.clear()
+            self.credentials.clear()
+
+    def stop(self):
+        with self.lock:
+            for timer in self.timers.values():
+                timer.cancel()
+            self.timers.clear()
+
+
+credential_cache = ExecCredentialCache()
+
+
+class CachingExecProvider(ExecProvider):
+    def run(self, previous_response=None):
+        env = sorted((name, value) for name, value in self.env.items() if name != 'KUBERNETES_EXEC_INFO')
+        key = [self.api_version, self.args, env, self.cwd]
+        # With provideClusterInfo the plugin is told which cluster it is for
+        # (in KUBERNETES_EXEC_INFO, left out above), so its token is too
+        cluster = getattr(self, 'cluster', None)
+        if cluster:
+            key.append(json.dumps(cluster, sort_keys=True, default=str))
+        key = json.dumps(key)
+        return credential_cache.get(key, lambda: ExecProvider.run(self, previous_response))
+
+
+def install():
+    """Route the kubeconfig loader's exec plugin calls through the cache.
+
+    The kubernetes client has no hook for this, so its module-level
+    ExecProvider reference is replaced; call once before loading configs.
+    """
+    kube_config.ExecProvider = CachingExecProvider
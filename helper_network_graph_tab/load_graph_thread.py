@@ -1,6 +1,9 @@
 from PyQt5.QtCore import QThread, pyqtSignal
 from kubernetes import client
+from client_registry import api as registry_api
 from pyvis.network import Network
+from utils import list_all_pages
+from raw_api import MetadataLister, mapping_items
 import logging
 
 logger = logging.getLogger(__name__)
@@ -9,10 +12,22 @@ class LoadGraphThread(QThread):
     graph_loaded = pyqtSignal(object, dict)
     error_occurred = pyqtSignal(str)
 
-    def __init__(self, namespace, graph_type):
+    def __init__(self, namespace, graph_type, informer_cache=None):
         super().__init__()
         self.namespace = namespace
         self.graph_type = graph_type
+        self.informer_cache = informer_cache
+
+    def list_items(self, kind, list_func, *args, raw=False):
+        # Reuse the Resources tab's informer store when it is already synced,
+        # without starting one just for a graph
+        if self.informer_cache:
+            namespaces = list(args) if args else None
+            items = self.informer_cache.peek(kind, namespaces)
+            if items is not None:
+                return items
+        # raw=True skips building models for graphs that only read fields
+        return list_all_pages(list_func, *args, raw=raw)
 
     def run(self):
         try:
@@ -33,12 +48,12 @@ class LoadGraphThread(QThread):
             self.error_occurred.emit(str(e))
 
     def load_pvc_and_storage_class_graph(self):
-        v1 = client.CoreV1Api()
-        storage_v1 = client.StorageV1Api()
+        v1 = registry_api(client.CoreV1Api)
+        storage_v1 = registry_api(client.StorageV1Api)
 
-        pvcs = v1.list_persistent_volume_claim_for_all_namespaces().items
-        pvs = v1.list_persistent_volume().items
-        storage_classes = storage_v1.list_storage_class().items
+        pvcs = self.list_items("PVC", v1.list_persistent_volume_claim_for_all_namespaces)
+        pvs = self.list_items("PV", v1.list_persistent_volume)
+        storage_classes = list_all_pages(storage_v1.list_storage_class)
 
         network = Network(notebook=False, directed=True)
         k8s_objects = {}
@@ -66,14 +81,14 @@ class LoadGraphThread(QThread):
         self.graph_loaded.emit(network, k8s_objects)
 
     def load_rbac_visualization(self):
-        v1 = client.CoreV1Api()
-        rbac_v1 = client.RbacAuthorizationV1Api()
+        v1 = registry_api(client.CoreV1Api)
+        rbac_v1 = registry_api(client.RbacAuthorizationV1Api)
 
-        service_accounts = v1.list_service_account_for_all_namespaces().items
-        roles = rbac_v1.list_role_for_all_namespaces().items
-        role_bindings = rbac_v1.list_role_binding_for_all_namespaces().items
-        cluster_roles = rbac_v1.list_cluster_role().items
-        cluster_role_bindings = rbac_v1.list_cluster_role_binding().items
+        service_accounts = list_all_pages(v1.list_service_account_for_all_namespaces)
+        roles = list_all_pages(rbac_v1.list_role_for_all_namespaces)
+        role_bindings = list_all_pages(rbac_v1.list_role_binding_for_all_namespaces)
+        cluster_roles = list_all_pages(rbac_v1.list_cluster_role)
+        cluster_role_bindings = list_all_pages(rbac_v1.list_cluster_role_binding)
 
         network = Network(notebook=False, directed=True)
         k8s_objects = {}
@@ -154,15 +169,16 @@ class LoadGraphThread(QThread):
         return None
 
     def load_namespace_overview(self):
-        v1 = client.CoreV1Api()
-        apps_v1 = client.AppsV1Api()
+        v1 = registry_api(client.CoreV1Api)
+        apps_v1 = registry_api(client.AppsV1Api)
 
-        pods = v1.list_namespaced_pod(self.namespace).items
-        services = v1.list_namespaced_service(self.namespace).items
-        deployments = apps_v1.list_namespaced_deployment(self.namespace).items
-        statefulsets = apps_v1.list_namespaced_stateful_set(self.namespace).items
-        secrets = v1.list_namespaced_secret(self.namespace).items
-        configmaps = v1.list_namespaced_config_map(self.namespace).items
+        pods = self.list_items("Pods", v1.list_namespaced_pod, self.namespace)
+        services = self.list_items("Services", v1.list_namespaced_service, self.namespace)
+        deployments = self.list_items("Deployments", apps_v1.list_namespaced_deployment, self.namespace)
+        statefulsets = self.list_items("StatefulSets", apps_v1.list_namespaced_stateful_set, self.namespace)
+        # Only names are drawn, so skip the secret and configmap payloads
+        secrets = list_all_pages(MetadataLister(v1.api_client, "secrets"), self.namespace)
+        configmaps = list_all_pages(MetadataLister(v1.api_client, "configmaps"), self.namespace)
 
         network = Network(notebook=False, directed=True)
         k8s_objects = {}
@@ -249,11 +265,11 @@ class LoadGraphThread(QThread):
         self.graph_loaded.emit(network, k8s_objects)
 
     def load_network_policies(self):
-        v1 = client.CoreV1Api()
-        networking_v1 = client.NetworkingV1Api()
+        v1 = registry_api(client.CoreV1Api)
+        networking_v1 = registry_api(client.NetworkingV1Api)
 
-        network_policies = networking_v1.list_namespaced_network_policy(self.namespace).items
-        pods = v1.list_namespaced_pod(self.namespace).items
+        network_policies = list_all_pages(networking_v1.list_namespaced_network_policy, self.namespace)
+        pods = self.list_items("Pods", v1.list_namespaced_pod, self.namespace)
 
         network = Network(notebook=False, directed=True)
         k8s_objects = {}
@@ -276,10 +292,10 @@ class LoadGraphThread(QThread):
         self.graph_loaded.emit(network, k8s_objects)
 
     def load_node_to_pod_mapping(self):
-        v1 = client.CoreV1Api()
+        v1 = registry_api(client.CoreV1Api)
 
-        nodes = v1.list_node().items
-        pods = v1.list_pod_for_all_namespaces().items
+        nodes = self.list_items("Nodes", v1.list_node, raw=True)
+        pods = self.list_items("Pods", v1.list_pod_for_all_namespaces, raw=True)
 
         network = Network(notebook=False, directed=True)
         k8s_objects = {}
@@ -300,14 +316,14 @@ class LoadGraphThread(QThread):
         self.graph_loaded.emit(network, k8s_objects)
 
     def load_cluster_level_network_graph(self):
-        v1 = client.CoreV1Api()
-        apps_v1 = client.AppsV1Api()
-        networking_v1 = client.NetworkingV1Api()
+        v1 = registry_api(client.CoreV1Api)
+        apps_v1 = registry_api(client.AppsV1Api)
+        networking_v1 = registry_api(client.NetworkingV1Api)
 
-        pods = v1.list_pod_for_all_namespaces().items
-        services = v1.list_service_for_all_namespaces().items
-        nodes = v1.list_node().items
-        ingresses = networking_v1.list_ingress_for_all_namespaces().items
+        pods = self.list_items("Pods", v1.list_pod_for_all_namespaces, raw=True)
+        services = self.list_items("Services", v1.list_service_for_all_namespaces, raw=True)
+        nodes = self.list_items("Nodes", v1.list_node, raw=True)
+        ingresses = list_all_pages(networking_v1.list_ingress_for_all_namespaces)
 
         network = Network(notebook=False, directed=True)
         k8s_objects = {}
@@ -336,9 +352,13 @@ class LoadGraphThread(QThread):
             k8s_objects[ingress.metadata.name] = ingress
 
         # Add edges
+        pod_labels = [(pod, set(mapping_items(pod.metadata.labels))) for pod in pods]
         for service in services:
-            for pod in pods:
-                if service.spec.selector and all(item in pod.metadata.labels.items() for item in service.spec.selector.items()):
+            selector = mapping_items(service.spec.selector)
+            if not selector:
+                continue
+            for pod, labels in pod_labels:
+                if all(item in labels for item in selector):
                     network.add_edge(service.metadata.name, pod.metadata.name, title="Selects")
 
         for ingress in ingresses:
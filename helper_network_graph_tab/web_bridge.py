@@ -1,6 +1,8 @@
 import json
 from PyQt5.QtCore import QObject, pyqtSlot
 from .date_time_encoder import DateTimeEncoder
+from client_registry import registry as client_registry
+from raw_api import RawObject
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,7 +17,11 @@ class WebBridge(QObject):
         k8s_object = self.tab.k8s_objects.get(node_id)
         if k8s_object:
             try:
-                obj_dict = k8s_object.to_dict()
+                # Objects come raw from a LIST or as models from the informer
+                # cache; show both in the API's own camelCase JSON
+                if isinstance(k8s_object, RawObject):
+                    k8s_object = k8s_object.to_dict()
+                obj_dict = client_registry.api_client().sanitize_for_serialization(k8s_object)
                 return json.dumps(obj_dict, indent=2, cls=DateTimeEncoder)
             except Exception as e:
                 logger.error(f"Error serializing object: {e}")
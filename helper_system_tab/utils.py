@@ -1,10 +1,9 @@
 
 import os
-import psutil
 from PyQt5.QtWidgets import (QWidget, QInputDialog, QFileSystemModel, QVBoxLayout, QHBoxLayout, QTabWidget, QTreeWidget, QTreeWidgetItem,
                              QLabel, QPushButton, QLineEdit, QTableWidget, QTableWidgetItem, QHeaderView, QSplitter, QStyle,
                              QMenu, QAction, QMessageBox, QApplication, QFrame, QTextEdit, QDialog, QDialogButtonBox)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QMimeData, QSize, QUrl
+from PyQt5.QtCore import Qt, QMimeData, QSize, QUrl
 from PyQt5.QtGui import QDrag, QFont, QSyntaxHighlighter, QTextCharFormat, QTextCursor, QColor
 from pygments.lexers import get_lexer_for_filename
 from pygments.formatters import BBCodeFormatter
@@ -40,18 +39,3 @@ class FileContentViewer(QTextEdit):
         except:
             pass  # If no lexer is found, no syntax highlighting will be applied
 
-
-
-class SystemInfoThread(QThread):
-    update_signal = pyqtSignal(dict)
-
-    def run(self):
-        while True:
-            info = {
-                'cpu': psutil.cpu_percent(interval=1),
-                'memory': psutil.virtual_memory().percent,
-                'disk': psutil.disk_usage('/').percent
-            }
-            self.update_signal.emit(info)
-            self.sleep(1)
-
@@ -0,0 +1,21 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+from utils import list_all_pages
+
+
+class NamespaceListWorker(QThread):
+    """Lists namespace names off the GUI thread to revalidate a cached list."""
+    fetched = pyqtSignal(str, list)  # context, namespace names
+    failed = pyqtSignal(str)
+
+    def __init__(self, v1, context):
+        super().__init__()
+        self.v1 = v1
+        self.context = context
+
+    def run(self):
+        try:
+            namespaces = [ns.metadata.name for ns in list_all_pages(self.v1.list_namespace)]
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.fetched.emit(self.context, namespaces)
@@ -0,0 +1,48 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+from resource_updaters import fetch_resources, FetchCancelled
+from multi_cluster import fetch_aggregated
+from api_scheduler import request_scope
+
+
+class ResourceFetchWorker(QThread):
+    """Lists one resource kind off the GUI thread and hands back table rows.
+
+    Results carry the generation they were requested for so the tab can drop
+    anything that was superseded while the fetch was in flight.
+    """
+    fetched = pyqtSignal(int, str, list, list)  # generation, resource type, headers, rows
+    page_fetched = pyqtSignal(int, str, list, list, int)  # ..., rows loaded so far
+    failed = pyqtSignal(int, str)
+
+    def __init__(self, gui, generation, resource_type, namespaces, ctx, contexts=None):
+        super().__init__()
+        self.gui = gui
+        self.generation = generation
+        self.resource_type = resource_type
+        self.namespaces = namespaces
+        self.ctx = ctx
+        self.contexts = contexts
+        self.ctx.on_rows = self.emit_page
+
+    def emit_page(self, headers, rows, loaded):
+        if not self.ctx.is_cancelled():
+            self.page_fetched.emit(self.generation, self.resource_type, headers, rows, loaded)
+
+    def run(self):
+        try:
+            with request_scope(self.ctx.priority, self.ctx.check):
+                if self.contexts:
+                    headers, rows = fetch_aggregated(self.gui, self.resource_type, self.contexts, self.namespaces, self.ctx)
+                else:
+                    headers, rows = fetch_resources(self.gui, self.resource_type, self.namespaces, self.ctx)
+        except FetchCancelled:
+            return
+        except Exception as e:
+            if not self.ctx.is_cancelled():
+                self.failed.emit(self.generation, str(e))
+            return
+        if not self.ctx.is_cancelled():
+            self.fetched.emit(self.generation, self.resource_type, headers, rows)
+
+    def cancel(self):
+        self.ctx.cancel()
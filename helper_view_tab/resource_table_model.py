@@ -0,0 +1,180 @@
+from collections import namedtuple
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QBrush, QColor, QFont
+
+TableCell = namedtuple("TableCell", ["text", "foreground", "background"], defaults=(None, None))
+
+
+class ResourceTableModel(QAbstractTableModel):
+    """Table of resources keyed by (namespace, name).
+
+    update_rows() diffs the incoming rows against the current ones and only
+    emits insert/remove/dataChanged for what actually changed, so selection
+    and scroll position survive a refresh. While `stale` is set (rows restored
+    from an on-disk snapshot) every cell is drawn greyed out in italics.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.headers = []
+        self.keys = []
+        self.rows = []
+        self.row_index = {}
+        self.stale = False
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        cells = self.rows[index.row()]
+        if index.column() >= len(cells):
+            return None
+        cell = cells[index.column()]
+        if role == Qt.DisplayRole:
+            return cell.text
+        elif self.stale and role == Qt.ForegroundRole:
+            return QBrush(QColor("gray"))
+        elif self.stale and role == Qt.FontRole:
+            font = QFont()
+            font.setItalic(True)
+            return font
+        elif role == Qt.ForegroundRole and cell.foreground is not None:
+            return QBrush(QColor(cell.foreground))
+        elif role == Qt.BackgroundRole and cell.background is not None:
+            return QBrush(QColor(cell.background))
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section < len(self.headers):
+            return self.headers[section]
+        return None
+
+    def key_for_row(self, row):
+        return self.keys[row]
+
+    def row_for_key(self, key):
+        return self.row_index.get(key, -1)
+
+    def set_stale(self, stale):
+        if stale == self.stale:
+            return
+        self.stale = stale
+        if self.rows:
+            self.emit_changed(list(range(len(self.rows))))
+
+    def clear(self):
+        self.beginResetModel()
+        self.stale = False
+        self.headers = []
+        self.keys = []
+        self.rows = []
+        self.row_index = {}
+        self.endResetModel()
+
+    def set_headers(self, headers):
+        headers = list(headers)
+        if headers == self.headers:
+            return
+        # A different column layout means a different resource kind, so
+        # there is nothing worth diffing against.
+        self.beginResetModel()
+        self.headers = headers
+        self.keys = []
+        self.rows = []
+        self.row_index = {}
+        self.endResetModel()
+
+    def emit_changed(self, changed):
+        last_column = max(len(self.headers) - 1, 0)
+        changed.sort()
+        i = 0
+        while i < len(changed):
+            first = last = changed[i]
+            i += 1
+            while i < len(changed) and changed[i] == last + 1:
+                last = changed[i]
+                i += 1
+            self.dataChanged.emit(self.index(first, 0), self.index(last, last_column))
+
+    def merge_rows(self, rows):
+        """Upsert a partial batch of rows without removing anything.
+
+        Used while a paginated LIST is still streaming in; the final
+        update_rows() call drops whatever did not come back.
+        """
+        changed = []
+        new_rows = []
+        for key, cells in rows:
+            cells = tuple(cells)
+            row = self.row_index.get(key)
+            if row is None:
+                new_rows.append((key, cells))
+            elif self.rows[row] != cells:
+                self.rows[row] = cells
+                changed.append(row)
+        self.emit_changed(changed)
+        if new_rows:
+            first = len(self.rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+            for key, cells in new_rows:
+                self.row_index[key] = len(self.keys)
+                self.keys.append(key)
+                self.rows.append(cells)
+            self.endInsertRows()
+
+    def update_rows(self, rows):
+        """Apply a full snapshot of [(key, [TableCell, ...]), ...]."""
+        rows = [(key, tuple(cells)) for key, cells in rows]
+        incoming = {key for key, _ in rows}
+
+        # Remove rows that are gone, back to front in contiguous runs
+        stale = [i for i, key in enumerate(self.keys) if key not in incoming]
+        removed = bool(stale)
+        while stale:
+            last = stale.pop()
+            first = last
+            while stale and stale[-1] == first - 1:
+                first = stale.pop()
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self.keys[first:last + 1]
+            del self.rows[first:last + 1]
+            self.endRemoveRows()
+        if removed:
+            self.row_index = {key: i for i, key in enumerate(self.keys)}
+
+        # Update surviving rows in place and work out where new rows go:
+        # right after the surviving row that precedes them in the snapshot.
+        changed = []
+        inserts = {}
+        insert_at = 0
+        for key, cells in rows:
+            row = self.row_index.get(key)
+            if row is None:
+                inserts.setdefault(insert_at, []).append((key, cells))
+                continue
+            if self.rows[row] != cells:
+                self.rows[row] = cells
+                changed.append(row)
+            insert_at = max(insert_at, row + 1)
+
+        self.emit_changed(changed)
+
+        # Insert back to front so earlier positions stay valid
+        for position in sorted(inserts, reverse=True):
+            batch = inserts[position]
+            self.beginInsertRows(QModelIndex(), position, position + len(batch) - 1)
+            self.keys[position:position] = [key for key, _ in batch]
+            self.rows[position:position] = [cells for _, cells in batch]
+            self.endInsertRows()
+
+        if inserts:
+            self.row_index = {key: i for i, key in enumerate(self.keys)}
@@ -0,0 +1,136 @@
+import threading
+from PyQt5.QtCore import QObject, pyqtSignal
+from watch_manager import WatchManager
+
+
+def list_function_for_kind(gui, kind):
+    # Secrets and ConfigMaps are deliberately not cached: their tables only
+    # need metadata, and holding every data payload in memory is not worth it.
+    if kind == "Pods":
+        return gui.v1.list_pod_for_all_namespaces
+    elif kind == "Deployments":
+        return gui.apps_v1.list_deployment_for_all_namespaces
+    elif kind == "StatefulSets":
+        return gui.apps_v1.list_stateful_set_for_all_namespaces
+    elif kind == "Jobs":
+        return gui.batch_v1.list_job_for_all_namespaces
+    elif kind == "CronJobs":
+        return gui.batch_v1.list_cron_job_for_all_namespaces
+    elif kind == "PVC":
+        return gui.v1.list_persistent_volume_claim_for_all_namespaces
+    elif kind == "PV":
+        return gui.v1.list_persistent_volume
+    elif kind == "Services":
+        return gui.v1.list_service_for_all_namespaces
+    elif kind == "Nodes":
+        return gui.v1.list_node
+    return None
+
+
+def object_key(obj):
+    return (obj.metadata.namespace or "", obj.metadata.name)
+
+
+class Informer:
+    def __init__(self, kind, list_func, cache):
+        self.kind = kind
+        self.list_func = list_func
+        self.cache = cache
+        self.store = {}
+        self.lock = threading.Lock()
+        self.has_synced = False
+        self.is_running = False
+
+    def start(self):
+        self.is_running = True
+        self.cache.watches.start(self.kind, self.list_func, self.on_relist, self.on_event)
+
+    def stop(self):
+        self.is_running = False
+        self.cache.watches.stop(self.kind)
+
+    def on_relist(self, items):
+        store = {object_key(obj): obj for obj in items}
+        with self.lock:
+            self.store = store
+        self.has_synced = True
+        if self.is_running:
+            self.cache.synced.emit(self.kind)
+
+    def on_event(self, event_type, obj):
+        key = object_key(obj)
+        with self.lock:
+            if event_type == 'DELETED':
+                self.store.pop(key, None)
+            else:
+                self.store[key] = obj
+        if self.is_running:
+            self.cache.delta.emit(self.kind, event_type, key[0], key[1])
+
+    def items(self, namespaces=None):
+        with self.lock:
+            objects = list(self.store.values())
+        if namespaces is None:
+            return sorted(objects, key=object_key)
+        order = {namespace: i for i, namespace in enumerate(namespaces)}
+        objects = [obj for obj in objects if obj.metadata.namespace in order]
+        return sorted(objects, key=lambda obj: (order[obj.metadata.namespace], obj.metadata.name))
+
+
+class InformerCache(QObject):
+    """Shared LIST+WATCH store per resource kind for the current cluster."""
+    synced = pyqtSignal(str)
+    delta = pyqtSignal(str, str, str, str)  # kind, event type, namespace, name
+
+    def __init__(self, gui):
+        super().__init__()
+        self.gui = gui
+        self.informers = {}
+        self.watches = WatchManager()
+        self.lock = threading.Lock()
+
+    def informer(self, kind):
+        with self.lock:
+            informer = self.informers.get(kind)
+            if informer is None:
+                list_func = list_function_for_kind(self.gui, kind)
+                if list_func is None:
+                    return None
+                informer = Informer(kind, list_func, self)
+                self.informers[kind] = informer
+                informer.start()
+            return informer
+
+    def items(self, kind, namespaces=None):
+        # Returns None until the informer has completed its first LIST, so
+        # callers can fall back to a direct LIST in the meantime.
+        informer = self.informer(kind)
+        if informer is None or not informer.has_synced:
+            return None
+        return informer.items(namespaces)
+
+    def peek(self, kind, namespaces=None):
+        """Like items(), but never starts an informer for `kind`.
+
+        For one-shot readers (graphs, the Nodes table) that should reuse a
+        store the Resources tab already keeps, not add a permanent watch.
+        """
+        with self.lock:
+            informer = self.informers.get(kind)
+        if informer is None or not informer.has_synced:
+            return None
+        return informer.items(namespaces)
+
+    def watch_stats(self):
+        """Per-kind reconnect, relist and bookmark counters of the watches."""
+        return self.watches.stats()
+
+    def reset(self):
+        with self.lock:
+            informers = list(self.informers.values())
+            self.informers = {}
+        for informer in informers:
+            informer.stop()
+
+    def stop(self):
+        self.reset()
@@ -10,8 +10,9 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QDialog, QDialogButtonBox, QMessageBox, QTableWidget,
                              QTableWidgetItem, QTextEdit, QComboBox, QGroupBox,
                              QHeaderView, QFileDialog, QSplitter)
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QSyntaxHighlighter, QTextCharFormat, QFont, QColor, QTextCursor
+from refresh_scheduler import get_scheduler
 
 # Disable SSL warnings
 requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
@@ -490,9 +491,8 @@ class JenkinsTab(QWidget):
             self.stream_dialog.resize(600, 400)
             self.stream_dialog.show()
             
-            self.stream_timer = QTimer()
-            self.stream_timer.timeout.connect(lambda: self.update_stream(build_number))
-            self.stream_timer.start(5000)  # Update every 5 seconds
+            get_scheduler().register("jenkins_stream", lambda: self.update_stream(build_number), 5000, self.stream_output)
+            self.stream_dialog.finished.connect(lambda: get_scheduler().unregister("jenkins_stream"))
     
     def update_stream(self, build_number):
         response = self.jenkins_request(f"{self.jenkins_url}job/OS_install/{build_number}/logText/progressiveText")
@@ -500,7 +500,7 @@ class JenkinsTab(QWidget):
             self.stream_output.append(response.text)
             self.stream_output.moveCursor(QTextCursor.End)
             if 'Finished: ' in response.text:
-                self.stream_timer.stop()
+                get_scheduler().unregister("jenkins_stream")
     
     def search_logs(self):
         search_text = self.search_input.text()
@@ -1,73 +1,82 @@
 import sys, json, signal, os, psutil
 import subprocess
-import threading
 import traceback
 import requests
-import time
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QTabWidget, QStyleFactory, QHBoxLayout,
     QComboBox, QLabel, QPushButton, QMessageBox, QDialog, QFrame
 )
 from PyQt5.QtGui import QPalette, QColor
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from kubernetes import client, config
 from view_tab import ViewTab
-from node_metrics_tab import NodeMetricsTab
-from pod_metrics_tab import PodMetricsTab
-from network_graph_tab import NetworkGraphTab
-from custom_resources_tab import CustomResourcesTab
-from github_insights_tab import GitHubInsightsTab
-from jenkins_tab import JenkinsTab
-from jira_insights_tab import JiraInsightsTab   
-from system_tab import SystemTab
 from helper_view_tab.create_resource_dialog import CreateResourceDialog
-import os
-from prometheus_api_client import PrometheusConnect
+from informer_cache import InformerCache
+from client_registry import registry as client_registry, api as registry_api
+from exec_credentials import credential_cache
+from prometheus_executor import cache_stats_text, get_executor, run_queries
+from prometheus_discovery import PrometheusDiscovery, READY as PROMETHEUS_READY, kill_port_forward_processes
+from startup_timing import timer as startup_timer
+from refresh_scheduler import get_scheduler, NORMAL
+import cluster_recording
+import api_tracing
+from diagnostics_dialog import DiagnosticsDialog
 from requests.exceptions import RequestException, Timeout
-import socket
-import subprocess
-import time
 
 os.environ['QT_MAC_WANTS_LAYER'] = '1'
 
 QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
 QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
+# Tabs using QtWebEngine are imported after the QApplication exists, which
+# QtWebEngine only allows when OpenGL contexts are shared
+QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+
+# Tab index -> (title, attribute, module, class). Each module is imported the
+# first time its tab is opened so startup doesn't load QtWebEngine, pyvis,
+# matplotlib, paramiko and the GitHub/JIRA clients.
+LAZY_TABS = {
+    1: ("Nodes", "node_metrics_tab", "node_metrics_tab", "NodeMetricsTab"),
+    2: ("Pods", "pod_metrics_tab", "pod_metrics_tab", "PodMetricsTab"),
+    3: ("CRs", "custom_resources_tab", "custom_resources_tab", "CustomResourcesTab"),
+    4: ("Network", "network_graph_tab", "network_graph_tab", "NetworkGraphTab"),
+    5: ("Github", "github_insights_tab", "github_insights_tab", "GitHubInsightsTab"),
+    6: ("JIRA", "jira_insights_tab", "jira_insights_tab", "JiraInsightsTab"),
+    7: ("Jenkins", "jenkins_tab", "jenkins_tab", "JenkinsTab"),
+    8: ("System", "system_tab", "system_tab", "SystemTab"),
+}
+
+CLUSTER_METRICS_QUERIES = {
+    'running_pods': "count(kube_pod_status_phase{phase='Running'})",
+    'total_pods': "count(kube_pod_info)",
+    'ready_nodes': "count(kube_node_status_condition{condition='Ready',status='true'})",
+    'total_nodes': "count(kube_node_info)",
+    'namespaces': "count(kube_namespace_created)",
+    'cpu_usage': "sum(rate(container_cpu_usage_seconds_total[5m]))",
+    'cpu_capacity': "sum(machine_cpu_cores)",
+    'memory_usage': "sum(container_memory_usage_bytes) / (1024*1024*1024)",
+    'memory_capacity': "sum(machine_memory_bytes) / (1024*1024*1024)",
+    # this might need to be adjusted based on your specific storage setup
+    'disk_usage': "sum(container_fs_usage_bytes) / (1024*1024*1024)",
+    'disk_capacity': "sum(container_fs_limit_bytes) / (1024*1024*1024)",
+}
+
+
+class ClusterMetricsWorker(QThread):
+    fetched = pyqtSignal(dict)
+
+    def __init__(self, prom):
+        super().__init__()
+        self.prom = prom
 
-PROMETHEUS_PORT = 29090
-
-
-
-def is_port_in_use(port):
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        return s.connect_ex(('localhost', port)) == 0
-
-def is_prometheus_on_port(port):
-    try:
-        response = requests.get(f"http://localhost:{port}/-/healthy")
-        return response.status_code == 200
-    except requests.RequestException:
-        return False
-
-def get_available_port(start_port=29090, max_port=29100):
-    for port in range(start_port, max_port + 1):
-        if not is_port_in_use(port):
-            return port
-    return None
-
+    def run(self):
+        self.fetched.emit(run_queries(self.prom, CLUSTER_METRICS_QUERIES, return_exceptions=True))
 
-def kill_port_forward_processes(pattern):
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-        try:
-            if 'kubectl' in proc.info['name'] and 'port-forward' in proc.info['cmdline'] and any(pattern in arg for arg in proc.info['cmdline']):
-                proc.terminate()
-                proc.wait(timeout=5)
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.TimeoutExpired):
-            pass
     
 class ClusterMetricsBar(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         print("Initializing ClusterMetricsBar...")
+        self.gui = parent
         self.layout = QHBoxLayout(self)
         self.layout.setContentsMargins(10, 5, 10, 5)
         self.layout.setSpacing(20)
@@ -89,123 +98,78 @@ class ClusterMetricsBar(QWidget):
         self.layout.addStretch()
 
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_metrics)
-        self.timer.start(30000)  # Update every 30 seconds
+        get_scheduler().register("cluster_metrics", self.update_metrics, 30000, self, NORMAL, asynchronous=True)
 
-        self.prometheus_url = None
         self.prom = None
-        self.prometheus_status = QLabel("Prometheus: Disconnected")
+        self.metrics_worker = None
+        self.prometheus_status = QLabel(f"Prometheus: {self.gui.prometheus_discovery.state}")
         self.layout.addWidget(self.prometheus_status)
-        
-        self.setup_prometheus_connection()
-    
-    def handle_metric_error(self):
-        for label in [self.pods_label, self.ram_label, self.cpu_label, self.disk_label, self.nodes_label, self.namespaces_label]:
-            label.setText(label.text().split(':')[0] + ": N/A")
-        
-        # Check if port forwarding is active and restart if not
-        self.setup_prometheus_connection()
 
-    def connect_to_prometheus(self):
-        try:
-            self.prom = PrometheusConnect(url=self.prometheus_url, disable_ssl=True)
-            print("Successfully connected to Prometheus")
-            self.update_metrics()
-        except Exception as e:
-            print(f"Error connecting to Prometheus: {e}")
-            self.prom = None
-    
-    def setup_prometheus_connection(self):
-        print("Setting up Prometheus connection...")
-        try:
-            self.prometheus_url = self.parent().get_prometheus_url()
-            if self.prometheus_url:
-                self.prom = PrometheusConnect(url=self.prometheus_url, disable_ssl=True)
-                print("Successfully connected to Prometheus")
-                self.prometheus_status.setText("Prometheus: Connected")
-            else:
-                print("Failed to get Prometheus URL")
-                self.prom = None
-                self.prometheus_status.setText("Prometheus: Unavailable")
-        except Exception as e:
-            print(f"Error connecting to Prometheus: {e}")
-            self.prom = None
-            self.prometheus_status.setText("Prometheus: Error")
+        self.gui.prometheus_discovery.state_changed.connect(self.on_prometheus_state_changed)
 
+    def on_prometheus_state_changed(self, state):
+        self.prometheus_status.setText(f"Prometheus: {state}")
+        self.prom = self.gui.prom if state == PROMETHEUS_READY else None
+        if self.prom:
+            self.update_metrics()
 
     def update_metrics(self):
         if not self.prom:
             self.handle_metric_error()
+            get_scheduler().finished("cluster_metrics")
+            return
+        if self.metrics_worker and self.metrics_worker.isRunning():
             return
 
+        self.metrics_worker = ClusterMetricsWorker(self.prom)
+        self.metrics_worker.fetched.connect(self.on_metrics_fetched)
+        self.metrics_worker.start()
+
+    def on_metrics_fetched(self, results):
+        get_scheduler().finished("cluster_metrics")
+        if not self.prom:
+            return
         try:
-            timeout = 10  # seconds
-
-            def query_with_timeout(query):
-                result = None
-                exception = None
-
-                def target():
-                    nonlocal result, exception
-                    try:
-                        result = self.prom.custom_query(query)
-                    except Exception as e:
-                        exception = e
-
-                thread = threading.Thread(target=target)
-                thread.start()
-                thread.join(timeout)
-
-                if thread.is_alive():
-                    print(f"Query timed out after {timeout} seconds")
-                    return None
-                if exception:
-                    raise exception
-                return result
+            if any(isinstance(result, requests.exceptions.ConnectionError) for result in results.values()):
+                raise requests.exceptions.ConnectionError()
+
+            def value(key):
+                result = results[key]
+                return None if isinstance(result, Exception) or not result else result[0]['value'][1]
 
             # Get pod count
-            running_pods = query_with_timeout("count(kube_pod_status_phase{phase='Running'})")
-            total_pods = query_with_timeout("count(kube_pod_info)")
-            if running_pods and total_pods:
-                self.pods_label.setText(f"Pods: {running_pods[0]['value'][1]}/{total_pods[0]['value'][1]}")
+            if value('running_pods') and value('total_pods'):
+                self.pods_label.setText(f"Pods: {value('running_pods')}/{value('total_pods')}")
 
             # Get node count
-            ready_nodes = query_with_timeout("count(kube_node_status_condition{condition='Ready',status='true'})")
-            total_nodes = query_with_timeout("count(kube_node_info)")
-            if ready_nodes and total_nodes:
-                self.nodes_label.setText(f"Nodes: {ready_nodes[0]['value'][1]}/{total_nodes[0]['value'][1]}")
+            if value('ready_nodes') and value('total_nodes'):
+                self.nodes_label.setText(f"Nodes: {value('ready_nodes')}/{value('total_nodes')}")
 
             # Get namespace count
-            namespaces = query_with_timeout("count(kube_namespace_created)")
-            if namespaces:
-                self.namespaces_label.setText(f"Namespaces: {namespaces[0]['value'][1]}")
+            if value('namespaces'):
+                self.namespaces_label.setText(f"Namespaces: {value('namespaces')}")
 
             # Get CPU usage
-            cpu_usage = query_with_timeout("sum(rate(container_cpu_usage_seconds_total[5m]))")
-            cpu_capacity = query_with_timeout("sum(machine_cpu_cores)")
-            if cpu_usage and cpu_capacity:
-                self.cpu_label.setText(f"CPU: {float(cpu_usage[0]['value'][1]):.2f}/{float(cpu_capacity[0]['value'][1]):.2f} cores")
+            if value('cpu_usage') and value('cpu_capacity'):
+                self.cpu_label.setText(f"CPU: {float(value('cpu_usage')):.2f}/{float(value('cpu_capacity')):.2f} cores")
 
             # Get memory usage
-            memory_usage = query_with_timeout("sum(container_memory_usage_bytes) / (1024*1024*1024)")
-            memory_capacity = query_with_timeout("sum(machine_memory_bytes) / (1024*1024*1024)")
-            if memory_usage and memory_capacity:
-                self.ram_label.setText(f"RAM: {float(memory_usage[0]['value'][1]):.2f}/{float(memory_capacity[0]['value'][1]):.2f} GB")
+            if value('memory_usage') and value('memory_capacity'):
+                self.ram_label.setText(f"RAM: {float(value('memory_usage')):.2f}/{float(value('memory_capacity')):.2f} GB")
 
-            # Get disk usage (this might need to be adjusted based on your specific storage setup)
-            disk_usage = query_with_timeout("sum(container_fs_usage_bytes) / (1024*1024*1024)")
-            disk_capacity = query_with_timeout("sum(container_fs_limit_bytes) / (1024*1024*1024)")
-            if disk_usage and disk_capacity:
-                self.disk_label.setText(f"Disk: {float(disk_usage[0]['value'][1]):.2f}/{float(disk_capacity[0]['value'][1]):.2f} GB")
+            # Get disk usage
+            if value('disk_usage') and value('disk_capacity'):
+                self.disk_label.setText(f"Disk: {float(value('disk_usage')):.2f}/{float(value('disk_capacity')):.2f} GB")
 
             for label in [self.pods_label, self.ram_label, self.cpu_label, self.disk_label, self.nodes_label, self.namespaces_label]:
                 label.setStyleSheet("color: #FFFFFF; font-size: 16px; font-weight: bold;")
 
+            self.prometheus_status.setToolTip(cache_stats_text())
             
         except requests.exceptions.ConnectionError:
             print("Connection to Prometheus failed, attempting to re-establish...")
-            self.setup_prometheus_connection()
+            self.handle_metric_error()
+            self.gui.prometheus_discovery.restart()
         except Exception as e:
             print(f"Error updating metrics: {e}")
             self.handle_metric_error()
@@ -213,7 +177,11 @@ class ClusterMetricsBar(QWidget):
     def handle_metric_error(self):
         for label in [self.pods_label, self.ram_label, self.cpu_label, self.disk_label, self.nodes_label, self.namespaces_label]:
             label.setText(label.text().split(':')[0] + ": N/A")
-        self.prometheus_status.setText("Prometheus: Disconnected")
+
+    def stop(self):
+        get_scheduler().unregister("cluster_metrics")
+        if self.metrics_worker and self.metrics_worker.isRunning():
+            self.metrics_worker.wait()
 
 class KubernetesGUI(QMainWindow):
     def __init__(self):
@@ -221,39 +189,48 @@ class KubernetesGUI(QMainWindow):
         print("Initializing KubernetesGUI...")
         self.setWindowTitle("Kubernetes Debugger Pro")
         self.showMaximized()
+        # Before any tab exists, so every Prometheus, GitHub, JIRA and Jenkins call is traced
+        api_tracing.install_requests()
+        self.diagnostics_dialog = None
 
+        self.active_context = None
         self.clusters = self.load_clusters()
         self.current_cluster = None
         self.pod_metrics_worker = None
         
         self.prometheus_port_forward_active = False
         self.prometheus_port_forward_process = None
+        self.informer_cache = InformerCache(self)
+        self.prom = None
+        self.prometheus_discovery = PrometheusDiscovery(self)
+        self.prometheus_discovery.state_changed.connect(self.on_prometheus_state_changed)
         
         # Initialize Kubernetes API clients
         self.load_current_cluster()
-        
-        try:
-            self.prom = self.initialize_prometheus_client()
-        except Exception as e:
-            print(f"Failed to initialize Prometheus client: {e}")
-            self.prom = None
 
         self.init_ui()
         self.set_dark_mode()
+
+        # Port-forwarding to Prometheus can take several seconds, or fail
+        # outright; the metrics widgets fill in once it reports Connected
+        self.prometheus_discovery.start()
         print("KubernetesGUI initialization complete")
-    
-    def initialize_prometheus_client(self):
-        prometheus_url = self.get_prometheus_url()
-        if prometheus_url:
-            try:
-                return PrometheusConnect(url=prometheus_url, disable_ssl=True)
-            except Exception as e:
-                print(f"Failed to initialize Prometheus client: {str(e)}")
-                # Handle the error appropriately
-                return None
-        else:
-            print("Failed to get Prometheus URL")
-            return None
+
+    def on_prometheus_state_changed(self, state):
+        if state != PROMETHEUS_READY:
+            self.prom = None
+            return
+        try:
+            from prometheus_api_client import PrometheusConnect
+            self.prom = PrometheusConnect(url=self.prometheus_discovery.url, disable_ssl=True)
+        except Exception as e:
+            print(f"Failed to initialize Prometheus client: {str(e)}")
+            self.prom = None
+            return
+        if self.node_metrics_tab:
+            self.node_metrics_tab.update_node_table()
+        if self.pod_metrics_tab:
+            self.pod_metrics_tab.update_pod_metrics()
 
 
     def init_ui(self):
@@ -268,25 +245,15 @@ class KubernetesGUI(QMainWindow):
         self.tab_widget.setDocumentMode(True)
         self.tab_widget.setElideMode(Qt.ElideRight)
 
-        self.view_tab = ViewTab(self)
-        self.node_metrics_tab = None
-        self.pod_metrics_tab = None
-        self.custom_resources_tab = None
-        self.network_graph_tab = None
-        self.github_insights_tab = None
-        self.jenkins_tab = None
-        self.jira_insights_tab = None
-        self.system_tab = None
-
+        with startup_timer.measure("Resources", 'init'):
+            self.view_tab = ViewTab(self)
+        startup_timer.watch_first_paint("Resources", self.view_tab)
         self.tab_widget.addTab(self.view_tab, "Resources")
-        self.tab_widget.addTab(QWidget(), "Nodes")
-        self.tab_widget.addTab(QWidget(), "Pods")
-        self.tab_widget.addTab(QWidget(), "CRs")
-        self.tab_widget.addTab(QWidget(), "Network")
-        self.tab_widget.addTab(QWidget(), "Github")
-        self.tab_widget.addTab(QWidget(), "JIRA")
-        self.tab_widget.addTab(QWidget(), "Jenkins")
-        self.tab_widget.addTab(QWidget(), "System")
+
+        for index in sorted(LAZY_TABS):
+            title, attribute, _, _ = LAZY_TABS[index]
+            setattr(self, attribute, None)
+            self.tab_widget.addTab(QWidget(), title)
 
         top_bar = self.create_top_bar()
         main_layout.addWidget(top_bar)
@@ -311,45 +278,15 @@ class KubernetesGUI(QMainWindow):
     def on_tab_changed(self, index):
         print(f"Changing to tab index: {index}")
         try:
-            if index == 1 and not self.node_metrics_tab:
-                self.node_metrics_tab = NodeMetricsTab(self)
-                self.tab_widget.removeTab(index)
-                self.tab_widget.insertTab(index, self.node_metrics_tab, "Nodes")
-                self.tab_widget.setCurrentIndex(index)
-            elif index == 2 and not self.pod_metrics_tab:
-                self.pod_metrics_tab = PodMetricsTab(self)
-                self.tab_widget.removeTab(index)
-                self.tab_widget.insertTab(index, self.pod_metrics_tab, "Pods")
-                self.tab_widget.setCurrentIndex(index)
-            elif index == 3 and not self.custom_resources_tab:
-                self.custom_resources_tab = CustomResourcesTab(self)
-                self.tab_widget.removeTab(index)
-                self.tab_widget.insertTab(index, self.custom_resources_tab, "CRs")
-                self.tab_widget.setCurrentIndex(index)
-            elif index == 4 and not self.network_graph_tab:
-                self.network_graph_tab = NetworkGraphTab(self)
-                self.tab_widget.removeTab(index)
-                self.tab_widget.insertTab(index, self.network_graph_tab, "Network")
-                self.tab_widget.setCurrentIndex(index)
-            elif index == 5 and not self.github_insights_tab:
-                self.github_insights_tab = GitHubInsightsTab(self)
+            if index in LAZY_TABS and not getattr(self, LAZY_TABS[index][1]):
+                title, attribute, module_name, class_name = LAZY_TABS[index]
+                tab_class = startup_timer.import_attribute(title, module_name, class_name)
+                with startup_timer.measure(title, 'init'):
+                    tab = tab_class(self)
+                setattr(self, attribute, tab)
+                startup_timer.watch_first_paint(title, tab, lambda: startup_timer.report([title]))
                 self.tab_widget.removeTab(index)
-                self.tab_widget.insertTab(index, self.github_insights_tab, "Github")
-                self.tab_widget.setCurrentIndex(index)
-            elif index == 6 and not self.jira_insights_tab:
-                self.jira_insights_tab = JiraInsightsTab(self)
-                self.tab_widget.removeTab(index)
-                self.tab_widget.insertTab(index, self.jira_insights_tab, "JIRA")
-                self.tab_widget.setCurrentIndex(index)
-            elif index == 7 and not self.jenkins_tab:
-                self.jenkins_tab = JenkinsTab(self)
-                self.tab_widget.removeTab(index)
-                self.tab_widget.insertTab(index, self.jenkins_tab, "Jenkins")
-                self.tab_widget.setCurrentIndex(index)
-            elif index == 8 and not self.system_tab:
-                self.system_tab = SystemTab(self)
-                self.tab_widget.removeTab(index)
-                self.tab_widget.insertTab(index, self.system_tab, "System")
+                self.tab_widget.insertTab(index, tab, title)
                 self.tab_widget.setCurrentIndex(index)
             print(f"Successfully changed to tab index: {index}")
         except Exception as e:
@@ -384,15 +321,22 @@ class KubernetesGUI(QMainWindow):
     def change_cluster(self, cluster_name):
         try:
             self.current_cluster = cluster_name
-            config.load_kube_config(context=cluster_name)
-            self.v1 = client.CoreV1Api()
-            self.apps_v1 = client.AppsV1Api()
-            self.batch_v1 = client.BatchV1Api()
-            self.custom_api = client.CustomObjectsApi()
+            # The old cluster's fetch must not touch the informers again
+            self.view_tab.cancel_resource_fetch()
+            # Prometheus is reached through the same local port-forward URL
+            # for every cluster, so cached results would leak across
+            get_executor().clear_cache()
+            # Reuses the context's warm client (pool, TLS, credentials) if
+            # it was used recently; only a new context loads the kubeconfig
+            client_registry.use(cluster_name)
+            self.bind_api_clients()
+            # Only now, so an informer created from here on binds the new clients
+            self.informer_cache.reset()
             
             if self.check_cluster_connectivity():
                 self.statusBar().showMessage(f"Connected to cluster: {cluster_name}")
                 self.enable_cluster_dependent_ui()
+                self.view_tab.on_cluster_changed()
             else:
                 self.statusBar().showMessage(f"Unable to connect to cluster: {cluster_name}")
                 self.show_cluster_unreachable_message()
@@ -441,6 +385,11 @@ class KubernetesGUI(QMainWindow):
         create_resource_button.clicked.connect(self.create_new_resource)
 
         top_layout.addWidget(create_resource_button, alignment=Qt.AlignRight)
+
+        diagnostics_button = QPushButton("Diagnostics")
+        diagnostics_button.setFixedSize(100, 30)
+        diagnostics_button.clicked.connect(self.show_diagnostics)
+        top_layout.addWidget(diagnostics_button, alignment=Qt.AlignRight)
         
         theme_label = QLabel("Theme:")
         self.theme_combo = QComboBox()
@@ -466,41 +415,62 @@ class KubernetesGUI(QMainWindow):
             resource_yaml = dialog.get_resource_yaml()
             self.view_tab.apply_new_resource(namespace, resource_yaml)
 
+    def show_diagnostics(self):
+        if self.diagnostics_dialog is None:
+            self.diagnostics_dialog = DiagnosticsDialog(self, self)
+        self.diagnostics_dialog.show()
+        self.diagnostics_dialog.raise_()
+        self.diagnostics_dialog.activateWindow()
+
     def set_auto_refresh(self, value):
-        # Implement auto-refresh logic here
-        pass
+        self.view_tab.set_auto_refresh(value)
 
     def load_clusters(self):
+        if cluster_recording.is_replaying():
+            self.active_context = cluster_recording.session.active_context
+            return {context: context for context in cluster_recording.session.contexts}
         try:
             config.load_kube_config()
-            contexts, _ = config.list_kube_config_contexts()
+            contexts, active_context = config.list_kube_config_contexts()
+            self.active_context = active_context['name'] if active_context else None
             return {context['name']: context['name'] for context in contexts}
         except config.config_exception.ConfigException as e:
             QMessageBox.critical(self, "Error", f"Failed to load Kubernetes config: {str(e)}")
             return {}
 
+    def bind_api_clients(self):
+        self.v1 = registry_api(client.CoreV1Api)
+        self.apps_v1 = registry_api(client.AppsV1Api)
+        self.batch_v1 = registry_api(client.BatchV1Api)
+        self.custom_api = registry_api(client.CustomObjectsApi)
+
+    def current_context_name(self):
+        return self.current_cluster or self.active_context
+
     def load_current_cluster(self):
         try:
-            if self.current_cluster:
-                config.load_kube_config(context=self.current_cluster)
-            else:
-                config.load_kube_config()
-            
-            self.v1 = client.CoreV1Api()
-            self.apps_v1 = client.AppsV1Api()
-            self.batch_v1 = client.BatchV1Api()
-            self.custom_api = client.CustomObjectsApi()
+            client_registry.use(self.current_context_name())
+            self.bind_api_clients()
         except config.config_exception.ConfigException as e:
             QMessageBox.critical(self, "Error", f"Failed to load cluster configuration: {str(e)}")
 
     
 
     def stop_all_threads(self):
+        get_scheduler().stop()
+        self.prometheus_discovery.stop()
+        self.cluster_metrics_bar.stop()
         if self.pod_metrics_worker and self.pod_metrics_worker.isRunning():
             self.pod_metrics_worker.stop()
             self.pod_metrics_worker.wait()
 
+        self.informer_cache.stop()
+        self.view_tab.stop_resource_fetches()
         self.view_tab.stop_log_streaming()
+        get_executor().shutdown()
+        client_registry.close()
+        credential_cache.stop()
+        cluster_recording.save()
     
     def kill_process_by_command(self, command_pattern):
         try:
@@ -1018,47 +988,6 @@ class KubernetesGUI(QMainWindow):
         """)
         self.set_common_styles()
     
-    def get_prometheus_url(self):
-        if self.prometheus_port_forward_active:
-            return f"http://localhost:{self.prometheus_port_forward_process.cmdline()[-1].split(':')[0]}"
-
-        print("Setting up port-forwarding for Prometheus...")
-        
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                available_port = get_available_port(PROMETHEUS_PORT)
-                if not available_port:
-                    print("No available ports found")
-                    return None
-
-                # Kill any existing port-forward processes
-                kill_port_forward_processes(f"kubectl port-forward.*{available_port}:9090")
-
-                # Start port-forwarding in the background
-                process = subprocess.Popen(
-                    ["kubectl", "port-forward", "-n", "prometheus", "service/prometheus-operated", f"{available_port}:9090"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
-                )
-                print(f"Port-forwarding set up on port {available_port}")
-                
-                # Wait for the port to become available
-                for _ in range(10):  # Try for 10 seconds
-                    if is_port_in_use(available_port):
-                        self.update_prometheus_port_forwarding(available_port, process.pid)
-                        return f"http://localhost:{available_port}"
-                    time.sleep(1)
-                
-                print("Timed out waiting for port-forwarding to establish")
-            except Exception as e:
-                print(f"Error setting up port-forwarding: {e}")
-            
-            print(f"Retrying... (Attempt {attempt + 1}/{max_retries})")
-        
-        print("Failed to set up port-forwarding after multiple attempts")
-        return None
-
     def update_prometheus_port_forwarding(self, port, pid):
         if hasattr(self, 'view_tab'):
             key = "prometheus/prometheus-operated"
@@ -1,13 +1,20 @@
 import sys
 import os
+from startup_timing import MAIN_WINDOW, timer as startup_timer
 from PyQt5.QtWidgets import QApplication
-from kubernetes_gui import KubernetesGUI
+from PyQt5.QtCore import QTimer
 
 # Suppress macOS warning
 os.environ['QT_MAC_WANTS_LAYER'] = '1'
 
 if __name__ == "__main__":
+    startup_timer.import_module("Resources", "view_tab")
+    KubernetesGUI = startup_timer.import_attribute(MAIN_WINDOW, "kubernetes_gui", "KubernetesGUI")
     app = QApplication(sys.argv)
-    gui = KubernetesGUI()
+    with startup_timer.measure(MAIN_WINDOW, 'init'):
+        gui = KubernetesGUI()
+    # Report once the paint pass that drew the window (and the Resources tab) is done
+    startup_timer.watch_first_paint(
+        MAIN_WINDOW, gui, lambda: QTimer.singleShot(0, lambda: startup_timer.report([MAIN_WINDOW, "Resources"])))
     gui.show()
-    sys.exit(app.exec_())
\ No newline at end of file
+    sys.exit(app.exec_())
@@ -0,0 +1,96 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from kubernetes import client
+from client_registry import api as registry_api
+from resource_updaters import FetchCancelled, FetchContext, RESOURCE_FETCHERS
+from helper_view_tab.resource_table_model import TableCell
+
+# Resource kinds the Resources tab can aggregate across clusters
+AGGREGATED_RESOURCE_TYPES = ("Pods", "Deployments", "Nodes")
+# A cluster that hasn't answered by then is reported and left out
+CLUSTER_TIMEOUT_SECONDS = 20
+MAX_PARALLEL_CLUSTERS = 12
+
+
+class NoInformers:
+    def items(self, kind, namespaces=None):
+        return None
+
+
+class ClusterClients:
+    """The part of KubernetesGUI the fetch_* functions use, bound to one context."""
+
+    def __init__(self, context):
+        self.context = context
+        self.v1 = registry_api(client.CoreV1Api, context)
+        self.apps_v1 = registry_api(client.AppsV1Api, context)
+        self.batch_v1 = registry_api(client.BatchV1Api, context)
+        self.custom_api = registry_api(client.CustomObjectsApi, context)
+        # Informers only run for the current context
+        self.informer_cache = NoInformers()
+
+
+def fetch_cluster(gui, context, resource_type, namespaces, ctx):
+    # The current context goes through the Resources tab so its informers are used
+    clients = gui if context == gui.context_name else ClusterClients(context)
+    headers, rows = RESOURCE_FETCHERS[resource_type](clients, namespaces, ctx)
+    return headers + ["Cluster"], [(key + (context,), cells + [TableCell(context)]) for key, cells in rows]
+
+
+def fetch_aggregated(gui, resource_type, contexts, namespaces, ctx=None, timeout=CLUSTER_TIMEOUT_SECONDS):
+    """Fetch one resource kind from every context concurrently into one table.
+
+    Rows get a trailing Cluster column and the context appended to their key.
+    Each cluster's rows are handed to ctx.page_loaded as soon as that cluster
+    answers. Clusters that fail or exceed the timeout are recorded with
+    ctx.warn() and skipped rather than failing the whole table.
+    """
+    ctx = ctx or FetchContext()
+    cluster_contexts = {context: FetchContext(priority=ctx.priority) for context in contexts}
+    executor = ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_CLUSTERS, len(contexts)) or 1)
+    futures = {
+        executor.submit(fetch_cluster, gui, context, resource_type, namespaces, cluster_ctx): context
+        for context, cluster_ctx in cluster_contexts.items()
+    }
+    # Unanswered clusters keep their thread until their request returns, but
+    # nothing waits on them
+    executor.shutdown(wait=False)
+
+    headers = None
+    rows = []
+    start = time.monotonic()
+    deadline = start + timeout
+    pending = set(futures)
+    try:
+        while pending:
+            ctx.check()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=min(remaining, 0.5), return_when=FIRST_COMPLETED)
+            for future in done:
+                context = futures[future]
+                ctx.record_latency(context, time.monotonic() - start)
+                try:
+                    cluster_headers, cluster_rows = future.result()
+                except Exception as e:
+                    ctx.warn(f"{context}: {e}")
+                    continue
+                headers = headers or cluster_headers
+                rows.extend(cluster_rows)
+                ctx.page_loaded(headers, cluster_rows)
+    except FetchCancelled:
+        for cluster_ctx in cluster_contexts.values():
+            cluster_ctx.cancel()
+        raise
+
+    for future in pending:
+        context = futures[future]
+        cluster_contexts[context].cancel()
+        ctx.warn(f"{context}: no answer after {timeout}s")
+
+    if headers is None and ctx.warnings:
+        raise Exception("; ".join(ctx.warnings))
+    return headers or [], rows
+
@@ -9,7 +9,8 @@ from PyQt5.QtWebEngineWidgets import QWebEngineView
 from PyQt5.QtWebChannel import QWebChannel
 from PyQt5.QtCore import QUrl, QTimer, QMetaObject, Qt
 from PyQt5.QtGui import QFont
-from kubernetes import client, config
+from kubernetes import client
+from client_registry import api as registry_api
 from jinja2 import Template
 from helper_network_graph_tab.web_bridge import WebBridge
 from helper_network_graph_tab.load_graph_thread import LoadGraphThread
@@ -22,10 +23,7 @@ class NetworkGraphTab(QWidget):
         super().__init__(parent)
         self.network = None
         self.k8s_objects = {}
-        try:
-            config.load_kube_config()
-        except config.config_exception.ConfigException:
-            logger.error("Error loading Kubernetes configuration. Make sure you have a valid kubeconfig file.")
+        self.informer_cache = getattr(parent, 'informer_cache', None)
         self.init_ui()
 
     def init_ui(self):
@@ -170,7 +168,7 @@ class NetworkGraphTab(QWidget):
 
     def load_namespaces(self):
         try:
-            v1 = client.CoreV1Api()
+            v1 = registry_api(client.CoreV1Api)
             namespaces = v1.list_namespace().items
             self.namespace_combo.clear()
             self.namespace_combo.addItem("Select a namespace", None)
@@ -194,7 +192,7 @@ class NetworkGraphTab(QWidget):
 
     def load_graph(self, namespace, graph_type):
         self.show_loading_indicator(graph_type)
-        self.load_thread = LoadGraphThread(namespace, graph_type)
+        self.load_thread = LoadGraphThread(namespace, graph_type, self.informer_cache)
         self.load_thread.graph_loaded.connect(self.on_graph_loaded)
         self.load_thread.error_occurred.connect(self.on_graph_error)
         self.load_thread.start()
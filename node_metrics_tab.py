@@ -3,6 +3,8 @@ from PyQt5.QtGui import QFont, QStandardItemModel, QStandardItem, QFontMetrics
 from PyQt5.QtCore import Qt, QThread, pyqtSignal, QMetaObject, Q_ARG
 from kubernetes import client
 from resource_updaters import parse_k8s_cpu, parse_k8s_memory
+from prometheus_executor import run_queries
+from utils import list_all_pages
 import csv
 import traceback
 from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel, QProgressBar
@@ -48,25 +50,34 @@ class LoadingOverlay(QWidget):
 class NodeTableWorker(QThread):
     update_signal = pyqtSignal(list)
 
-    def __init__(self, v1, prom):
+    def __init__(self, v1, prom, informer_cache=None):
         super().__init__()
         self.v1 = v1
         self.prom = prom
+        self.informer_cache = informer_cache
 
     def run(self):
         try:
-            nodes = self.v1.list_node().items
+            nodes = self.informer_cache.peek("Nodes") if self.informer_cache else None
+            if nodes is None:
+                nodes = list_all_pages(self.v1.list_node)
             print(f"Found {len(nodes)} nodes")
             
-            # Fetch metrics from Prometheus
-            cpu_usage = self.fetch_prometheus_metric('100 * avg(1 - rate(node_cpu_seconds_total{mode="idle"}[5m])) by (instance)')
-            mem_usage = self.fetch_prometheus_metric('100 * (1 - (node_memory_MemAvailable_bytes / node_memory_MemTotal_bytes))')
-            cpu_allocatable = self.fetch_prometheus_metric('kube_node_status_allocatable{resource="cpu"}')
-            mem_allocatable = self.fetch_prometheus_metric('kube_node_status_allocatable{resource="memory"}')
-            cpu_req = self.fetch_prometheus_metric('sum(kube_pod_container_resource_requests{resource="cpu"}) by (node)')
-            cpu_limit = self.fetch_prometheus_metric('sum(kube_pod_container_resource_limits{resource="cpu"}) by (node)')
-            mem_req = self.fetch_prometheus_metric('sum(kube_pod_container_resource_requests{resource="memory"}) by (node)')
-            mem_limit = self.fetch_prometheus_metric('sum(kube_pod_container_resource_limits{resource="memory"}) by (node)')
+            # Fetch metrics from Prometheus, all queries in flight at once
+            metrics = run_queries(self.prom, {
+                'cpu_usage': '100 * avg(1 - rate(node_cpu_seconds_total{mode="idle"}[5m])) by (instance)',
+                'mem_usage': '100 * (1 - (node_memory_MemAvailable_bytes / node_memory_MemTotal_bytes))',
+                'cpu_allocatable': 'kube_node_status_allocatable{resource="cpu"}',
+                'mem_allocatable': 'kube_node_status_allocatable{resource="memory"}',
+                'cpu_req': 'sum(kube_pod_container_resource_requests{resource="cpu"}) by (node)',
+                'cpu_limit': 'sum(kube_pod_container_resource_limits{resource="cpu"}) by (node)',
+                'mem_req': 'sum(kube_pod_container_resource_requests{resource="memory"}) by (node)',
+                'mem_limit': 'sum(kube_pod_container_resource_limits{resource="memory"}) by (node)',
+            })
+            cpu_usage, mem_usage = metrics['cpu_usage'], metrics['mem_usage']
+            cpu_allocatable, mem_allocatable = metrics['cpu_allocatable'], metrics['mem_allocatable']
+            cpu_req, cpu_limit = metrics['cpu_req'], metrics['cpu_limit']
+            mem_req, mem_limit = metrics['mem_req'], metrics['mem_limit']
 
             node_data = []
             for node in nodes:
@@ -102,17 +113,6 @@ class NodeTableWorker(QThread):
             print(f"Error in NodeTableWorker: {e}")
             traceback.print_exc()
 
-    def fetch_prometheus_metric(self, query):
-        try:
-            print(f"Executing Prometheus query: {query}")
-            result = self.prom.custom_query(query)
-            print(f"Query result: {result}")
-            return result
-        except Exception as e:
-            print(f"Error fetching Prometheus metric: {e}")
-            traceback.print_exc()
-            return []
-
     def get_metric_value(self, metric_list, node_name, key='node', use_instance_port=False):
         for item in metric_list:
             if key in item['metric']:
@@ -175,17 +175,22 @@ class NodeDetailsFetcher(QThread):
 
     def run(self):
         try:
-            # Fetch pod metrics from Prometheus
-            cpu_usage = self.fetch_prometheus_metric(f'sum(rate(container_cpu_usage_seconds_total{{container!="POD", container!="", node="{self.node_name}"}}[5m])) by (pod)')
-            mem_usage = self.fetch_prometheus_metric(f'sum(container_memory_working_set_bytes{{container!="POD", container!="", node="{self.node_name}"}}) by (pod)')
-            cpu_requests = self.fetch_prometheus_metric(f'sum(kube_pod_container_resource_requests{{node="{self.node_name}", resource="cpu"}}) by (pod)')
-            cpu_limits = self.fetch_prometheus_metric(f'sum(kube_pod_container_resource_limits{{node="{self.node_name}", resource="cpu"}}) by (pod)')
-            mem_requests = self.fetch_prometheus_metric(f'sum(kube_pod_container_resource_requests{{node="{self.node_name}", resource="memory"}}) by (pod)')
-            mem_limits = self.fetch_prometheus_metric(f'sum(kube_pod_container_resource_limits{{node="{self.node_name}", resource="memory"}}) by (pod)')
-
-            # Fetch node allocatable resources
-            cpu_allocatable = self.fetch_prometheus_metric(f'kube_node_status_allocatable{{node="{self.node_name}", resource="cpu"}}')
-            mem_allocatable = self.fetch_prometheus_metric(f'kube_node_status_allocatable{{node="{self.node_name}", resource="memory"}}')
+            # Fetch pod metrics and node allocatable resources from Prometheus
+            node = self.node_name
+            metrics = run_queries(self.prom, {
+                'cpu_usage': f'sum(rate(container_cpu_usage_seconds_total{{container!="POD", container!="", node="{node}"}}[5m])) by (pod)',
+                'mem_usage': f'sum(container_memory_working_set_bytes{{container!="POD", container!="", node="{node}"}}) by (pod)',
+                'cpu_requests': f'sum(kube_pod_container_resource_requests{{node="{node}", resource="cpu"}}) by (pod)',
+                'cpu_limits': f'sum(kube_pod_container_resource_limits{{node="{node}", resource="cpu"}}) by (pod)',
+                'mem_requests': f'sum(kube_pod_container_resource_requests{{node="{node}", resource="memory"}}) by (pod)',
+                'mem_limits': f'sum(kube_pod_container_resource_limits{{node="{node}", resource="memory"}}) by (pod)',
+                'cpu_allocatable': f'kube_node_status_allocatable{{node="{node}", resource="cpu"}}',
+                'mem_allocatable': f'kube_node_status_allocatable{{node="{node}", resource="memory"}}',
+            })
+            cpu_usage, mem_usage = metrics['cpu_usage'], metrics['mem_usage']
+            cpu_requests, cpu_limits = metrics['cpu_requests'], metrics['cpu_limits']
+            mem_requests, mem_limits = metrics['mem_requests'], metrics['mem_limits']
+            cpu_allocatable, mem_allocatable = metrics['cpu_allocatable'], metrics['mem_allocatable']
 
             print(f"Node: {self.node_name}")
             print(f"CPU Usage: {cpu_usage}")
@@ -210,17 +215,6 @@ class NodeDetailsFetcher(QThread):
             print(f"Error fetching node details: {e}")
             traceback.print_exc()
 
-    def fetch_prometheus_metric(self, query):
-        try:
-            print(f"Executing Prometheus query: {query}")
-            result = self.prom.custom_query(query)
-            print(f"Query result: {result}")
-            return result
-        except Exception as e:
-            print(f"Error fetching Prometheus metric: {e}")
-            traceback.print_exc()
-            return []
-
     def process_pod_data(self, cpu_usage, mem_usage, cpu_requests, cpu_limits, mem_requests, mem_limits):
         pods_data = {}
         for metric in [cpu_usage, mem_usage, cpu_requests, cpu_limits, mem_requests, mem_limits]:
@@ -599,7 +593,7 @@ class NodeMetricsTab(QWidget):
             return
         self.show_loading()
 
-        self.node_table_worker = NodeTableWorker(self.v1, self.parent.prom)
+        self.node_table_worker = NodeTableWorker(self.v1, self.parent.prom, self.parent.informer_cache)
         self.node_table_worker.update_signal.connect(self.populate_node_table)
         self.node_table_worker.finished.connect(self.update_pod_details)
         self.node_table_worker.finished.connect(self.hide_loading)
@@ -7,6 +7,7 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtGui import QFont, QStandardItemModel, QStandardItem
 from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSortFilterProxyModel, QAbstractTableModel
 from prometheus_api_client import PrometheusConnect
+from prometheus_executor import run_queries
 from kubernetes import client
 import traceback
 import logging
@@ -123,9 +124,7 @@ class PodMetricsWorker(QThread):
                 'mem_requests': "sum(kube_pod_container_resource_requests{resource='memory'}) by (namespace, pod)",
             }
 
-            results = {}
-            for name, query in queries.items():
-                results[name] = self.prom.custom_query(query)
+            results = run_queries(self.prom, queries)
 
             pod_data = {}
             for name, result in results.items():
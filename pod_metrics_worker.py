@@ -7,7 +7,7 @@ from PyQt5.QtGui import QStandardItemModel, QFont, QColor, QTextCharFormat, QSta
 from PyQt5.QtCore import Qt, QSortFilterProxyModel, QTimer
 from kubernetes import client, config
 from kubernetes.stream import stream
-from resource_updaters import update_pods, update_pvcs, update_statefulsets, update_deployments, update_pvs, update_secrets, update_configmaps, update_jobs, update_cronjobs, update_nodes, LogStreamerThread,  parse_k8s_cpu, parse_k8s_memory
+from resource_updaters import LogStreamerThread,  parse_k8s_cpu, parse_k8s_memory
 from utils import setup_info_search
 import yaml, csv, time
 import sip
@@ -34,6 +34,7 @@ class PodMetricsWorker(QThread):
                 pods = self.v1.list_namespaced_pod(self.namespace, label_selector=self.label_selector).items
             else:
                 pods = self.v1.list_pod_for_all_namespaces(label_selector=self.label_selector).items
+            usage = self.list_pod_usage()
             
             totals = {
                 'cpu_usage': 0, 'cpu_request': 0, 'cpu_limit': 0,
@@ -44,7 +45,7 @@ class PodMetricsWorker(QThread):
             for i, pod in enumerate(pods):
                 if not self.is_running:
                     break
-                pod_metrics = self.get_pod_metrics(pod.metadata.name, pod.metadata.namespace)
+                pod_metrics = self.get_pod_metrics(pod, usage.get((pod.metadata.namespace, pod.metadata.name)))
                 self.update_signal.emit(i, {
                     'name': pod.metadata.name,
                     'metrics': pod_metrics,
@@ -63,31 +64,51 @@ class PodMetricsWorker(QThread):
     def stop(self):
         self.is_running = False
 
-    def get_pod_metrics(self, pod_name, namespace):
+    def list_pod_usage(self):
+        # One LIST of metrics.k8s.io pod metrics, joined against the pod list
+        # in memory, instead of a GET per pod
         try:
-            pod = self.v1.read_namespaced_pod(pod_name, namespace)
-            try:
-                metrics = self.custom_api.get_namespaced_custom_object(
+            if self.namespace:
+                metrics = self.custom_api.list_namespaced_custom_object(
+                    group="metrics.k8s.io",
+                    version="v1beta1",
+                    namespace=self.namespace,
+                    plural="pods",
+                    label_selector=self.label_selector
+                )
+            else:
+                metrics = self.custom_api.list_cluster_custom_object(
                     group="metrics.k8s.io",
                     version="v1beta1",
-                    namespace=namespace,
                     plural="pods",
-                    name=pod_name
+                    label_selector=self.label_selector
                 )
-                
-                cpu_usage = parse_k8s_cpu(metrics['containers'][0]['usage'].get('cpu', '0')) if metrics else 0
-                memory_usage = parse_k8s_memory(metrics['containers'][0]['usage'].get('memory', '0')) if metrics else 0
-            except Exception as metrics_error:
-                print(f"Error fetching metrics for pod {pod_name}: {metrics_error}")
-                cpu_usage = 0
-                memory_usage = 0
+        except Exception as metrics_error:
+            print(f"Error fetching pod metrics: {metrics_error}")
+            return {}
+
+        usage = {}
+        for item in metrics.get('items', []):
+            containers = item.get('containers', [])
+            usage[(item['metadata']['namespace'], item['metadata']['name'])] = (
+                sum(parse_k8s_cpu(c['usage'].get('cpu', '0')) for c in containers),
+                sum(parse_k8s_memory(c['usage'].get('memory', '0')) for c in containers),
+            )
+        return usage
+
+    def get_pod_metrics(self, pod, usage):
+        try:
+            cpu_usage, memory_usage = usage if usage else (0, 0)
             
-            containers = pod.spec.containers[0] if pod and pod.spec and pod.spec.containers else None
-            cpu_request = parse_k8s_cpu(containers.resources.requests.get('cpu', '0')) if containers and containers.resources and containers.resources.requests else 0
-            cpu_limit = parse_k8s_cpu(containers.resources.limits.get('cpu', '0')) if containers and containers.resources and containers.resources.limits else 0
-            memory_request = parse_k8s_memory(containers.resources.requests.get('memory', '0')) if containers and containers.resources and containers.resources.requests else 0
-            memory_limit = parse_k8s_memory(containers.resources.limits.get('memory', '0')) if containers and containers.resources and containers.resources.limits else 0
-            gpu_limit = float(containers.resources.limits.get('nvidia.com/gpu', '0')) if containers and containers.resources and containers.resources.limits else 0
+            cpu_request = cpu_limit = memory_request = memory_limit = gpu_limit = 0
+            for container in (pod.spec.containers if pod.spec and pod.spec.containers else []):
+                requests = container.resources.requests if container.resources and container.resources.requests else {}
+                limits = container.resources.limits if container.resources and container.resources.limits else {}
+                cpu_request += parse_k8s_cpu(requests.get('cpu', '0'))
+                cpu_limit += parse_k8s_cpu(limits.get('cpu', '0'))
+                memory_request += parse_k8s_memory(requests.get('memory', '0'))
+                memory_limit += parse_k8s_memory(limits.get('memory', '0'))
+                gpu_limit += float(limits.get('nvidia.com/gpu', '0'))
             
             return {
                 'cpu_usage': float(cpu_usage),
@@ -99,9 +120,9 @@ class PodMetricsWorker(QThread):
                 'gpu_limit': float(gpu_limit)
             }
         except Exception as e:
-            print(f"Error getting pod metrics for {pod_name} in namespace {namespace}: {e}")
+            print(f"Error getting pod metrics for {pod.metadata.name} in namespace {pod.metadata.namespace}: {e}")
             return {
                 'cpu_usage': 0.0, 'cpu_request': 0.0, 'cpu_limit': 0.0,
                 'memory_usage': 0.0, 'memory_request': 0.0, 'memory_limit': 0.0,
                 'gpu_limit': 0.0
-            }
\ No newline at end of file
+            }
@@ -0,0 +1,184 @@
+import os
+import socket
+import subprocess
+import time
+
+import psutil
+import requests
+from PyQt5.QtCore import QObject, QThread, QTimer, pyqtSignal
+import cluster_recording
+
+PROMETHEUS_PORT = 29090
+PORT_FORWARD_ATTEMPTS = 3
+PORT_FORWARD_WAIT_SECONDS = 10
+RETRY_DELAY_MS = 60000
+# Use this Prometheus instead of port-forwarding to the cluster's, e.g. the
+# stand-in from benchmarks/fake_prometheus.py
+PROMETHEUS_URL_ENV = "KUBENEXUS_PROMETHEUS_URL"
+
+DISCONNECTED = "Disconnected"
+DISCOVERING = "Discovering"
+PORT_FORWARDING = "Port-forwarding"
+READY = "Connected"
+UNAVAILABLE = "Unavailable"
+
+
+def is_port_in_use(port):
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        return s.connect_ex(('localhost', port)) == 0
+
+
+def is_prometheus_on_port(port):
+    try:
+        response = requests.get(f"http://localhost:{port}/-/healthy", timeout=2)
+        return response.status_code == 200
+    except requests.RequestException:
+        return False
+
+
+def get_available_port(start_port=29090, max_port=29100):
+    for port in range(start_port, max_port + 1):
+        if not is_port_in_use(port):
+            return port
+    return None
+
+
+def kill_port_forward_processes(pattern):
+    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+        try:
+            if 'kubectl' in proc.info['name'] and 'port-forward' in proc.info['cmdline'] and any(pattern in arg for arg in proc.info['cmdline']):
+                proc.terminate()
+                proc.wait(timeout=5)
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.TimeoutExpired):
+            pass
+
+
+class PortForwardWorker(QThread):
+    """Starts `kubectl port-forward` to the in-cluster Prometheus and waits for it."""
+    progress = pyqtSignal(str)
+    forwarded = pyqtSignal(int, int)  # local port, kubectl pid
+    failed = pyqtSignal(str)
+
+    def run(self):
+        for attempt in range(PORT_FORWARD_ATTEMPTS):
+            if self.isInterruptionRequested():
+                return
+            try:
+                available_port = get_available_port(PROMETHEUS_PORT)
+                if not available_port:
+                    self.failed.emit("No available ports found")
+                    return
+
+                # Kill any existing port-forward processes
+                kill_port_forward_processes(f"kubectl port-forward.*{available_port}:9090")
+
+                self.progress.emit(PORT_FORWARDING)
+                process = subprocess.Popen(
+                    ["kubectl", "port-forward", "-n", "prometheus", "service/prometheus-operated", f"{available_port}:9090"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+                print(f"Port-forwarding set up on port {available_port}")
+
+                deadline = time.monotonic() + PORT_FORWARD_WAIT_SECONDS
+                while time.monotonic() < deadline and process.poll() is None:
+                    if self.isInterruptionRequested():
+                        process.terminate()
+                        return
+                    if is_port_in_use(available_port):
+                        self.forwarded.emit(available_port, process.pid)
+                        return
+                    time.sleep(0.2)
+
+                process.terminate()
+                print("Timed out waiting for port-forwarding to establish")
+            except Exception as e:
+                print(f"Error setting up port-forwarding: {e}")
+
+            print(f"Retrying... (Attempt {attempt + 1}/{PORT_FORWARD_ATTEMPTS})")
+
+        self.failed.emit("Failed to set up port-forwarding after multiple attempts")
+
+
+class PrometheusDiscovery(QObject):
+    """Finds a Prometheus backend in the background and reports its state.
+
+    Disconnected -> Discovering -> Port-forwarding -> Connected, or
+    Unavailable with a retry scheduled. Widgets connect to state_changed and
+    read `url` once the state is Connected; start() is a no-op while a
+    discovery is already running, so anything may call it on a failure.
+    """
+    state_changed = pyqtSignal(str)
+
+    def __init__(self, gui):
+        super().__init__(gui)
+        self.gui = gui
+        self.state = DISCONNECTED
+        self.url = None
+        self.worker = None
+        self.retry_timer = QTimer(self)
+        self.retry_timer.setSingleShot(True)
+        self.retry_timer.timeout.connect(self.start)
+
+    def set_state(self, state):
+        if state != self.state:
+            self.state = state
+            print(f"Prometheus: {state}")
+            self.state_changed.emit(state)
+
+    def is_ready(self):
+        return self.state == READY
+
+    def start(self):
+        if self.worker is not None and self.worker.isRunning():
+            return
+        self.retry_timer.stop()
+
+        if cluster_recording.is_replaying():
+            # Queries are answered from the recording, nothing to forward
+            self.url = cluster_recording.REPLAY_PROMETHEUS_URL
+            self.set_state(READY)
+            return
+        if os.environ.get(PROMETHEUS_URL_ENV):
+            self.url = os.environ[PROMETHEUS_URL_ENV]
+            self.set_state(READY)
+            return
+
+        process = self.gui.prometheus_port_forward_process
+        if self.gui.prometheus_port_forward_active and process is not None and process.is_running():
+            self.on_forwarded(int(process.cmdline()[-1].split(':')[0]), process.pid)
+            return
+        self.gui.prometheus_port_forward_active = False
+
+        self.set_state(DISCOVERING)
+        self.worker = PortForwardWorker()
+        self.worker.progress.connect(self.set_state)
+        self.worker.forwarded.connect(self.on_forwarded)
+        self.worker.failed.connect(self.on_failed)
+        self.worker.start()
+
+    def restart(self):
+        """Discard the current backend, e.g. after its port-forward died."""
+        process = self.gui.prometheus_port_forward_process
+        if process is not None and not process.is_running():
+            self.gui.prometheus_port_forward_active = False
+        self.url = None
+        self.set_state(DISCONNECTED)
+        self.start()
+
+    def on_forwarded(self, port, pid):
+        self.gui.update_prometheus_port_forwarding(port, pid)
+        self.url = f"http://localhost:{port}"
+        self.set_state(READY)
+
+    def on_failed(self, message):
+        print(message)
+        self.url = None
+        self.set_state(UNAVAILABLE)
+        self.retry_timer.start(RETRY_DELAY_MS)
+
+    def stop(self):
+        self.retry_timer.stop()
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.requestInterruption()
+            self.worker.wait()
@@ -0,0 +1,226 @@
+import re
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+import api_tracing
+import cluster_recording
+from client_registry import registry as client_registry
+
+MAX_CONCURRENT_QUERIES = 8
+QUERY_TIMEOUT_SECONDS = 10
+
+# Instant queries are evaluated on a fixed grid so the same query asked from
+# different tabs a moment apart maps to the same cache entry
+QUERY_STEP_SECONDS = 5
+CACHE_TTL_SECONDS = 15
+CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+CacheEntry = namedtuple("CacheEntry", ["result", "size", "expires"])
+
+_QUOTED = re.compile(r'("(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|`[^`]*`)')
+_SPACE_AROUND_PUNCTUATION = re.compile(r'\s*([(){}\[\],=!~<>+\-*/^%])\s*')
+
+
+def normalize_query(query):
+    # Whitespace outside string literals carries no meaning in PromQL
+    parts = _QUOTED.split(query)
+    for i in range(0, len(parts), 2):
+        parts[i] = _SPACE_AROUND_PUNCTUATION.sub(r'\1', ' '.join(parts[i].split()))
+    return ''.join(parts).strip()
+
+
+class QueryCache:
+    """LRU of query results with a TTL and a bound on their total size.
+
+    Each result is charged the length of the response body it was decoded
+    from, a cheap stand-in for the memory the decoded result holds.
+    """
+
+    def __init__(self, ttl=CACHE_TTL_SECONDS, max_bytes=CACHE_MAX_BYTES):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def get(self, key, now):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires <= now:
+            self.remove(key)
+            return None
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key, result, size, now):
+        if size > self.max_bytes:
+            return
+        if key in self.entries:
+            self.remove(key)
+        self.entries[key] = CacheEntry(result, size, now + self.ttl)
+        self.size += size
+        while self.size > self.max_bytes:
+            self.remove(next(iter(self.entries)))
+            self.evictions += 1
+
+    def remove(self, key):
+        self.size -= self.entries.pop(key).size
+
+    def purge_expired(self, now):
+        for key in [key for key, entry in self.entries.items() if entry.expires <= now]:
+            self.remove(key)
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
+
+
+class PrometheusQueryExecutor:
+    """Runs instant PromQL queries concurrently over one pooled HTTP session.
+
+    Takes the PrometheusConnect instance the tabs already hold for its URL,
+    headers and TLS settings, but sends the requests itself so every tab
+    shares the same keep-alive connections and a bounded set of workers.
+    Results are cached per (server, normalized query, step) and identical
+    queries already in flight are joined rather than sent again.
+    """
+
+    def __init__(self, max_workers=MAX_CONCURRENT_QUERIES, timeout=QUERY_TIMEOUT_SECONDS,
+                 step=QUERY_STEP_SECONDS, ttl=CACHE_TTL_SECONDS, max_cache_bytes=CACHE_MAX_BYTES):
+        self.timeout = timeout
+        self.step = step
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='promql')
+        self.cache = QueryCache(ttl, max_cache_bytes)
+        self.in_flight = {}
+        self.lock = threading.Lock()
+
+    def request(self, prom, query, evaluation_time=None):
+        params = {'query': query}
+        if evaluation_time is not None:
+            params['time'] = evaluation_time
+        response = self.session.get(
+            f"{prom.url.rstrip('/')}/api/v1/query",
+            params=params,
+            headers=getattr(prom, 'headers', None),
+            auth=getattr(prom, 'auth', None),
+            verify=getattr(prom, 'ssl_verification', True),
+            timeout=self.timeout)
+        response.raise_for_status()
+        body = response.json()
+        if body.get('status') != 'success':
+            raise RuntimeError(f"Prometheus query failed: {body.get('error', body)}")
+        return body['data']['result'], len(response.content)
+
+    def submit(self, prom, query):
+        """Return a Future for the query, served from the cache when possible."""
+        now = time.time()
+        key = (prom.url, normalize_query(query), self.step)
+        with self.lock:
+            entry = self.cache.get(key, now)
+            if entry is not None:
+                self.cache.hits += 1
+                future = Future()
+                future.set_result(entry.result)
+                return future
+            future = self.in_flight.get(key)
+            if future is not None:
+                self.cache.coalesced += 1
+                return future
+            self.cache.misses += 1
+            evaluation_time = now - now % self.step
+            future = self.pool.submit(self.fetch, key, prom, query, evaluation_time, api_tracing.current_origin())
+            self.in_flight[key] = future
+            return future
+
+    def fetch(self, key, prom, query, evaluation_time, origin):
+        try:
+            # Charged to the tab that asked first; later askers join the same request
+            with api_tracing.origin(*origin):
+                result, size = self.request(prom, query, evaluation_time)
+            with self.lock:
+                self.cache.put(key, result, size, time.time())
+            return result
+        finally:
+            with self.lock:
+                self.in_flight.pop(key, None)
+
+    def query(self, prom, query):
+        return self.submit(prom, query).result()
+
+    def run_queries(self, prom, queries, return_exceptions=False):
+        """Run {key: promql} concurrently and return {key: result}.
+
+        Waits for all of them, so the total time is that of the slowest query.
+        A query that fails yields [] (or the exception itself with
+        return_exceptions=True) without affecting the others.
+        """
+        futures = {key: self.submit(prom, query) for key, query in queries.items()}
+        results = {}
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                print(f"Error running Prometheus query {queries[key]}: {e}")
+                results[key] = e if return_exceptions else []
+        with self.lock:
+            self.cache.purge_expired(time.time())
+        return results
+
+    def stats(self):
+        with self.lock:
+            return {
+                'hits': self.cache.hits,
+                'misses': self.cache.misses,
+                'coalesced': self.cache.coalesced,
+                'evictions': self.cache.evictions,
+                'entries': len(self.cache.entries),
+                'bytes': self.cache.size,
+            }
+
+    def clear_cache(self):
+        with self.lock:
+            self.cache.clear()
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False)
+        self.session.close()
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = PrometheusQueryExecutor()
+            # Prometheus is per cluster, so recordings are keyed by context
+            cluster_recording.install_prometheus(_executor, lambda: client_registry.current_context)
+        return _executor
+
+
+def run_queries(prom, queries, return_exceptions=False):
+    return get_executor().run_queries(prom, queries, return_exceptions)
+
+
+def cache_stats_text():
+    stats = get_executor().stats()
+    lookups = stats['hits'] + stats['misses'] + stats['coalesced']
+    hit_rate = (stats['hits'] + stats['coalesced']) / lookups * 100 if lookups else 0
+    return (f"Query cache: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['coalesced']} coalesced ({hit_rate:.0f}% served without a request), "
+            f"{stats['entries']} entries, {stats['bytes'] / 1024:.0f} KiB, "
+            f"{stats['evictions']} evicted")
@@ -0,0 +1,175 @@
+import json
+from datetime import datetime, timezone
+from functools import lru_cache
+
+from kubernetes.client import models
+
+
+def plain_camel_case(name):
+    first, *rest = name.lstrip('_').split('_')
+    return first + ''.join(part.title() for part in rest)
+
+
+def irregular_wire_names():
+    # Initialisms don't survive the naive conversion (cluster_ip is
+    # "clusterIP", image_id "imageID"), so take those from the models'
+    # attribute maps. Names some model spells the plain way are left alone.
+    irregular, regular = {}, set()
+    for model in vars(models).values():
+        for name, wire_name in (getattr(model, 'attribute_map', None) or {}).items():
+            if wire_name == plain_camel_case(name):
+                regular.add(name)
+            else:
+                irregular[name] = wire_name
+    return {name: wire_name for name, wire_name in irregular.items() if name not in regular}
+
+
+IRREGULAR_WIRE_NAMES = irregular_wire_names()
+
+
+@lru_cache(maxsize=None)
+def camel_case(name):
+    # The generated models spell fields in snake_case, the wire format in
+    # camelCase; "_continue" is the client's escape for the "continue" keyword.
+    return IRREGULAR_WIRE_NAMES.get(name) or plain_camel_case(name)
+
+
+class RawObject:
+    """Read-only attribute view over a JSON object returned by the API server.
+
+    Fields are looked up with the same snake_case names as the kubernetes
+    client models (pod.status.container_statuses, ...) so the table row code
+    works on either, but nothing is deserialized until it is actually read.
+    Missing fields read as None, like unset model attributes.
+    """
+    __slots__ = ('_data',)
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return self._data.get(camel_case(name))
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def to_dict(self):
+        return json.loads(json.dumps(self._data, default=lambda obj: obj._data))
+
+
+def decode_page(data):
+    page = json.loads(data, object_hook=RawObject)
+    if page.kind == 'Table':
+        # Expose server-side table rows as their metadata objects, with the
+        # printed columns available by name under .cells
+        columns = [column.name for column in page.column_definitions]
+        items = []
+        for row in page.rows or []:
+            obj = row.object
+            obj._data['cells'] = dict(zip(columns, row.cells))
+            items.append(obj)
+        page._data['items'] = items
+    return page
+
+
+def mapping_items(mapping):
+    """(key, value) pairs of a map field such as labels, model dict or RawObject."""
+    if not mapping:
+        return []
+    return [(key, mapping[key]) for key in mapping]
+
+
+def call_raw(api_func, *args, **kwargs):
+    """Call a generated API method and decode the body without building models."""
+    response = api_func(*args, _preload_content=False, **kwargs)
+    try:
+        return decode_page(response.data)
+    finally:
+        response.release_conn()
+
+
+# Query parameters of requests whose body is read as a stream. The watch and
+# log readers split the raw bytes on newlines without decoding, so those must
+# not be compressed.
+STREAMING_PARAMS = {'watch', 'follow'}
+
+
+def accept_gzip(api_client):
+    """Ask the API server to gzip every non-streaming GET sent through api_client.
+
+    urllib3 inflates the body transparently, for preloaded responses and for
+    response.data alike. LISTs of pods shrink several-fold on the wire.
+    """
+    request = api_client.rest_client.request
+
+    def gzip_request(method, url, query_params=None, headers=None, **kwargs):
+        if method == 'GET' and not any(name in STREAMING_PARAMS for name, _ in query_params or ()):
+            headers = dict(headers or {}, **{'Accept-Encoding': 'gzip'})
+        return request(method, url, query_params=query_params, headers=headers, **kwargs)
+
+    api_client.rest_client.request = gzip_request
+
+
+PARTIAL_OBJECT_METADATA_LIST = 'application/json;as=PartialObjectMetadataList;v=v1;g=meta.k8s.io,application/json'
+TABLE = 'application/json;as=Table;v=v1;g=meta.k8s.io,application/json'
+
+
+class MetadataLister:
+    """LIST a core/v1 resource asking the server for object metadata only.
+
+    Callable like the generated list_namespaced_* methods (namespace, limit,
+    _continue), with namespace=None listing across all namespaces. With
+    table=True the server-side Table is requested instead so printed columns
+    such as a Secret's type come along without the data payload.
+    """
+
+    def __init__(self, api_client, plural, table=False):
+        self.api_client = api_client
+        self.plural = plural
+        self.table = table
+
+    def __call__(self, namespace=None, limit=None, _continue=None, _preload_content=True):
+        if namespace:
+            path = f'/api/v1/namespaces/{namespace}/{self.plural}'
+        else:
+            path = f'/api/v1/{self.plural}'
+        query_params = []
+        if self.table:
+            query_params.append(('includeObject', 'Metadata'))
+        if limit:
+            query_params.append(('limit', limit))
+        if _continue:
+            query_params.append(('continue', _continue))
+        response = self.api_client.call_api(
+            path, 'GET',
+            query_params=query_params,
+            header_params={'Accept': TABLE if self.table else PARTIAL_OBJECT_METADATA_LIST},
+            auth_settings=['BearerToken'],
+            _return_http_data_only=True,
+            _preload_content=False)
+        if not _preload_content:
+            return response
+        try:
+            return decode_page(response.data)
+        finally:
+            response.release_conn()
+
+
+def parse_timestamp(value):
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).astimezone(timezone.utc)
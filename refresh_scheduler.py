@@ -0,0 +1,152 @@
+import time
+
+from PyQt5.QtCore import QObject, QTimer
+
+from api_scheduler import VISIBLE, request_scope
+
+# Job priorities; due jobs start in this order and LOW jobs wait while a
+# higher-priority job is still running, for up to one of their own intervals
+HIGH = 0
+NORMAL = 1
+LOW = 2
+
+TICK_MS = 250
+# A job that takes longer than its interval is pushed out to at most this
+# many times its configured interval
+MAX_BACKOFF_FACTOR = 8
+
+
+class RefreshJob:
+    def __init__(self, name, callback, interval_ms, widget, priority, asynchronous):
+        self.name = name
+        self.callback = callback
+        self.interval_ms = interval_ms
+        self.widget = widget
+        self.priority = priority
+        self.asynchronous = asynchronous
+        self.current_interval_ms = interval_ms
+        self.next_due = time.monotonic() + interval_ms / 1000 if interval_ms else None
+        self.running = False
+        self.started_at = None
+        self.last_duration = None
+        self.runs = 0
+        self.coalesced = 0
+
+    def is_visible(self):
+        if self.widget is None:
+            return True
+        return self.widget.isVisible() and not self.widget.window().isMinimized()
+
+    def reset(self):
+        self.current_interval_ms = self.interval_ms
+        self.next_due = time.monotonic() + self.interval_ms / 1000 if self.interval_ms else None
+
+
+class RefreshScheduler(QObject):
+    """One timer driving every periodic refresh in the application.
+
+    Tabs register a job with `register(name, callback, interval_ms, widget)`.
+    A job only runs while its widget is visible and its window isn't
+    minimised; one that came due while hidden runs once as soon as it is
+    shown again. A job is never started while its previous run is still
+    going: synchronous callbacks finish when they return, asynchronous ones
+    when the owner calls `finished(name)`, typically from its worker's
+    signal. When a run takes longer than the job's interval, the interval is
+    doubled (up to MAX_BACKOFF_FACTOR times the configured one) and drops
+    back once runs are fast again.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.jobs = {}
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.tick)
+        self.timer.start(TICK_MS)
+
+    def register(self, name, callback, interval_ms, widget=None, priority=NORMAL, asynchronous=False):
+        """Add or replace a job. An interval of 0 registers it paused."""
+        job = RefreshJob(name, callback, interval_ms, widget, priority, asynchronous)
+        self.jobs[name] = job
+        return job
+
+    def unregister(self, name):
+        self.jobs.pop(name, None)
+
+    def set_interval(self, name, interval_ms):
+        job = self.jobs.get(name)
+        if job:
+            job.interval_ms = interval_ms
+            job.reset()
+
+    def finished(self, name):
+        """Mark an asynchronous job's run as done. Harmless if it wasn't running."""
+        job = self.jobs.get(name)
+        if job and job.running:
+            self.complete(job)
+
+    def tick(self):
+        now = time.monotonic()
+        due = [job for job in self.jobs.values()
+               if job.next_due is not None and job.next_due <= now and job.is_visible()]
+        for job in sorted(due, key=lambda job: job.priority):
+            if job.running:
+                # Still busy with the previous run; this one is folded into it
+                job.coalesced += 1
+                job.next_due = now + job.current_interval_ms / 1000
+                continue
+            if job.priority == LOW and self.busy_since(now - job.current_interval_ms / 1000):
+                continue
+            self.run(job)
+
+    def busy_since(self, since):
+        return any(job.running and job.priority < LOW and job.started_at > since for job in self.jobs.values())
+
+    def run(self, job):
+        job.running = True
+        job.started_at = time.monotonic()
+        job.runs += 1
+        try:
+            # Calls a job makes on the GUI thread are visible refreshes: not
+            # user actions, but not queued behind background work either,
+            # since the whole window waits on them
+            with request_scope(VISIBLE):
+                job.callback()
+        except Exception as e:
+            print(f"Refresh job {job.name} failed: {e}")
+            self.complete(job)
+            return
+        if not job.asynchronous:
+            self.complete(job)
+
+    def complete(self, job):
+        now = time.monotonic()
+        job.running = False
+        job.last_duration = now - job.started_at
+        if job.interval_ms:
+            duration_ms = job.last_duration * 1000
+            if duration_ms > job.current_interval_ms:
+                job.current_interval_ms = min(job.current_interval_ms * 2, job.interval_ms * MAX_BACKOFF_FACTOR)
+            elif duration_ms < job.interval_ms / 2:
+                job.current_interval_ms = job.interval_ms
+            job.next_due = now + job.current_interval_ms / 1000
+
+    def stop(self):
+        self.timer.stop()
+        self.jobs.clear()
+
+    def stats(self):
+        return {name: {'interval_ms': job.current_interval_ms, 'runs': job.runs, 'coalesced': job.coalesced,
+                       'last_duration': job.last_duration, 'running': job.running}
+                for name, job in self.jobs.items()}
+
+
+_scheduler = None
+
+
+def get_scheduler():
+    # Created on first use so its timer lives on the GUI thread after the
+    # QApplication exists
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = RefreshScheduler()
+    return _scheduler
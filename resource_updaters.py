@@ -1,17 +1,24 @@
-from PyQt5.QtGui import QStandardItem, QBrush, QColor
-from utils import parse_k8s_cpu, parse_k8s_memory, get_color_for_usage
+from helper_view_tab.resource_table_model import TableCell
+from informer_cache import object_key, list_function_for_kind
+from raw_api import parse_timestamp, MetadataLister
+from utils import parse_k8s_cpu, parse_k8s_memory, get_color_for_usage, iter_list_pages
+from api_scheduler import VISIBLE, request_scope
 from datetime import datetime, timezone
 from PyQt5.QtCore import QObject, pyqtSignal, QThread
 from kubernetes import watch
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-def add_age_column(model, creation_timestamp, row, column):
-    age = calculate_age(creation_timestamp)
-    model.setItem(row, column, QStandardItem(age))
+# Selections larger than this are served by a single *_for_all_namespaces LIST
+ALL_NAMESPACES_THRESHOLD = 15
+# Half of client_registry.CONNECTION_POOL_MAXSIZE, leaving the rest for
+# watches and the other tabs
+MAX_PARALLEL_LISTS = 8
 
 def calculate_age(creation_timestamp):
     now = datetime.now(timezone.utc)
-    age = now - creation_timestamp
+    age = now - parse_timestamp(creation_timestamp)
     days, seconds = age.days, age.seconds
     hours = seconds // 3600
     minutes = (seconds % 3600) // 60
@@ -22,73 +29,138 @@ def calculate_age(creation_timestamp):
     else:
         return f"{minutes}m"
 
-def update_pods(gui, namespaces, model):
-    model.setColumnCount(7)  # Not 9, as we'll add the Action column in the main GUI
-    model.setHorizontalHeaderLabels(["Namespace", "Pod Name", "Ready", "Status", "Restarts", "Age", "Node"])
+class FetchCancelled(Exception):
+    pass
+
+class FetchContext:
+    """Carries the cancellation flag, timings and page callback for one in-flight table fetch."""
+
+    def __init__(self, on_rows=None, priority=VISIBLE):
+        self.cancel_event = threading.Event()
+        self.priority = priority
+        self.latencies = {}
+        self.on_rows = on_rows
+        self.loaded = 0
+        self.warnings = []
+        self.lock = threading.Lock()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def is_cancelled(self):
+        return self.cancel_event.is_set()
+
+    def check(self):
+        if self.cancel_event.is_set():
+            raise FetchCancelled()
+
+    def record_latency(self, namespace, seconds):
+        with self.lock:
+            self.latencies[namespace] = self.latencies.get(namespace, 0) + seconds
+
+    def warn(self, message):
+        with self.lock:
+            self.warnings.append(message)
+
+    def latency_summary(self, count=3):
+        slowest = sorted(self.latencies.items(), key=lambda item: item[1], reverse=True)[:count]
+        return ", ".join(f"{namespace} {seconds:.2f}s" for namespace, seconds in slowest)
+
+    def page_loaded(self, headers, rows):
+        with self.lock:
+            self.loaded += len(rows)
+            loaded = self.loaded
+        if self.on_rows and rows:
+            self.on_rows(headers, rows, loaded)
+
+def list_pages_as_rows(list_func, namespace, ctx, headers, row_func, keep=None):
+    # Convert each page as soon as it arrives so only one page of API
+    # objects is alive at a time, and hand it to the table progressively.
+    label = namespace or "all namespaces"
+    args = (namespace,) if namespace is not None else ()
+    rows = []
+    # Table rows only read a handful of fields, so skip model deserialization
+    pages = iter_list_pages(list_func, *args, raw=True)
+    while True:
+        ctx.check()
+        start = time.monotonic()
+        # Pool threads don't inherit the worker's scope, so set it per page
+        with request_scope(ctx.priority, ctx.check):
+            page = next(pages, None)
+        ctx.record_latency(label, time.monotonic() - start)
+        if page is None:
+            break
+        page_rows = [row_func(item) for item in page.items if keep is None or item.metadata.namespace in keep]
+        rows.extend(page_rows)
+        ctx.page_loaded(headers, page_rows)
+    return rows
+
+def list_rows(gui, kind, list_func, namespaces, ctx, headers, row_func, all_namespaces_func=None):
+    ctx = ctx or FetchContext()
+    # Serve from the informer cache once it has synced, otherwise fall back
+    # to a direct paginated LIST so the first paint does not wait on the watch.
+    items = gui.informer_cache.items(kind, namespaces)
+    if items is not None:
+        return [row_func(item) for item in items]
+    if namespaces is None:
+        return list_pages_as_rows(list_func, None, ctx, headers, row_func)
+
+    namespaces = list(dict.fromkeys(namespaces))
+    if len(namespaces) > ALL_NAMESPACES_THRESHOLD:
+        # One cluster-wide LIST beats dozens of per-namespace round trips
+        order = {namespace: i for i, namespace in enumerate(namespaces)}
+        all_namespaces_func = all_namespaces_func or list_function_for_kind(gui, kind)
+        rows = list_pages_as_rows(all_namespaces_func, None, ctx, headers, row_func, keep=order)
+        rows.sort(key=lambda row: order[row[0][0]])
+        return rows
+
+    if len(namespaces) == 1:
+        return list_pages_as_rows(list_func, namespaces[0], ctx, headers, row_func)
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_LISTS, len(namespaces))) as executor:
+        results = list(executor.map(
+            lambda namespace: list_pages_as_rows(list_func, namespace, ctx, headers, row_func), namespaces))
+    return [row for rows in results for row in rows]
+
+def pod_row(pod):
+    # Ready status
+    container_statuses = pod.status.container_statuses or []
+    ready_containers = sum(status.ready for status in container_statuses)
+    total_containers = len(container_statuses)
+    ready_color = "green" if ready_containers == total_containers else "red"
     
-    row = 0
-    for namespace in namespaces:
-        pods = gui.v1.list_namespaced_pod(namespace)
-        for pod in pods.items:
-            model.insertRow(row)
-            model.setItem(row, 0, QStandardItem(namespace))
-            model.setItem(row, 1, QStandardItem(pod.metadata.name))
-            
-            # Ready status
-            container_statuses = pod.status.container_statuses or []
-            ready_containers = sum(status.ready for status in container_statuses)
-            total_containers = len(container_statuses)
-            ready_item = QStandardItem(f"{ready_containers}/{total_containers}")
-            if ready_containers == total_containers:
-                ready_item.setForeground(QBrush(QColor("green")))
-            else:
-                ready_item.setForeground(QBrush(QColor("red")))
-            model.setItem(row, 2, ready_item)
-            
-            model.setItem(row, 3, QStandardItem(pod.status.phase))
-            
-            # Restarts
-            restarts = sum(status.restart_count for status in container_statuses)
-            model.setItem(row, 4, QStandardItem(str(restarts)))
-            
-            # Age
-            age = calculate_age(pod.metadata.creation_timestamp)
-            model.setItem(row, 5, QStandardItem(age))
-            
-            model.setItem(row, 6, QStandardItem(pod.spec.node_name))
-            row += 1
-    # After populating the table
-    gui.resource_table.setColumnWidth(0, 100)  # Namespace
-    gui.resource_table.setColumnWidth(1, 250)  # Pod Name
-    gui.resource_table.setColumnWidth(2, 40)   # Ready
-    gui.resource_table.setColumnWidth(3, 40)   # Status
-    gui.resource_table.setColumnWidth(4, 40)   # Restarts
-    gui.resource_table.setColumnWidth(5, 50)   # Age
-    gui.resource_table.setColumnWidth(6, 250)   # Node
+    # Restarts
+    restarts = sum(status.restart_count for status in container_statuses)
     
+    return object_key(pod), [
+        TableCell(pod.metadata.namespace),
+        TableCell(pod.metadata.name),
+        TableCell(f"{ready_containers}/{total_containers}", foreground=ready_color),
+        TableCell(pod.status.phase),
+        TableCell(str(restarts)),
+        TableCell(calculate_age(pod.metadata.creation_timestamp)),
+        TableCell(pod.spec.node_name),
+    ]
 
-def update_pvcs(gui, namespaces, model):
-    model.setColumnCount(5)
-    model.setHorizontalHeaderLabels(["Namespace", "PVC Name", "Status", "Capacity", "Age"])
-    
-    row = 0
-    for namespace in namespaces:
-        pvcs = gui.v1.list_namespaced_persistent_volume_claim(namespace)
-        for pvc in pvcs.items:
-            model.insertRow(row)
-            model.setItem(row, 0, QStandardItem(namespace))
-            model.setItem(row, 1, QStandardItem(pvc.metadata.name))
-            model.setItem(row, 2, QStandardItem(pvc.status.phase))
-            model.setItem(row, 3, QStandardItem(pvc.spec.resources.requests['storage']))
-            add_age_column(model, pvc.metadata.creation_timestamp, row, 4)
-            row += 1
-
-def update_nodes(gui, model):
-    model.setColumnCount(5)
-    model.setHorizontalHeaderLabels(["Name", "Status", "Role", "Age", "CPU Usage", "Memory Usage"])
+def fetch_pods(gui, namespaces, ctx=None):
+    headers = ["Namespace", "Pod Name", "Ready", "Status", "Restarts", "Age", "Node"]
+    return headers, list_rows(gui, "Pods", gui.v1.list_namespaced_pod, namespaces, ctx, headers, pod_row)
+
+def pvc_row(pvc):
+    return object_key(pvc), [
+        TableCell(pvc.metadata.namespace),
+        TableCell(pvc.metadata.name),
+        TableCell(pvc.status.phase),
+        TableCell(pvc.spec.resources.requests['storage']),
+        TableCell(calculate_age(pvc.metadata.creation_timestamp)),
+    ]
+
+def fetch_pvcs(gui, namespaces, ctx=None):
+    headers = ["Namespace", "PVC Name", "Status", "Capacity", "Age"]
+    return headers, list_rows(gui, "PVC", gui.v1.list_namespaced_persistent_volume_claim, namespaces, ctx, headers, pvc_row)
+
+def fetch_nodes(gui, namespaces=None, ctx=None):
+    headers = ["Name", "Status", "Role", "Age", "CPU Usage", "Memory Usage"]
     
-    row = 0
-    nodes = gui.v1.list_node()
     try:
         metrics = gui.custom_api.list_cluster_custom_object(
             group="metrics.k8s.io",
@@ -99,157 +171,174 @@ def update_nodes(gui, model):
     except:
         node_metrics = {}
     
-    for node in nodes.items:
-        model.insertRow(row)
-        model.setItem(row, 0, QStandardItem(node.metadata.name))
-        model.setItem(row, 1, QStandardItem(node.status.conditions[-1].type))
-        
+    def node_row(node):
         # Determine if node is master or worker
         role = "worker"
         if any(label.startswith("node-role.kubernetes.io/master") or label.startswith("node-role.kubernetes.io/control-plane") for label in node.metadata.labels):
             role = "master"
-        model.setItem(row, 2, QStandardItem(role))
-        
-        add_age_column(model, node.metadata.creation_timestamp, row, 3)
         
         if node.metadata.name in node_metrics:
             metric = node_metrics[node.metadata.name]
             cpu_usage = parse_k8s_cpu(metric['usage']['cpu'])
             memory_usage = parse_k8s_memory(metric['usage']['memory'])
             
-            cpu_item = QStandardItem(f"{cpu_usage:.2f}m")
-            cpu_item.setBackground(get_color_for_usage(cpu_usage))
-            memory_item = QStandardItem(f"{memory_usage/1024/1024:.2f}Mi")
-            memory_item.setBackground(get_color_for_usage(memory_usage/1024/1024))
-            
-            model.setItem(row, 4, cpu_item)
-            model.setItem(row, 5, memory_item)
+            cpu_cell = TableCell(f"{cpu_usage:.2f}m", background=get_color_for_usage(cpu_usage))
+            memory_cell = TableCell(f"{memory_usage/1024/1024:.2f}Mi", background=get_color_for_usage(memory_usage/1024/1024))
         else:
-            model.setItem(row, 4, QStandardItem("N/A"))
-            model.setItem(row, 5, QStandardItem("N/A"))
+            cpu_cell = TableCell("N/A")
+            memory_cell = TableCell("N/A")
         
-        row += 1
-
-def update_statefulsets(gui, namespaces, model):
-    model.setColumnCount(4)
-    model.setHorizontalHeaderLabels(["Namespace", "StatefulSet Name", "Replicas", "Ready Replicas", "Age"])
-    
-    row = 0
-    for namespace in namespaces:
-        statefulsets = gui.apps_v1.list_namespaced_stateful_set(namespace)
-        for sts in statefulsets.items:
-            model.insertRow(row)
-            model.setItem(row, 0, QStandardItem(namespace))
-            model.setItem(row, 1, QStandardItem(sts.metadata.name))
-            model.setItem(row, 2, QStandardItem(str(sts.spec.replicas)))
-            model.setItem(row, 3, QStandardItem(str(sts.status.ready_replicas)))
-            add_age_column(model, sts.metadata.creation_timestamp, row, 4)
-            row += 1
-
-def update_deployments(gui, namespaces, model):
-    model.setColumnCount(5)
-    model.setHorizontalHeaderLabels(["Namespace", "Deployment Name", "Replicas", "Available Replicas", "Age"])
+        return object_key(node), [
+            TableCell(node.metadata.name),
+            TableCell(node.status.conditions[-1].type),
+            TableCell(role),
+            TableCell(calculate_age(node.metadata.creation_timestamp)),
+            cpu_cell,
+            memory_cell,
+        ]
     
-    row = 0
-    for namespace in namespaces:
-        deployments = gui.apps_v1.list_namespaced_deployment(namespace)
-        for deploy in deployments.items:
-            model.insertRow(row)
-            model.setItem(row, 0, QStandardItem(namespace))
-            model.setItem(row, 1, QStandardItem(deploy.metadata.name))
-            model.setItem(row, 2, QStandardItem(str(deploy.spec.replicas)))
-            model.setItem(row, 3, QStandardItem(str(deploy.status.available_replicas)))
-            add_age_column(model, deploy.metadata.creation_timestamp, row, 4)
-            row += 1
-
-def update_pvs(gui, model):
-    model.setColumnCount(5)
-    model.setHorizontalHeaderLabels(["PV Name", "Capacity", "Access Modes", "Status", "Age"])
+    return headers, list_rows(gui, "Nodes", gui.v1.list_node, None, ctx, headers, node_row)
+
+def statefulset_row(sts):
+    return object_key(sts), [
+        TableCell(sts.metadata.namespace),
+        TableCell(sts.metadata.name),
+        TableCell(str(sts.spec.replicas)),
+        TableCell(str(sts.status.ready_replicas)),
+        TableCell(calculate_age(sts.metadata.creation_timestamp)),
+    ]
+
+def fetch_statefulsets(gui, namespaces, ctx=None):
+    headers = ["Namespace", "StatefulSet Name", "Replicas", "Ready Replicas", "Age"]
+    return headers, list_rows(gui, "StatefulSets", gui.apps_v1.list_namespaced_stateful_set, namespaces, ctx, headers, statefulset_row)
+
+def deployment_row(deploy):
+    return object_key(deploy), [
+        TableCell(deploy.metadata.namespace),
+        TableCell(deploy.metadata.name),
+        TableCell(str(deploy.spec.replicas)),
+        TableCell(str(deploy.status.available_replicas)),
+        TableCell(calculate_age(deploy.metadata.creation_timestamp)),
+    ]
+
+def fetch_deployments(gui, namespaces, ctx=None):
+    headers = ["Namespace", "Deployment Name", "Replicas", "Available Replicas", "Age"]
+    return headers, list_rows(gui, "Deployments", gui.apps_v1.list_namespaced_deployment, namespaces, ctx, headers, deployment_row)
+
+def pv_row(pv):
+    return object_key(pv), [
+        TableCell(pv.metadata.name),
+        TableCell(pv.spec.capacity['storage']),
+        TableCell(', '.join(pv.spec.access_modes)),
+        TableCell(pv.status.phase),
+        TableCell(calculate_age(pv.metadata.creation_timestamp)),
+    ]
+
+def fetch_pvs(gui, namespaces=None, ctx=None):
+    headers = ["PV Name", "Capacity", "Access Modes", "Status", "Age"]
+    return headers, list_rows(gui, "PV", gui.v1.list_persistent_volume, None, ctx, headers, pv_row)
+
+def secret_row(secret):
+    # Listed as a server-side Table with metadata only, so the type comes
+    # from the printed columns rather than the (absent) secret body
+    secret_type = secret.cells['Type'] if secret.cells else secret.type
+    return object_key(secret), [
+        TableCell(secret.metadata.namespace),
+        TableCell(secret.metadata.name),
+        TableCell(secret_type),
+        TableCell(calculate_age(secret.metadata.creation_timestamp)),
+    ]
+
+def fetch_secrets(gui, namespaces, ctx=None):
+    headers = ["Namespace", "Secret Name", "Type", "Age"]
+    list_func = MetadataLister(gui.v1.api_client, "secrets", table=True)
+    return headers, list_rows(gui, "Secrets", list_func, namespaces, ctx, headers, secret_row, list_func)
+
+def configmap_row(cm):
+    return object_key(cm), [
+        TableCell(cm.metadata.namespace),
+        TableCell(cm.metadata.name),
+        TableCell(calculate_age(cm.metadata.creation_timestamp)),
+    ]
+
+def fetch_configmaps(gui, namespaces, ctx=None):
+    headers = ["Namespace", "ConfigMap Name", "Age"]
+    list_func = MetadataLister(gui.v1.api_client, "configmaps")
+    return headers, list_rows(gui, "ConfigMaps", list_func, namespaces, ctx, headers, configmap_row, list_func)
+
+def job_row(job):
+    duration = "N/A"
+    if job.status.start_time and job.status.completion_time:
+        duration = str(parse_timestamp(job.status.completion_time) - parse_timestamp(job.status.start_time))
     
-    row = 0
-    pvs = gui.v1.list_persistent_volume()
-    for pv in pvs.items:
-        model.insertRow(row)
-        model.setItem(row, 0, QStandardItem(pv.metadata.name))
-        model.setItem(row, 1, QStandardItem(pv.spec.capacity['storage']))
-        model.setItem(row, 2, QStandardItem(', '.join(pv.spec.access_modes)))
-        model.setItem(row, 3, QStandardItem(pv.status.phase))
-        model.setItem(row, 4, QStandardItem(calculate_age(pv.metadata.creation_timestamp)))
-        row += 1
-
-def update_secrets(gui, namespaces, model):
-    model.setColumnCount(4)
-    model.setHorizontalHeaderLabels(["Namespace", "Secret Name", "Type", "Age"])
+    return object_key(job), [
+        TableCell(job.metadata.namespace),
+        TableCell(job.metadata.name),
+        TableCell(f"{job.status.succeeded or 0}/{job.spec.completions or 1}"),
+        TableCell(str(job.status.succeeded or 0)),
+        TableCell(calculate_age(job.metadata.creation_timestamp)),
+        TableCell(duration),
+    ]
+
+def fetch_jobs(gui, namespaces, ctx=None):
+    headers = ["Namespace", "Job Name", "Completions", "Succeeded", "Age", "Duration"]
+    return headers, list_rows(gui, "Jobs", gui.batch_v1.list_namespaced_job, namespaces, ctx, headers, job_row)
+
+def cronjob_row(cronjob):
+    last_schedule = "N/A"
+    if cronjob.status.last_schedule_time:
+        last_schedule = calculate_age(cronjob.status.last_schedule_time)
     
-    row = 0
-    for namespace in namespaces:
-        secrets = gui.v1.list_namespaced_secret(namespace)
-        for secret in secrets.items:
-            model.insertRow(row)
-            model.setItem(row, 0, QStandardItem(namespace))
-            model.setItem(row, 1, QStandardItem(secret.metadata.name))
-            model.setItem(row, 2, QStandardItem(secret.type))
-            model.setItem(row, 3, QStandardItem(calculate_age(secret.metadata.creation_timestamp)))
-            row += 1
-
-def update_configmaps(gui, namespaces, model):
-    model.setColumnCount(3)
-    model.setHorizontalHeaderLabels(["Namespace", "ConfigMap Name", "Age"])
+    return object_key(cronjob), [
+        TableCell(cronjob.metadata.namespace),
+        TableCell(cronjob.metadata.name),
+        TableCell(cronjob.spec.schedule),
+        TableCell(str(cronjob.spec.suspend or False)),
+        TableCell(str(len(cronjob.status.active or []))),
+        TableCell(last_schedule),
+        TableCell(calculate_age(cronjob.metadata.creation_timestamp)),
+    ]
+
+def fetch_cronjobs(gui, namespaces, ctx=None):
+    headers = ["Namespace", "CronJob Name", "Schedule", "Suspend", "Active", "Last Schedule" , "Age"]
+    return headers, list_rows(gui, "CronJobs", gui.batch_v1.list_namespaced_cron_job, namespaces, ctx, headers, cronjob_row)
+
+def fetch_services(gui, namespaces, ctx=None):
+    headers = ["Namespace", "Name", "Cluster IP", "External IP", "Ports", "Age", "Port Forwarding", "Actions"]
     
-    row = 0
-    for namespace in namespaces:
-        configmaps = gui.v1.list_namespaced_config_map(namespace)
-        for cm in configmaps.items:
-            model.insertRow(row)
-            model.setItem(row, 0, QStandardItem(namespace))
-            model.setItem(row, 1, QStandardItem(cm.metadata.name))
-            model.setItem(row, 2, QStandardItem(calculate_age(cm.metadata.creation_timestamp)))
-            row += 1
-
-def update_jobs(gui, namespaces, model):
-    model.setColumnCount(5)
-    model.setHorizontalHeaderLabels(["Namespace", "Job Name", "Completions", "Succeeded", "Age"])
+    def service_row(service):
+        external_ips = service.status.load_balancer.ingress[0].ip if service.status.load_balancer.ingress else "None"
+        ports = ", ".join([f"{port.port}/{port.protocol}" for port in service.spec.ports])
+        port_forwarding = gui.get_port_forwarding_status(service.metadata.namespace, service.metadata.name)
+        return object_key(service), [
+            TableCell(service.metadata.namespace),
+            TableCell(service.metadata.name),
+            TableCell(service.spec.cluster_ip),
+            TableCell(external_ips),
+            TableCell(ports),
+            TableCell(str(parse_timestamp(service.metadata.creation_timestamp))),
+            TableCell(port_forwarding),
+            TableCell(""),
+        ]
     
-    row = 0
-    for namespace in namespaces:
-        jobs = gui.batch_v1.list_namespaced_job(namespace)
-        for job in jobs.items:
-            model.insertRow(row)
-            model.setItem(row, 0, QStandardItem(namespace))
-            model.setItem(row, 1, QStandardItem(job.metadata.name))
-            model.setItem(row, 2, QStandardItem(f"{job.status.succeeded or 0}/{job.spec.completions or 1}"))
-            model.setItem(row, 3, QStandardItem(str(job.status.succeeded or 0)))
-            model.setItem(row, 4, QStandardItem(calculate_age(job.metadata.creation_timestamp)))
-            
-            duration = "N/A"
-            if job.status.start_time and job.status.completion_time:
-                duration = str(job.status.completion_time - job.status.start_time)
-            model.setItem(row, 5, QStandardItem(duration))
-            
-            row += 1
+    return headers, list_rows(gui, "Services", gui.v1.list_namespaced_service, namespaces, ctx, headers, service_row)
 
-def update_cronjobs(gui, namespaces, model):
-    model.setColumnCount(7)
-    model.setHorizontalHeaderLabels(["Namespace", "CronJob Name", "Schedule", "Suspend", "Active", "Last Schedule" , "Age"])
-    
-    row = 0
-    for namespace in namespaces:
-        cronjobs = gui.batch_v1.list_namespaced_cron_job(namespace)
-        for cronjob in cronjobs.items:
-            model.insertRow(row)
-            model.setItem(row, 0, QStandardItem(namespace))
-            model.setItem(row, 1, QStandardItem(cronjob.metadata.name))
-            model.setItem(row, 2, QStandardItem(cronjob.spec.schedule))
-            model.setItem(row, 3, QStandardItem(str(cronjob.spec.suspend or False)))
-            model.setItem(row, 4, QStandardItem(str(len(cronjob.status.active or []))))
-            model.setItem(row, 5, QStandardItem(calculate_age(cronjob.metadata.creation_timestamp)))
-            
-            last_schedule = "N/A"
-            if cronjob.status.last_schedule_time:
-                last_schedule = calculate_age(cronjob.status.last_schedule_time)
-            model.setItem(row, 5, QStandardItem(last_schedule))
-            
-            row += 1
+RESOURCE_FETCHERS = {
+    "Pods": fetch_pods,
+    "Deployments": fetch_deployments,
+    "StatefulSets": fetch_statefulsets,
+    "Jobs": fetch_jobs,
+    "CronJobs": fetch_cronjobs,
+    "PVC": fetch_pvcs,
+    "PV": fetch_pvs,
+    "Secrets": fetch_secrets,
+    "ConfigMaps": fetch_configmaps,
+    "Services": fetch_services,
+    "Nodes": fetch_nodes,
+}
+
+def fetch_resources(gui, resource_type, namespaces, ctx=None):
+    return RESOURCE_FETCHERS[resource_type](gui, namespaces, ctx)
 
 
 
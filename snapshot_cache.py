@@ -0,0 +1,136 @@
+import gzip
+import json
+import os
+import re
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtGui import QColor
+
+from helper_view_tab.resource_table_model import TableCell
+
+SNAPSHOT_DIR = os.path.join(os.path.expanduser("~"), ".kubenexus", "snapshots")
+SNAPSHOT_VERSION = 1
+
+Snapshot = namedtuple("Snapshot", ["headers", "rows", "saved_at"])
+
+# Writes go through one background thread so the GUI never waits on gzip and
+# two saves of the same file can't interleave
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot")
+_lock = threading.Lock()
+
+
+def snapshot_path(context, kind):
+    safe = lambda name: re.sub(r'[^A-Za-z0-9_.-]', '_', name)
+    return os.path.join(SNAPSHOT_DIR, safe(context), f"{safe(kind)}.json.gz")
+
+
+def encode_color(value):
+    # Rows may carry QColors (e.g. the Nodes usage backgrounds); the model
+    # takes any QColor spec, so a snapshot stores them as #AARRGGBB
+    return value.name(QColor.HexArgb) if isinstance(value, QColor) else value
+
+
+def encode_cells(cells):
+    # Drop trailing unset colors so the common [text] case stays small
+    encoded = []
+    for cell in cells:
+        values = [cell[0]] + [encode_color(value) for value in cell[1:]]
+        while len(values) > 1 and values[-1] is None:
+            values.pop()
+        encoded.append(values)
+    return encoded
+
+
+def read_snapshot(context, kind):
+    path = snapshot_path(context, kind)
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable snapshot {path}: {e}")
+        return None
+    if data.get('version') != SNAPSHOT_VERSION:
+        return None
+    return data
+
+
+def load_snapshot(context, kind, namespaces=None):
+    """Return the last saved table for (context, kind), or None.
+
+    With namespaces, only rows in those namespaces (and cluster-scoped rows)
+    are returned, in the order of the selection.
+    """
+    if not context:
+        return None
+    with _lock:
+        data = read_snapshot(context, kind)
+    if data is None:
+        return None
+    rows = [(tuple(key), [TableCell(*cell) for cell in cells]) for key, cells in data['rows']]
+    if namespaces is not None:
+        order = {namespace: i for i, namespace in enumerate(dict.fromkeys(namespaces))}
+        rows = [row for row in rows if not row[0][0] or row[0][0] in order]
+        rows.sort(key=lambda row: order.get(row[0][0], -1))
+    return Snapshot(data['headers'], rows, data['saved_at'])
+
+
+def write_snapshot(context, kind, headers, rows, namespaces):
+    with _lock:
+        previous = read_snapshot(context, kind)
+        kept = []
+        if previous is not None and previous['headers'] == headers and namespaces is not None:
+            # Keep rows for namespaces outside this refresh so switching the
+            # selection back still has something to show
+            refreshed = set(namespaces)
+            kept = [row for row in previous['rows'] if row[0][0] and row[0][0] not in refreshed]
+        data = {
+            'version': SNAPSHOT_VERSION,
+            'saved_at': time.time(),
+            'headers': headers,
+            'rows': kept + [[list(key), encode_cells(cells)] for key, cells in rows],
+        }
+        path = snapshot_path(context, kind)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        try:
+            with gzip.open(tmp_path, 'wt', encoding='utf-8', compresslevel=5) as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Error saving snapshot {path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def save_snapshot(context, kind, headers, rows, namespaces=None):
+    """Persist a freshly fetched table in the background."""
+    if context:
+        _writer.submit(write_snapshot, context, kind, list(headers), list(rows), namespaces)
+
+
+def load_list(context, name):
+    snapshot = load_snapshot(context, name)
+    return [key[1] for key, _ in snapshot.rows] if snapshot else None
+
+
+def save_list(context, name, values):
+    """Persist a plain list of names (e.g. namespaces) as a one-column table."""
+    save_snapshot(context, name, [name], [(("", value), [TableCell(value)]) for value in values])
+
+
+def describe_age(saved_at):
+    seconds = max(0, int(time.time() - saved_at))
+    if seconds < 60:
+        return f"{seconds}s ago"
+    if seconds < 3600:
+        return f"{seconds // 60}m ago"
+    if seconds < 86400:
+        return f"{seconds // 3600}h ago"
+    return f"{seconds // 86400}d ago"
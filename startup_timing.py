@@ -0,0 +1,94 @@
+import importlib
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+from PyQt5.QtCore import QEvent, QObject
+
+# Set KUBENEXUS_STARTUP_TIMING=0 to silence the report
+ENABLED = os.environ.get("KUBENEXUS_STARTUP_TIMING", "1") != "0"
+
+_started = time.perf_counter()
+
+
+class StartupTimer:
+    """Records import, init and first-paint times for the window and each tab.
+
+    Times are seconds; first paint is measured from process start (when this
+    module is first imported) so the main window's entry is the number to
+    watch for a fast cold start.
+    """
+
+    def __init__(self):
+        self.timings = {}
+        self.watchers = []
+
+    def record(self, name, phase, seconds):
+        self.timings.setdefault(name, {})[phase] = seconds
+
+    @contextmanager
+    def measure(self, name, phase):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, phase, time.perf_counter() - start)
+
+    def import_module(self, name, module_name):
+        # Time only the first import; later lookups hit sys.modules
+        if module_name in sys.modules:
+            return sys.modules[module_name]
+        with self.measure(name, 'import'):
+            return importlib.import_module(module_name)
+
+    def import_attribute(self, name, module_name, attribute):
+        return getattr(self.import_module(name, module_name), attribute)
+
+    def watch_first_paint(self, name, widget, on_painted=None):
+        watcher = FirstPaintWatcher(self, name, on_painted)
+        widget.installEventFilter(watcher)
+        self.watchers.append(watcher)
+
+    def report(self, names=None):
+        if not ENABLED:
+            return
+        names = names or list(self.timings)
+        lines = [f"{'Startup timing':<28}{'import':>10}{'init':>10}{'first paint':>14}"]
+        for name in names:
+            phases = self.timings.get(name, {})
+            lines.append(f"{name:<28}"
+                         f"{self.format(phases.get('import')):>10}"
+                         f"{self.format(phases.get('init')):>10}"
+                         f"{self.format(phases.get('first_paint')):>14}")
+        print("\n".join(lines))
+
+    @staticmethod
+    def format(seconds):
+        return "-" if seconds is None else f"{seconds * 1000:.0f} ms"
+
+
+class FirstPaintWatcher(QObject):
+    def __init__(self, timer, name, on_painted):
+        super().__init__()
+        self.timer = timer
+        self.name = name
+        self.on_painted = on_painted
+        self.created = time.perf_counter()
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            obj.removeEventFilter(self)
+            self.timer.watchers.remove(self)
+            if self.name == MAIN_WINDOW:
+                self.timer.record(self.name, 'first_paint', time.perf_counter() - _started)
+            else:
+                self.timer.record(self.name, 'first_paint', time.perf_counter() - self.created)
+            if self.on_painted:
+                self.on_painted()
+        return False
+
+
+MAIN_WINDOW = "Main window"
+
+timer = StartupTimer()
@@ -28,7 +28,8 @@ from helper_system_tab.ssh_dialog import SSHDialog
 from helper_system_tab.ssh_file_browser import SSHFileBrowser
 from helper_system_tab.file_edit_dialog import FileEditDialog
 from helper_system_tab.application_table import ApplicationTable
-from helper_system_tab.utils import FileContentViewer, SystemInfoThread
+from helper_system_tab.utils import FileContentViewer
+from refresh_scheduler import get_scheduler, LOW
 
 matplotlib.use('Qt5Agg')
 
@@ -170,9 +171,8 @@ class SystemTab(QWidget):
         self.left_file_tree.load_file_system(os.path.expanduser("~"))
         self.application_table.load_applications()
 
-        self.info_thread = SystemInfoThread()
-        self.info_thread.update_signal.connect(self.update_system_info)
-        self.info_thread.start()
+        # Only redraw the charts while the overview is on screen
+        get_scheduler().register("system_info", self.load_system_info, 2000, overview_tab, LOW)
 
         # Connect application search
         self.application_search_input.textChanged.connect(self.application_table.search_applications)
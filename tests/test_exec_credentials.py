@@ -0,0 +1,52 @@
+import unittest
+from unittest import mock
+
+from kubernetes.config.exec_provider import ExecProvider
+from kubernetes.config.kube_config import ConfigNode
+
+import exec_credentials
+from exec_credentials import CachingExecProvider, ExecCredentialCache
+
+EXEC_CONFIG = {'apiVersion': 'client.authentication.k8s.io/v1', 'command': 'get-token',
+               'args': ['--region', 'us-east-1'], 'provideClusterInfo': True}
+
+
+def provider(cluster):
+    exec_provider = CachingExecProvider(ConfigNode('exec', EXEC_CONFIG), None)
+    # Newer clients set this from the context's cluster when provideClusterInfo is on
+    exec_provider.cluster = cluster
+    return exec_provider
+
+
+def fake_run(exec_provider, previous_response=None):
+    return {'token': f"token-for-{exec_provider.cluster['server']}"}
+
+
+class CachingExecProviderTest(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(exec_credentials, 'credential_cache', ExecCredentialCache())
+        self.cache = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(ExecProvider, 'run', fake_run)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_contexts_differing_only_in_cluster_get_their_own_token(self):
+        a = provider({'server': 'https://a.example.com', 'certificate-authority-data': 'YQ=='})
+        b = provider({'server': 'https://b.example.com', 'certificate-authority-data': 'YQ=='})
+
+        self.assertEqual(a.run()['token'], 'token-for-https://a.example.com')
+        self.assertEqual(b.run()['token'], 'token-for-https://b.example.com')
+        self.assertEqual(self.cache.runs, 2)
+
+    def test_same_cluster_shares_one_token(self):
+        cluster = {'server': 'https://a.example.com'}
+        provider(cluster).run()
+        provider(dict(cluster)).run()
+
+        self.assertEqual(self.cache.runs, 1)
+        self.assertEqual(self.cache.hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
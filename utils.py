@@ -1,6 +1,7 @@
 from PyQt5.QtWidgets import QLineEdit, QHBoxLayout
 from PyQt5.QtCore import Qt, QSortFilterProxyModel
 from PyQt5.QtGui import QColor
+from raw_api import call_raw
 
 def setup_search(gui):
     gui.search_input = QLineEdit()
@@ -97,4 +98,32 @@ def parse_k8s_memory(memory_string):
         return float(memory_string)
     except ValueError:
         print(f"Unable to parse memory value: {memory_string}")
-        return 0
\ No newline at end of file
+        return 0
+
+# Page size for chunked LIST calls against the API server
+LIST_PAGE_SIZE = 500
+
+def iter_list_pages(list_func, *args, page_size=LIST_PAGE_SIZE, raw=False, **kwargs):
+    """Yield each page of a kubernetes LIST call, following continue tokens.
+
+    With raw=True pages are decoded straight from JSON into RawObject views
+    instead of the client's generated models.
+    """
+    _continue = None
+    while True:
+        if _continue:
+            kwargs['_continue'] = _continue
+        if raw:
+            page = call_raw(list_func, *args, limit=page_size, **kwargs)
+        else:
+            page = list_func(*args, limit=page_size, **kwargs)
+        yield page
+        _continue = page.metadata._continue
+        if not _continue:
+            break
+
+def list_all_pages(list_func, *args, **kwargs):
+    items = []
+    for page in iter_list_pages(list_func, *args, **kwargs):
+        items.extend(page.items)
+    return items
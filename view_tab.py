@@ -30,19 +30,20 @@ from PyQt5.QtGui import (
 from PyQt5.QtCore import Qt, QSortFilterProxyModel, QTimer, QRegExp, QThread, pyqtSignal, QMetaObject, QUrl, QProcess, pyqtSlot, Q_ARG, QMetaType
 from kubernetes import client, config
 from kubernetes.stream import stream
-from resource_updaters import (
-    update_pods, update_pvcs, update_statefulsets, update_deployments, update_pvs, 
-    update_secrets, update_configmaps, update_jobs, update_cronjobs, update_nodes, 
-    LogStreamerThread, parse_k8s_cpu, parse_k8s_memory
-)
+from resource_updaters import FetchContext, LogStreamerThread, parse_k8s_cpu, parse_k8s_memory
+from helper_view_tab.resource_table_model import ResourceTableModel
+from helper_view_tab.resource_fetch_worker import ResourceFetchWorker
+from helper_view_tab.namespace_list_worker import NamespaceListWorker
+from client_registry import registry as client_registry
+from multi_cluster import AGGREGATED_RESOURCE_TYPES
+from snapshot_cache import load_snapshot, save_snapshot, load_list, save_list, describe_age
+from refresh_scheduler import get_scheduler, HIGH, LOW
 from utils import setup_info_search
 import numpy as np
 import sip
-from ssh_dialog import SSHDialog
 from pod_metrics_worker import PodMetricsWorker
 from helper_view_tab.create_resource_dialog import CreateResourceDialog
 from helper_view_tab.edit_resource_dialog import EditResourceDialog
-from helper_view_tab.ssh_connection import SSHAuthDialog, SSHConnectionThread
 from helper_view_tab.terminal_widget import TerminalWidget
 from helper_view_tab.utils import clean_resource_dict, decode_base64_in_yaml, save_port_forwarding, load_port_forwarding
 
@@ -61,6 +62,8 @@ class ViewTab(QWidget):
         super().__init__(parent)
         self.parent = parent
         self.selected_namespaces = []
+        self.aggregate_contexts = []
+        self.namespace_worker = None
         self.port_forwarding_file = os.path.join(os.path.expanduser("~"), ".kube_debugger_port_forwarding.json")
         self.port_forwarding_dict = load_port_forwarding(self.port_forwarding_file)
         self.edit_dialog_open = False
@@ -75,11 +78,21 @@ class ViewTab(QWidget):
         self.selection_timer = QTimer()
         self.selection_timer.setSingleShot(True)
         self.selection_timer.timeout.connect(self.delayed_update_resource_info)
+        self.cache_refresh_timer = QTimer()
+        self.cache_refresh_timer.setSingleShot(True)
+        self.cache_refresh_timer.setInterval(1000)
+        self.cache_refresh_timer.timeout.connect(self.update_resources)
+        self.informer_cache.synced.connect(self.on_informer_synced)
+        self.informer_cache.delta.connect(self.on_informer_delta)
         
         # Load namespaces only once
         self.load_namespaces()
         self.update_resources()
         self.refresh_events()
+
+        # Paused until an auto-refresh interval is picked
+        get_scheduler().register("resources", self.update_resources, 0, self.resource_table, HIGH, asynchronous=True)
+        get_scheduler().register("events", self.refresh_events, 0, self.events_table, LOW)
         
         # Connect signals after initialization
         self.namespace_combo1.currentIndexChanged.connect(self.on_namespace_changed)
@@ -89,6 +102,26 @@ class ViewTab(QWidget):
     def on_namespace_changed(self):
         self.update_resources()
 
+    def on_informer_synced(self, kind):
+        if kind == self.get_current_resource_type():
+            self.schedule_cache_refresh()
+
+    def on_informer_delta(self, kind, event_type, namespace, name):
+        if kind != self.get_current_resource_type():
+            return
+        if namespace and namespace not in self.get_selected_namespaces():
+            return
+        self.schedule_cache_refresh()
+
+    def schedule_cache_refresh(self):
+        # An aggregated table relists every other selected cluster, which
+        # has no informers, so it follows the refresh interval instead
+        if self.get_aggregate_contexts(self.get_current_resource_type()):
+            return
+        # Coalesce bursts of watch events into a single table refresh
+        if not self.cache_refresh_timer.isActive():
+            self.cache_refresh_timer.start()
+
     def create_labeled_combo(self, label_text, combo_items=None):
         layout = QHBoxLayout()
         layout.setSpacing(50)
@@ -138,6 +171,12 @@ class ViewTab(QWidget):
         self.more_namespaces_button = QPushButton("More namespaces")
         self.more_namespaces_button.clicked.connect(self.show_namespace_dialog)
         first_line_layout.addWidget(self.more_namespaces_button)
+
+        # Aggregate Pods, Deployments and Nodes across several contexts
+        self.clusters_button = QPushButton("Clusters")
+        self.clusters_button.setToolTip("Show " + ", ".join(AGGREGATED_RESOURCE_TYPES) + " from several clusters in one table")
+        self.clusters_button.clicked.connect(self.show_clusters_dialog)
+        first_line_layout.addWidget(self.clusters_button)
         first_line_layout.addStretch(1)
         left_layout.addLayout(first_line_layout)
         # Resource type tabs
@@ -176,9 +215,16 @@ class ViewTab(QWidget):
         left_layout.addWidget(resource_label)
 
         self.resource_table = QTableView()
-        self.table_model = QStandardItemModel()
+        self.table_model = ResourceTableModel()
         self.proxy_model = QSortFilterProxyModel()
         self.proxy_model.setSourceModel(self.table_model)
+        self.table_resource_type = None
+        self.fetch_generation = 0
+        self.fetch_context = None
+        self.fetch_namespaces = None
+        self.fetch_contexts = None
+        self.fetch_workers = []
+        self.fetch_interrupted = False
         self.resource_table.setModel(self.proxy_model)
         self.resource_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         self.resource_table.setSelectionBehavior(QAbstractItemView.SelectRows)
@@ -487,6 +533,53 @@ class ViewTab(QWidget):
         dialog.exec_()
 
 
+    def show_clusters_dialog(self):
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Aggregate Clusters")
+        dialog.setMinimumWidth(300)
+
+        main_layout = QVBoxLayout(dialog)
+        main_layout.addWidget(QLabel("Show " + ", ".join(AGGREGATED_RESOURCE_TYPES) + " from:"))
+
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_content = QWidget()
+        scroll_layout = QVBoxLayout(scroll_content)
+
+        cluster_checkboxes = []
+        for context in self.parent.clusters:
+            checkbox = QCheckBox(context)
+            checkbox.setChecked(context in self.aggregate_contexts)
+            cluster_checkboxes.append(checkbox)
+            scroll_layout.addWidget(checkbox)
+
+        scroll_area.setWidget(scroll_content)
+        scroll_area.setMaximumHeight(300)
+        main_layout.addWidget(scroll_area)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        button_box.accepted.connect(lambda: self.set_aggregate_contexts(cluster_checkboxes, dialog))
+        button_box.rejected.connect(dialog.reject)
+        main_layout.addWidget(button_box)
+
+        dialog.exec_()
+
+    def set_aggregate_contexts(self, cluster_checkboxes, dialog):
+        self.aggregate_contexts = [checkbox.text() for checkbox in cluster_checkboxes if checkbox.isChecked()]
+        # Every aggregated refresh touches all of them, so none should be evicted
+        client_registry.keep_warm(self.aggregate_contexts)
+        self.clusters_button.setText(f"Clusters ({len(self.aggregate_contexts)})" if self.aggregate_contexts else "Clusters")
+        dialog.accept()
+        # Force a fresh table since the column layout changes
+        self.table_resource_type = None
+        self.update_resources()
+
+    def get_aggregate_contexts(self, resource_type):
+        # Selecting only the current cluster is the same as no aggregation
+        if resource_type not in AGGREGATED_RESOURCE_TYPES or self.aggregate_contexts in ([], [self.context_name]):
+            return None
+        return self.aggregate_contexts
+
     def set_selected_namespaces(self, namespace_checkboxes, dialog):
         self.selected_namespaces = [checkbox.text() for checkbox in namespace_checkboxes if checkbox.isChecked()]
         print(f"Selected namespaces: {self.selected_namespaces}")  # Log message
@@ -870,8 +963,8 @@ class ViewTab(QWidget):
             if reply == QMessageBox.No:
                 return
 
-            api_client = client.ApiClient()
-            utils = client.ApiClient().sanitize_for_serialization(resource_dict)
+            api_client = client_registry.api_client()
+            utils = api_client.sanitize_for_serialization(resource_dict)
             
             if kind == "Pod":
                 api_instance = client.CoreV1Api(api_client)
@@ -1085,6 +1178,10 @@ class ViewTab(QWidget):
     def v1(self):
         return self.parent.v1
 
+    @property
+    def context_name(self):
+        return self.parent.current_context_name()
+
     @property
     def apps_v1(self):
         return self.parent.apps_v1
@@ -1097,6 +1194,10 @@ class ViewTab(QWidget):
     def custom_api(self):
         return self.parent.custom_api
 
+    @property
+    def informer_cache(self):
+        return self.parent.informer_cache
+
     def clusters(self):
         return self.parent.clusters
 
@@ -1144,12 +1245,9 @@ class ViewTab(QWidget):
         pass
 
     def set_auto_refresh(self, value):
-        self.refresh_timer.stop()
-        if value != "Off":
-            seconds = int(value.split()[0])
-            self.refresh_timer.start(seconds * 1000)
-            self.refresh_timer.timeout.connect(self.refresh_events) 
-            self.refresh_timer.timeout.connect(self.update_resources) 
+        interval_ms = 0 if value == "Off" else int(value.rstrip("s")) * 1000
+        get_scheduler().set_interval("resources", interval_ms)
+        get_scheduler().set_interval("events", interval_ms)
 
     def filter_info(self, text):
         # Store the current cursor position
@@ -1185,23 +1283,69 @@ class ViewTab(QWidget):
         self.describe_text.setTextCursor(current_cursor)
 
     def load_namespaces(self):
+        # Show the namespaces saved for this context right away and
+        # revalidate them in the background; only a first visit waits on the API
+        context = self.context_name
+        namespaces = load_list(context, "Namespaces")
+        if namespaces:
+            self.set_namespaces(namespaces)
+            if not (self.namespace_worker and self.namespace_worker.isRunning()):
+                self.namespace_worker = NamespaceListWorker(self.v1, context)
+                self.namespace_worker.fetched.connect(self.on_namespaces_fetched)
+                self.namespace_worker.failed.connect(lambda error: print(f"Error loading namespaces: {error}"))
+                self.namespace_worker.start()
+            return namespaces
         try:
             namespaces = [ns.metadata.name for ns in self.v1.list_namespace().items]
-            self.namespace_combo1.clear()
-            self.namespace_combo2.clear()
-            self.namespace_combo1.addItems(namespaces)
-            self.namespace_combo2.addItems(namespaces)
-            if namespaces:
-                self.namespace_combo1.setCurrentIndex(0)
-                if len(namespaces) > 1:
-                    self.namespace_combo2.setCurrentIndex(1)
-                else:
-                    self.namespace_combo2.setCurrentIndex(0)
+            save_list(context, "Namespaces", namespaces)
+            self.set_namespaces(namespaces)
             return namespaces
         except Exception as e:
             print(f"Error loading namespaces: {str(e)}")
             return None
 
+    def set_namespaces(self, namespaces):
+        self.namespace_combo1.clear()
+        self.namespace_combo2.clear()
+        self.namespace_combo1.addItems(namespaces)
+        self.namespace_combo2.addItems(namespaces)
+        if namespaces:
+            self.namespace_combo1.setCurrentIndex(0)
+            if len(namespaces) > 1:
+                self.namespace_combo2.setCurrentIndex(1)
+            else:
+                self.namespace_combo2.setCurrentIndex(0)
+
+    def on_namespaces_fetched(self, context, namespaces):
+        if context != self.context_name:
+            return
+        save_list(context, "Namespaces", namespaces)
+        current = [self.namespace_combo1.currentText(), self.namespace_combo2.currentText()]
+        if namespaces == [self.namespace_combo1.itemText(i) for i in range(self.namespace_combo1.count())]:
+            return
+        for combo, text in zip([self.namespace_combo1, self.namespace_combo2], current):
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItems(namespaces)
+            if text in namespaces:
+                combo.setCurrentText(text)
+            combo.blockSignals(False)
+        if [self.namespace_combo1.currentText(), self.namespace_combo2.currentText()] != current:
+            self.update_resources()
+
+    def on_cluster_changed(self):
+        # Drop the previous cluster's table; update_resources() will show this
+        # cluster's snapshot, if any, while the real LIST runs
+        self.table_model.clear()
+        self.table_resource_type = None
+        self.namespace_combo1.blockSignals(True)
+        self.namespace_combo2.blockSignals(True)
+        self.load_namespaces()
+        self.namespace_combo1.blockSignals(False)
+        self.namespace_combo2.blockSignals(False)
+        self.update_resources()
+        self.refresh_events()
+
     def delete_resource(self, resource_type, resource_name, namespace):
         try:
             if resource_type == "Pods":
@@ -1294,8 +1438,8 @@ class ViewTab(QWidget):
     def edit_resource(self, row):
         resource_type = self.get_current_resource_type()
         source_row = self.proxy_model.mapToSource(self.proxy_model.index(row, 0)).row()
-        namespace = self.table_model.item(source_row, 0).text()
-        resource_name = self.table_model.item(source_row, 1).text()
+        namespace = self.table_model.data(self.table_model.index(source_row, 0))
+        resource_name = self.table_model.data(self.table_model.index(source_row, 1))
 
         try:
             if resource_type == "Deployments":
@@ -1508,6 +1652,15 @@ class ViewTab(QWidget):
         row = selected_indexes[0].row()
         resource_type = self.get_current_resource_type()
 
+        if self.table_model.headers and self.table_model.headers[-1] == "Cluster":
+            cluster = self.proxy_model.data(self.proxy_model.index(row, len(self.table_model.headers) - 1))
+            if cluster != self.context_name:
+                # Details, logs and actions all go through the current cluster's clients
+                self.current_resource_name = None
+                self.current_namespace = None
+                self.current_resource_label.setText(f"Switch to cluster {cluster} to inspect this {resource_type[:-1]}")
+                return
+
         if resource_type in ["Nodes", "PV"]:
             self.current_resource_name = self.proxy_model.data(self.proxy_model.index(row, 0))
             self.current_namespace = None
@@ -1544,57 +1697,117 @@ class ViewTab(QWidget):
             self.show_volumes()
 
     def update_resources(self):
-        self.table_model.clear()
-        self.current_resource_name = None
-        self.current_namespace = None
-        self.table_model.setHorizontalHeaderLabels([])
-        self.update_status("Refreshing resources...")
-        
         resource_type = self.get_current_resource_type()
         namespaces = self.get_selected_namespaces()
+        if resource_type != self.table_resource_type:
+            # Only a different resource kind starts from an empty table;
+            # plain refreshes are diffed into the existing rows.
+            self.table_model.clear()
+            self.table_resource_type = resource_type
+            self.current_resource_name = None
+            self.current_namespace = None
+            if not self.get_aggregate_contexts(resource_type):
+                self.show_snapshot(resource_type, namespaces)
+        if not self.table_model.stale:
+            self.update_status("Refreshing resources...")
+        
         print(f"Updating resources for type: {resource_type}")
         print(f"Selected namespaces for resources: {namespaces}")
         
-        # Use QTimer to defer the heavy operation
-        QTimer.singleShot(0, lambda: self._update_resources(resource_type, namespaces))
+        self.cancel_resource_fetch()
+        self.fetch_context = FetchContext()
+        self.fetch_contexts = self.get_aggregate_contexts(resource_type)
+        worker = ResourceFetchWorker(self, self.fetch_generation, resource_type, namespaces, self.fetch_context,
+                                     self.fetch_contexts)
+        self.fetch_namespaces = namespaces
+        worker.fetched.connect(self.on_resources_fetched)
+        worker.page_fetched.connect(self.on_resources_page_fetched)
+        worker.failed.connect(self.on_resources_fetch_failed)
+        worker.finished.connect(lambda: self.fetch_workers.remove(worker))
+        self.fetch_workers.append(worker)
+        worker.start()
 
 
     def get_current_resource_type(self):
         resource_types = ["Pods", "Deployments", "StatefulSets", "Jobs", "CronJobs", "PVC", "PV", "Secrets", "ConfigMaps", "Services", "Nodes"]
         return resource_types[self.resource_tabs.currentIndex()]
 
-    def _update_resources(self, resource_type, namespaces):
-        QApplication.processEvents()  # This will update the UI immediately
+    def show_snapshot(self, resource_type, namespaces):
+        snapshot = load_snapshot(self.context_name, resource_type, namespaces)
+        if not snapshot or not snapshot.rows:
+            return
+        self.table_model.set_headers(snapshot.headers)
+        self.table_model.update_rows(snapshot.rows)
+        self.table_model.set_stale(True)
+        self.update_status(f"Showing {resource_type} cached {describe_age(snapshot.saved_at)}, refreshing...")
+        self.resource_table.resizeColumnsToContents()
 
-        self.table_model.clear()
-        try:
-            if resource_type == "Pods":
-                update_pods(self, namespaces, self.table_model)
-            elif resource_type == "Deployments":
-                update_deployments(self, namespaces, self.table_model)
-            elif resource_type == "StatefulSets":
-                update_statefulsets(self, namespaces, self.table_model)
-            elif resource_type == "Jobs":
-                update_jobs(self, namespaces, self.table_model)
-            elif resource_type == "CronJobs":
-                update_cronjobs(self, namespaces, self.table_model)
-            elif resource_type == "PVC":
-                update_pvcs(self, namespaces, self.table_model)
-            elif resource_type == "PV":
-                update_pvs(self, self.table_model)
-            elif resource_type == "Secrets":
-                update_secrets(self, namespaces, self.table_model)
-            elif resource_type == "ConfigMaps":
-                update_configmaps(self, namespaces, self.table_model)
-            elif resource_type == "Services":
-                self.update_services(namespaces, self.table_model)
-            elif resource_type == "Nodes":
-                update_nodes(self, self.table_model)
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        # Switching to another tab (not minimising) drops the fetch along
+        # with its queued API requests; it is redone when the tab comes back
+        if not event.spontaneous() and self.fetch_context:
+            self.fetch_context.cancel()
+            self.fetch_context = None
+            self.fetch_interrupted = True
+            get_scheduler().finished("resources")
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.fetch_interrupted:
+            self.fetch_interrupted = False
+            self.update_resources()
+
+    def cancel_resource_fetch(self):
+        # Supersede whatever is still in flight; its results will be dropped
+        if self.fetch_context:
+            self.fetch_context.cancel()
+        self.fetch_generation += 1
+
+    def stop_resource_fetches(self):
+        if self.fetch_context:
+            self.fetch_context.cancel()
+        for worker in list(self.fetch_workers):
+            worker.wait()
+        if self.namespace_worker:
+            self.namespace_worker.wait()
+
+    def on_resources_page_fetched(self, generation, resource_type, headers, rows, loaded):
+        if generation != self.fetch_generation or resource_type != self.table_resource_type:
+            return
+        self.table_model.set_headers(headers)
+        self.table_model.merge_rows(rows)
+        self.update_status(f"Loading {resource_type}... {loaded} loaded")
+
+    def on_resources_fetched(self, generation, resource_type, headers, rows):
+        if generation != self.fetch_generation or resource_type != self.table_resource_type:
+            return
+        get_scheduler().finished("resources")
+        latency_summary = self.fetch_context.latency_summary() if self.fetch_context else ""
+        warnings = self.fetch_context.warnings if self.fetch_context else []
+        self.fetch_context = None
+        self.table_model.set_headers(headers)
+        self.table_model.update_rows(rows)
+        self.table_model.set_stale(False)
+        if not self.fetch_contexts:
+            save_snapshot(self.context_name, resource_type, headers, rows, self.fetch_namespaces)
+        if resource_type == "Pods":
+            self.resource_table.setColumnWidth(0, 100)  # Namespace
+            self.resource_table.setColumnWidth(1, 250)  # Pod Name
+            self.resource_table.setColumnWidth(2, 40)   # Ready
+            self.resource_table.setColumnWidth(3, 40)   # Status
+            self.resource_table.setColumnWidth(4, 40)   # Restarts
+            self.resource_table.setColumnWidth(5, 50)   # Age
+            self.resource_table.setColumnWidth(6, 250)   # Node
+        elif resource_type == "Services":
+            self.update_port_forwarding_buttons()
+        if warnings:
+            self.update_status(f"Resources refreshed, skipped {len(warnings)} cluster(s): {'; '.join(warnings)}")
+            print(f"Skipped clusters: {warnings}")
+        elif latency_summary:
+            self.update_status(f"Resources refreshed successfully. Slowest LISTs: {latency_summary}")
+        else:
             self.update_status("Resources refreshed successfully.")
-        except Exception as e:
-            self.update_status("Error fetching resources")
-            print(f"Error fetching resources: {str(e)}")
-            self.table_model.clear()
 
         # Update the view after populating the model
         self.resource_table.resizeColumnsToContents()
@@ -1602,6 +1815,19 @@ class ViewTab(QWidget):
         self.resource_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         self.resource_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
 
+    def on_resources_fetch_failed(self, generation, error):
+        if generation != self.fetch_generation:
+            return
+        get_scheduler().finished("resources")
+        self.fetch_context = None
+        print(f"Error fetching resources: {error}")
+        if self.table_model.stale:
+            # Keep showing the cached rows rather than an empty table
+            self.update_status("Error fetching resources, showing cached data")
+            return
+        self.update_status("Error fetching resources")
+        self.table_model.clear()
+
     def get_port_forwarding_status(self, namespace, service_name):
         key = f"{namespace}/{service_name}"
         if key in self.port_forwarding_dict:
@@ -1609,38 +1835,19 @@ class ViewTab(QWidget):
             return f"localhost:{port}"
         return "Not forwarded"
 
-    def update_services(self, namespaces, model):
-        services = []
-        for ns in namespaces:
-            services.extend(self.v1.list_namespaced_service(ns).items)
-
-        model.setHorizontalHeaderLabels(["Namespace", "Name", "Cluster IP", "External IP", "Ports", "Age", "Port Forwarding", "Actions"])
-        
-        for i, service in enumerate(services):
-            model.setItem(i, 0, QStandardItem(service.metadata.namespace))
-            model.setItem(i, 1, QStandardItem(service.metadata.name))
-            model.setItem(i, 2, QStandardItem(service.spec.cluster_ip))
-            external_ips = service.status.load_balancer.ingress[0].ip if service.status.load_balancer.ingress else "None"
-            model.setItem(i, 3, QStandardItem(external_ips))
-            ports = ", ".join([f"{port.port}/{port.protocol}" for port in service.spec.ports])
-            model.setItem(i, 4, QStandardItem(ports))
-            model.setItem(i, 5, QStandardItem(str(service.metadata.creation_timestamp)))
-            
-            # Add Port Forwarding status
-            key = f"{service.metadata.namespace}/{service.metadata.name}"
-            port_forwarding = self.get_port_forwarding_status(service.metadata.namespace, service.metadata.name)
-            model.setItem(i, 6, QStandardItem(port_forwarding))
-
-            # Add Stop Port Forwarding button
+    def update_port_forwarding_buttons(self):
+        model = self.table_model
+        # Add Stop Port Forwarding button
+        for row in range(model.rowCount()):
+            namespace, name = model.key_for_row(row)
+            key = f"{namespace}/{name}"
+            index = self.proxy_model.mapFromSource(model.index(row, 7))
             if key in self.port_forwarding_dict:
                 stop_button = QPushButton("Stop Port Forwarding")
-                stop_button.clicked.connect(lambda _, ns=service.metadata.namespace, name=service.metadata.name: self.stop_port_forwarding(ns, name))
-                model.setItem(i, 7, QStandardItem(""))
-                self.resource_table.setIndexWidget(model.index(i, 7), stop_button)
-            else:
-                model.setItem(i, 7, QStandardItem(""))
-
-        self.resource_table.resizeColumnsToContents()
+                stop_button.clicked.connect(lambda _, ns=namespace, name=name: self.stop_port_forwarding(ns, name))
+                self.resource_table.setIndexWidget(index, stop_button)
+            elif self.resource_table.indexWidget(index):
+                self.resource_table.setIndexWidget(index, None)
 
     def stop_all_port_forwarding(self):
         for key in list(self.port_forwarding_dict.keys()):
@@ -2095,8 +2302,8 @@ class ViewTab(QWidget):
     def resource_action(self, action, row):
         resource_type = self.get_current_resource_type()
         source_row = self.proxy_model.mapToSource(self.proxy_model.index(row, 0)).row()
-        namespace = self.table_model.item(source_row, 0).text()
-        resource_name = self.table_model.item(source_row, 1).text()
+        namespace = self.table_model.data(self.table_model.index(source_row, 0))
+        resource_name = self.table_model.data(self.table_model.index(source_row, 1))
 
         # Confirmation dialog
         confirm_msg = f"Are you sure you want to {action.lower()} the {resource_type} '{resource_name}'"
@@ -2145,8 +2352,8 @@ class ViewTab(QWidget):
             # If called from the table action button
             resource_type = self.get_current_resource_type()
             source_row = self.proxy_model.mapToSource(self.proxy_model.index(row, 0)).row()
-            namespace = self.table_model.item(source_row, 0).text()
-            pod_name = self.table_model.item(source_row, 1).text()
+            namespace = self.table_model.data(self.table_model.index(source_row, 0))
+            pod_name = self.table_model.data(self.table_model.index(source_row, 1))
         else:
             # If called from the info display
             pod_name = self.current_resource_name
@@ -2243,8 +2450,8 @@ class ViewTab(QWidget):
             
             if reply == QMessageBox.No:
                 return
-            api_client = client.ApiClient()
-            utils = client.ApiClient().sanitize_for_serialization(resource)
+            api_client = client_registry.api_client()
+            utils = api_client.sanitize_for_serialization(resource)
             
             kind = resource["kind"]
             
@@ -2431,6 +2638,9 @@ class ViewTab(QWidget):
 
     def ssh_to_node(self, node_name):
         try:
+            # paramiko is only needed once someone actually opens an SSH session
+            from helper_view_tab.ssh_connection import SSHAuthDialog, SSHConnectionThread
+
             node = self.v1.read_node(node_name)
             node_ip = next((addr.address for addr in node.status.addresses if addr.type == 'InternalIP'), None)
 
@@ -0,0 +1,183 @@
+import random
+import threading
+import time
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+import api_tracing
+from api_scheduler import BACKGROUND, RequestCancelled, request_scope
+from utils import iter_list_pages
+
+WATCH_TIMEOUT_SECONDS = 300
+# Reconnect delays after errors double from the first to the last value and
+# are jittered so streams that dropped together don't return together
+BACKOFF_INITIAL_SECONDS = 1
+BACKOFF_MAX_SECONDS = 60
+# Spread relists after a 410, which usually hits every stream at once when
+# the apiserver compacts or restarts
+RELIST_JITTER_SECONDS = 2
+# A watch that ends sooner than this without delivering anything is treated
+# like a failed one, so a server dropping streams can't make us spin
+MIN_HEALTHY_WATCH_SECONDS = 5
+
+
+def jittered(seconds):
+    return seconds / 2 + random.uniform(0, seconds / 2)
+
+
+class ResumableWatch:
+    """One LIST+WATCH stream that survives disconnects.
+
+    The watch asks for bookmarks, so the latest resourceVersion stays
+    current even when nothing changes, and after a timeout or network error
+    the stream resumes from it. A paginated relist only happens before the
+    first watch and when the server answers 410 Gone. on_relist(items) gets
+    the full list, on_event(type, obj) each change.
+    """
+
+    def __init__(self, name, list_func, on_relist, on_event, timeout_seconds=WATCH_TIMEOUT_SECONDS):
+        self.name = name
+        self.list_func = list_func
+        self.on_relist = on_relist
+        self.on_event = on_event
+        self.timeout_seconds = timeout_seconds
+        self.resource_version = None
+        self.stop_event = threading.Event()
+        self.w = None
+        self.relists = 0
+        self.expired = 0
+        self.resumes = 0
+        self.reconnects = 0
+        self.bookmarks = 0
+        self.events = 0
+        self.last_error = None
+
+    @property
+    def is_running(self):
+        return not self.stop_event.is_set()
+
+    def check_running(self):
+        if self.stop_event.is_set():
+            raise RequestCancelled()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.w:
+            self.w.stop()
+
+    def run(self):
+        backoff = BACKOFF_INITIAL_SECONDS
+        while self.is_running:
+            try:
+                if self.resource_version is None:
+                    self.relist()
+                else:
+                    self.resumes += 1
+                started = time.monotonic()
+                if self.watch() or time.monotonic() - started >= MIN_HEALTHY_WATCH_SECONDS:
+                    backoff = BACKOFF_INITIAL_SECONDS
+                    continue
+                self.last_error = "watch closed without events"
+            except RequestCancelled:
+                break
+            except ApiException as e:
+                if e.status == 410:
+                    print(f"Watch for {self.name} expired, relisting")
+                    self.expired += 1
+                    self.resource_version = None
+                    self.stop_event.wait(random.uniform(0, RELIST_JITTER_SECONDS))
+                    continue
+                self.last_error = f"{e.status} {e.reason}"
+            except Exception as e:
+                self.last_error = str(e)
+            if not self.is_running:
+                break
+            print(f"Error watching {self.name}: {self.last_error}")
+            self.reconnects += 1
+            self.stop_event.wait(jittered(backoff))
+            backoff = min(backoff * 2, BACKOFF_MAX_SECONDS)
+
+    def relist(self):
+        items = []
+        resource_version = None
+        for page in iter_list_pages(self.list_func):
+            self.check_running()
+            items.extend(page.items)
+            resource_version = page.metadata.resource_version
+        self.relists += 1
+        self.resource_version = resource_version
+        if self.is_running:
+            self.on_relist(items)
+
+    def watch(self):
+        """Follow the stream until it ends; returns whether it delivered anything."""
+        delivered = False
+        self.w = watch.Watch()
+        for event in self.w.stream(self.list_func,
+                                   resource_version=self.resource_version,
+                                   allow_watch_bookmarks=True,
+                                   timeout_seconds=self.timeout_seconds):
+            if not self.is_running:
+                break
+            delivered = True
+            self.resource_version = event['raw_object']['metadata']['resourceVersion']
+            if event['type'] == 'BOOKMARK':
+                self.bookmarks += 1
+                continue
+            self.events += 1
+            self.on_event(event['type'], event['object'])
+        return delivered
+
+    def stats(self):
+        return {
+            'resource_version': self.resource_version,
+            'relists': self.relists,
+            'expired': self.expired,
+            'resumes': self.resumes,
+            'reconnects': self.reconnects,
+            'bookmarks': self.bookmarks,
+            'events': self.events,
+            'last_error': self.last_error,
+        }
+
+
+class WatchManager:
+    """Runs ResumableWatch streams on background threads, keyed by name."""
+
+    def __init__(self):
+        self.streams = {}
+        self.lock = threading.Lock()
+
+    def start(self, name, list_func, on_relist, on_event):
+        stream = ResumableWatch(name, list_func, on_relist, on_event)
+        with self.lock:
+            previous = self.streams.pop(name, None)
+            self.streams[name] = stream
+        if previous:
+            previous.stop()
+        thread = threading.Thread(target=self.run, args=(stream,), name=f"watch-{name}", daemon=True)
+        thread.start()
+        return stream
+
+    def run(self, stream):
+        # Watches yield API budget to anything a user is looking at
+        with request_scope(BACKGROUND, stream.check_running), api_tracing.origin("Informers", f"watch {stream.name}"):
+            stream.run()
+
+    def stop(self, name):
+        with self.lock:
+            stream = self.streams.pop(name, None)
+        if stream:
+            stream.stop()
+
+    def stop_all(self):
+        with self.lock:
+            streams = list(self.streams.values())
+            self.streams = {}
+        for stream in streams:
+            stream.stop()
+
+    def stats(self):
+        with self.lock:
+            streams = dict(self.streams)
+        return {name: stream.stats() for name, stream in streams.items()}